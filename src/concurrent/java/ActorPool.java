@@ -200,6 +200,14 @@ public class ActorPool
   public void maxTimeBeforeYield$init(Func f, Duration x) { maxTimeBeforeYield = x; }
   public Duration maxTimeBeforeYield = Duration.oneSec;
 
+  public boolean aio() { return aio; }
+  public void aio$init(Func f, boolean x) { aio = x; }
+  public boolean aio = false;
+
+  public long processes() { return processes; }
+  public void processes$init(Func f, long x) { processes = x; }
+  public long processes = 0;
+
   private ThreadPool threadPool;
   private Scheduler scheduler;
   volatile boolean killed;
@@ -5,6 +5,7 @@
 
 import threading
 import time
+import types
 from fan.sys.Obj import Obj
 from fan.sys.Map import Map
 from fan.sys.Err import Err, ArgErr, NotImmutableErr
@@ -51,6 +52,21 @@ class Actor(Obj):
         self._receive_ticks = 0
         self._processing_count = 0  # Number of messages currently being processed
 
+        # Worker process placement on a processes pool
+        self._placement = None
+        self._placed_on = None
+        if pool.processes() > 0:
+            # Only a picklable receive func can be shipped to a worker;
+            # receive overrides and Fantom closures cannot
+            if receive is None:
+                raise ArgErr.make("Actor on a processes pool must supply receive func, not override receive")
+            import pickle
+            try:
+                pickle.dumps(receive)
+            except Exception as e:
+                raise ArgErr.make(f"Actor on a processes pool needs a picklable receive func: {e}")
+            self._placement = pool._place()
+
     @staticmethod
     def make(pool, receive=None):
         """Factory method"""
@@ -354,21 +370,134 @@ class Actor(Obj):
                 future.cancel()
                 return
             self._receive_count += 1
+            if self._placement is not None:
+                self._pool._send_remote(self, future)
+                return
             result = self.receive(future.msg)
             future.complete(result)
-        except Err as e:
-            import traceback
-            import sys as sys_mod
+        except Exception as e:
+            self._dispatch_err(future, e)
+
+    def _dispatch_err(self, future, e):
+        """Report a receive failure and complete its future with it"""
+        import traceback
+        import sys as sys_mod
+        if isinstance(e, Err):
             print(f"[err] Actor._dispatch Err: {e}", file=sys_mod.stderr)
             traceback.print_exc()
             future.complete_err(e)
-        except Exception as e:
-            import traceback
-            import sys as sys_mod
+        else:
             print(f"[err] Actor._dispatch Exception: {e}", file=sys_mod.stderr)
             traceback.print_exc()
             future.complete_err(Err.make(str(e)))
 
+    # asyncio pool support
+
+    async def _work_aio(self):
+        """
+        Called by an aio pool to process messages as a task on its event
+        loop. Each message is fully processed, including awaiting an
+        awaitable result, before the next one is taken off the queue.
+        """
+        import asyncio
+        self._enter_aio()
+
+        start_ticks = time.time_ns()
+        slice_ticks = start_ticks
+        max_ticks = self._pool.max_time_before_yield().ticks() if self._pool.max_time_before_yield() else 1_000_000_000
+
+        try:
+            while True:
+                future = None
+                with self._lock:
+                    future = self._queue.get()
+                    if future is not None:
+                        self._processing_count += 1
+                if future is None:
+                    break
+
+                self._cur_msg = future.msg
+                try:
+                    await self._dispatch_aio(future)
+                finally:
+                    with self._lock:
+                        self._processing_count -= 1
+                self._cur_msg = Actor._idle_msg
+
+                # Let the other actors on the loop run
+                cur_ticks = time.time_ns()
+                if cur_ticks - slice_ticks >= max_ticks:
+                    await asyncio.sleep(0)
+                    self._enter_aio()
+                    slice_ticks = time.time_ns()
+        finally:
+            self._receive_ticks += time.time_ns() - start_ticks
+            from fan.sys.Locale import Locale
+            self._context.locale = Locale.cur()
+
+            # Either clear submitted flag or resubmit to pool
+            with self._lock:
+                if self._queue.size == 0 or self._pool.killed:
+                    self._submitted = False
+                else:
+                    self._submitted = True
+                    self._pool.submit(self)
+
+    async def _dispatch_aio(self, future):
+        """Process a single message, awaiting an awaitable result"""
+        import asyncio
+        import inspect
+        try:
+            if future.is_cancelled():
+                return
+            if self._pool.killed:
+                future.cancel()
+                return
+            self._receive_count += 1
+            result = self.receive(future.msg)
+            # Futures are plain results here, as with a thread pool
+            if not isinstance(result, Obj) and inspect.isawaitable(result):
+                result = await self._bind_aio(result.__await__())
+            future.complete(result)
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            self._dispatch_err(future, e)
+
+    @types.coroutine
+    def _bind_aio(self, gen):
+        """
+        Drive an awaitable's generator with this actor's locals and locale
+        installed on the loop thread for each step it runs.
+        """
+        from fan.sys.Locale import Locale
+        value = None
+        error = None
+        while True:
+            self._enter_aio()
+            try:
+                if error is not None:
+                    yielded = gen.throw(error)
+                else:
+                    yielded = gen.send(value)
+            except StopIteration as e:
+                return e.value
+            finally:
+                self._context.locale = Locale.cur()
+            try:
+                value = yield yielded
+                error = None
+            except BaseException as e:
+                value = None
+                error = e
+
+    def _enter_aio(self):
+        """Install this actor's locals and locale on the loop thread"""
+        Actor._thread_locals.actor_locals = self._context.locals
+        from fan.sys.Locale import Locale
+        Locale.set_cur(self._context.locale)
+
     def _kill(self):
         """Cancel all pending messages"""
         queue = None
@@ -4,10 +4,16 @@
 #
 
 import threading
+from collections import deque
 from fan.sys.Obj import Obj
 from fan.sys.Err import TimeoutErr, CancelledErr, InterruptedErr, NotCompleteErr, Err
 from fan.concurrent.FutureStatus import FutureStatus
 
+# Per-thread queue of pending then() link settlements; set while a thread
+# is settling links so a long chain is walked iteratively instead of
+# recursing once per link. User callbacks never run with links pending.
+_dispatch = threading.local()
+
 
 class ActorFuture(Obj):
     """
@@ -30,7 +36,8 @@ class ActorFuture(Obj):
         self._result = None         # Result or exception of processing
         self._lock = threading.Lock()
         self._condition = threading.Condition(self._lock)
-        self._when_done = []        # List of (actor, future) tuples to notify
+        self._when_done = []        # Callbacks to run with this future on completion
+        self._timer = None          # (Scheduler, handle) while waiting on send_later
 
     @staticmethod
     def make():
@@ -186,6 +193,12 @@ class ActorFuture(Obj):
             self._condition.notify_all()
             when_done = self._when_done
             self._when_done = []
+            timer = self._timer
+            self._timer = None
+
+        # Drop a pending send_later timer
+        if timer is not None:
+            timer[0].cancel(timer[1])
 
         # Send when-done notifications outside of lock
         self._send_when_done(when_done)
@@ -212,6 +225,7 @@ class ActorFuture(Obj):
             self._condition.notify_all()
             when_done = self._when_done
             self._when_done = []
+            self._timer = None
 
         self._send_when_done(when_done)
         return self
@@ -233,40 +247,152 @@ class ActorFuture(Obj):
             self._condition.notify_all()
             when_done = self._when_done
             self._when_done = []
+            self._timer = None
 
         self._send_when_done(when_done)
         return self
 
-    def then(self, onOk, onErr=None):
+    def then(self, onOk, onErr=None, pool=None):
         """
-        Register a callback function when this future completes.
-        In Python this is a blocking operation (like Java VM).
+        Register a callback function when this future completes and return
+        a new future for the callback's result. If the callback returns a
+        future, the new future completes with that future's outcome.
+
+        This returns immediately instead of blocking the caller until this
+        future completes. The callback runs on the thread that completes
+        this future (inside its complete call), or on the given ActorPool,
+        or right away if this future is already done. A callback may block
+        on other futures, including ones it completes itself.
         """
-        self.wait_for(None)
-        chain = None
-        try:
-            state = self._state
-            if state == ActorFuture.DONE_OK:
-                chain = onOk(self._result)
-            elif state == ActorFuture.DONE_ERR:
-                if onErr is not None:
-                    chain = onErr(self._result)
-            elif state == ActorFuture.DONE_CANCEL:
-                if onErr is not None:
-                    chain = onErr(CancelledErr.make("Future cancelled"))
-            else:
-                raise NotCompleteErr.make("Future is pending")
+        result = ActorFuture.make()
 
-            result_future = ActorFuture.make()
-            result_future.complete(chain)
-            return result_future
-        except Exception as e:
-            result_future = ActorFuture.make()
-            if isinstance(e, Err):
-                result_future.complete_err(e)
-            else:
-                result_future.complete_err(Err.make(str(e)))
-            return result_future
+        def run(_):
+            try:
+                state = self._state
+                if state == ActorFuture.DONE_OK:
+                    chain = _call_user(onOk, self._result)
+                elif state == ActorFuture.DONE_ERR:
+                    chain = _call_user(onErr, self._result) if onErr is not None else None
+                else:
+                    chain = _call_user(onErr, CancelledErr.make("Future cancelled")) if onErr is not None else None
+            except Exception as e:
+                result.complete_err(e if isinstance(e, Err) else Err.make(str(e)))
+                return
+            ActorFuture._resolve(result, chain)
+
+        if pool is None:
+            self._on_done(run)
+        else:
+            def dispatch(f):
+                try:
+                    pool._execute(lambda: run(f))
+                except Exception as e:
+                    result.complete_err(e if isinstance(e, Err) else Err.make(str(e)))
+            self._on_done(dispatch)
+        return result
+
+    @staticmethod
+    def _resolve(result, chain):
+        """Complete result with chain, following chain if it is a future."""
+        if not isinstance(chain, ActorFuture) and hasattr(chain, 'wraps'):
+            wrapped = chain.wraps()
+            if isinstance(wrapped, ActorFuture):
+                chain = wrapped
+        if not isinstance(chain, ActorFuture):
+            def settle():
+                try:
+                    result.complete(chain)
+                except Exception as e:
+                    result.complete_err(e if isinstance(e, Err) else Err.make(str(e)))
+            _trampoline(settle)
+            return
+
+        def follow(f):
+            def settle():
+                state = f._state
+                if state == ActorFuture.DONE_OK:
+                    result.complete(f._result)
+                elif state == ActorFuture.DONE_ERR:
+                    result.complete_err(f._result)
+                else:
+                    result.cancel()
+            _trampoline(settle)
+        chain._on_done(follow)
+
+    # asyncio interop
+
+    def __await__(self):
+        """
+        Await this future from a coroutine without blocking a thread: the
+        completion is handed to the running event loop with
+        call_soon_threadsafe. Evaluates to get().
+        """
+        if (self._state & ActorFuture.DONE) == 0:
+            import asyncio
+            loop = asyncio.get_running_loop()
+            waiter = loop.create_future()
+
+            def wake(f):
+                try:
+                    loop.call_soon_threadsafe(_wake, waiter)
+                except RuntimeError:
+                    pass    # loop already closed
+            self._on_done(wake)
+            yield from waiter
+        return self.get()
+
+    @staticmethod
+    def from_aio(aw, loop=None):
+        """
+        Wrap an asyncio future or coroutine as an ActorFuture. Coroutines
+        are scheduled on loop, or on the running loop if loop is None.
+        Cancelling the returned future cancels the asyncio task.
+        """
+        import asyncio
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if loop is None:
+            loop = running
+        if asyncio.isfuture(aw):
+            loop = aw.get_loop()
+        elif loop is None:
+            raise Err.make("No event loop to run coroutine")
+
+        result = ActorFuture.make()
+
+        def done(f):
+            if f.cancelled():
+                result.cancel()
+                return
+            e = f.exception()
+            try:
+                if e is not None:
+                    result.complete_err(Err.wrap(e))
+                else:
+                    result.complete(f.result())
+            except Exception as e:
+                result.complete_err(Err.wrap(e))
+
+        if loop is running:
+            task = asyncio.ensure_future(aw, loop=loop)
+            task.add_done_callback(done)
+        elif asyncio.isfuture(aw):
+            task = aw
+            loop.call_soon_threadsafe(task.add_done_callback, done)
+        else:
+            task = asyncio.run_coroutine_threadsafe(aw, loop)
+            task.add_done_callback(done)
+
+        def cancelled(f):
+            if f._state == ActorFuture.DONE_CANCEL and not task.done():
+                if isinstance(task, asyncio.Future):
+                    loop.call_soon_threadsafe(task.cancel)
+                else:
+                    task.cancel()
+        result._on_done(cancelled)
+        return result
 
     def promise(self):
         """Get JavaScript Promise object - not available in Python"""
@@ -289,19 +415,22 @@ class ActorFuture(Obj):
         Register actor/future to be notified when this future completes.
         Used by Actor.send_when_complete().
         """
-        immediate = False
-        with self._condition:
-            if self.is_done():
-                immediate = True
-            else:
-                self._when_done.append((actor, future))
+        self._on_done(lambda f: actor._enqueue_when_done(future))
 
-        if immediate:
-            try:
-                actor._enqueue_when_done(future)
-            except Exception as e:
-                import traceback
-                traceback.print_exc()
+    def _on_done(self, callback):
+        """
+        Run callback(self) when this future completes, or right away on
+        this thread if it already has.
+        """
+        with self._condition:
+            if (self._state & ActorFuture.DONE) == 0:
+                self._when_done.append(callback)
+                return
+        try:
+            callback(self)
+        except Exception as e:
+            import traceback
+            traceback.print_exc()
 
     def _register_when_done(self, actor, future):
         """Alias for send_when_done for backwards compatibility"""
@@ -309,11 +438,9 @@ class ActorFuture(Obj):
 
     def _send_when_done(self, when_done_list):
         """Send notifications to all registered when-done handlers"""
-        if when_done_list is None:
-            return
-        for actor, future in when_done_list:
+        for callback in when_done_list:
             try:
-                actor._enqueue_when_done(future)
+                callback(self)
             except Exception as e:
                 import traceback
                 traceback.print_exc()
@@ -343,6 +470,55 @@ class ActorFuture(Obj):
                 f.wait_for(Duration.make_millis(int(left)))
 
 
+def _trampoline(settle):
+    """
+    Run a then() link settlement, or queue it if this thread is already
+    settling links further down the stack.
+    """
+    queue = getattr(_dispatch, 'queue', None)
+    if queue is not None:
+        queue.append(settle)
+        return
+    queue = _dispatch.queue = deque([settle])
+    try:
+        _drain(queue)
+    finally:
+        _dispatch.queue = None
+
+
+def _drain(queue):
+    """Settle queued links until none are left."""
+    while queue:
+        settle = queue.popleft()
+        try:
+            settle()
+        except Exception as e:
+            import traceback
+            traceback.print_exc()
+
+
+def _call_user(fn, arg):
+    """
+    Call a then() callback. Queued links are settled first and the queue
+    is hidden while fn runs, so fn never waits on a deferred settlement.
+    """
+    queue = getattr(_dispatch, 'queue', None)
+    if queue is None:
+        return fn(arg)
+    _drain(queue)
+    _dispatch.queue = None
+    try:
+        return fn(arg)
+    finally:
+        _dispatch.queue = queue
+
+
+def _wake(waiter):
+    """Resolve an __await__ waiter on its event loop."""
+    if not waiter.done():
+        waiter.set_result(None)
+
+
 # Type metadata registration for reflection
 from fan.sys.Type import Type
 from fan.sys.Param import Param
@@ -30,6 +30,8 @@ class ActorPool(Obj):
         self._max_threads = 100
         self._max_queue = 100_000_000
         self._max_time_before_yield = None  # Duration - 1sec default
+        self._aio = False                   # Run actors as asyncio tasks
+        self._processes = 0                 # Worker processes for receive, 0 for none
 
         # Apply it-block configuration if provided
         if it_block is not None:
@@ -44,15 +46,41 @@ class ActorPool(Obj):
         # Max queue cannot be >= 0xffff_ffff (32-bit unsigned max) to match Java behavior
         if self._max_queue >= 0xffffffff:
             raise ArgErr.make(f"ActorPool.max_queue must be < 0xffff_ffff, not {self._max_queue}")
+        if self._processes < 0:
+            raise ArgErr.make(f"ActorPool.processes must be >= 0, not {self._processes}")
+        if self._processes > 0 and self._aio:
+            raise ArgErr.make("ActorPool cannot use both aio and processes")
 
-        # Create thread pool with daemon threads to prevent hang on exit
-        import concurrent.futures
-        self._executor = ThreadPoolExecutor(max_workers=self._max_threads, thread_name_prefix=self._name)
-        # Make executor threads daemon so they don't block exit
-        self._executor._threads = set()  # Clear to allow daemon thread creation
         self._state = ActorPool.RUNNING
         self._lock = threading.Lock()
         self._pending_count = 0
+
+        if self._aio:
+            # Single event loop thread; actors run on it as tasks
+            import asyncio
+            self._executor = None
+            self._loop = asyncio.new_event_loop()
+            self._tasks = set()
+            self._idle = threading.Condition(self._lock)
+            self._loop_thread = threading.Thread(target=self._loop.run_forever, name=self._name, daemon=True)
+            self._loop_thread.start()
+        else:
+            # Create thread pool with daemon threads to prevent hang on exit
+            import concurrent.futures
+            self._executor = ThreadPoolExecutor(max_workers=self._max_threads, thread_name_prefix=self._name)
+            # Make executor threads daemon so they don't block exit
+            self._executor._threads = set()  # Clear to allow daemon thread creation
+            self._loop = None
+
+        # Worker processes, one single-process executor each so that an
+        # actor's messages run in order on the process it is placed on
+        self._procs = None
+        if self._processes > 0:
+            import multiprocessing
+            self._mp_context = multiprocessing.get_context("spawn")
+            self._procs = [self._new_proc() for _ in range(self._processes)]
+            self._next_proc = 0
+            self._actor_seq = 0
         self.killed = False
 
         # Create scheduler for send_later support
@@ -70,7 +98,7 @@ class ActorPool(Obj):
             return
 
         # After construction, block sets to const fields
-        const_fields = {'_name', '_max_threads', '_max_queue', '_max_time_before_yield'}
+        const_fields = {'_name', '_max_threads', '_max_queue', '_max_time_before_yield', '_aio', '_processes'}
         if name in const_fields:
             raise ConstErr.make(f"Cannot set const field on ActorPool")
 
@@ -121,6 +149,41 @@ class ActorPool(Obj):
             return Duration.from_str("1sec")
         return self._max_time_before_yield
 
+    def aio(self, val=None):
+        """
+        Run this pool's actors as tasks on a dedicated asyncio event loop
+        thread instead of a thread pool. Receive functions may then return
+        awaitables, which are awaited before the actor takes its next
+        message. Receive code must await rather than block, since every
+        actor in the pool shares the one thread. Defaults to false.
+        """
+        if val is None:
+            return self._aio
+        else:
+            self._check_const("aio")
+            self._aio = val
+
+    def processes(self, val=None):
+        """
+        Number of worker processes used to run receive, or zero to run it
+        on this process's threads. Each actor is placed on one worker for
+        its lifetime, so its messages run in order there and its actor
+        locals persist between messages. The receive func, messages and
+        results are pickled, and futures resolve in this process.
+        Defaults to zero.
+
+        Only picklable receive funcs can be shipped, such as module level
+        Python functions. Transpiled Fantom closures (Func.make_closure
+        over a lambda) fail to pickle, and Actor subclasses overriding
+        receive are rejected, so Fantom-defined actors cannot use this
+        mode.
+        """
+        if val is None:
+            return self._processes
+        else:
+            self._check_const("processes")
+            self._processes = val
+
     # Lifecycle methods
 
     def is_stopped(self):
@@ -135,10 +198,14 @@ class ActorPool(Obj):
             if self._state == ActorPool.RUNNING:
                 return False
             # Check if executor is done
-            self._executor.shutdown(wait=False)
+            if self._executor is not None:
+                self._executor.shutdown(wait=False)
+            for proc in self._procs or ():
+                proc.shutdown(wait=False)
             # If no pending work, we're done
             if self._pending_count == 0:
                 self._state = ActorPool.DONE
+                self._stop_loop()
                 return True
             return False
 
@@ -155,7 +222,15 @@ class ActorPool(Obj):
         with self._lock:
             self._state = ActorPool.STOPPING
             self.killed = True
-        self._executor.shutdown(wait=False, cancel_futures=True)
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            for proc in self._procs or ():
+                proc.shutdown(wait=False, cancel_futures=True)
+        else:
+            try:
+                self._loop.call_soon_threadsafe(self._cancel_tasks)
+            except RuntimeError:
+                pass    # loop already closed
         return self
 
     def join(self, timeout=None):
@@ -174,9 +249,18 @@ class ActorPool(Obj):
             else:
                 timeout_secs = float(timeout) / 1_000_000_000.0
 
+        if self._loop is not None:
+            # Wait for the loop's tasks to drain, then stop it
+            with self._idle:
+                if not self._idle.wait_for(lambda: self._pending_count == 0, timeout_secs):
+                    raise TimeoutErr.make("ActorPool.join timed out")
+                self._state = ActorPool.DONE
+            self._stop_loop()
+            return self
+
         if timeout_secs is None:
             # No timeout - wait forever
-            self._executor.shutdown(wait=True)
+            self._shutdown_wait()
             with self._lock:
                 self._state = ActorPool.DONE
             return self
@@ -186,7 +270,7 @@ class ActorPool(Obj):
         done_event = threading.Event()
 
         def wait_for_shutdown():
-            self._executor.shutdown(wait=True)
+            self._shutdown_wait()
             done_event.set()
 
         waiter = threading.Thread(target=wait_for_shutdown, daemon=True)
@@ -202,6 +286,12 @@ class ActorPool(Obj):
 
         return self
 
+    def _shutdown_wait(self):
+        """Shut down the thread pool, then the worker processes, waiting for each."""
+        self._executor.shutdown(wait=True)
+        for proc in self._procs or ():
+            proc.shutdown(wait=True)
+
     # Work submission
 
     def has_pending(self):
@@ -210,18 +300,144 @@ class ActorPool(Obj):
             return self._pending_count > 0
 
     def submit(self, actor):
-        """Submit actor work to the thread pool."""
+        """Submit actor work to the thread pool or event loop."""
+        self._execute(actor._work_aio if self._loop is not None else actor._work)
+
+    def _execute(self, fn):
+        """
+        Run fn on the thread pool, counting it as pending work until done.
+        On an aio pool fn runs as a task on the event loop, and an
+        awaitable it returns is awaited by that task.
+        """
         with self._lock:
             self._pending_count += 1
 
-        def run_actor():
+        if self._loop is not None:
             try:
-                actor._work()
+                self._loop.call_soon_threadsafe(self._spawn, fn)
+            except Exception:
+                self._done()
+                raise
+            return
+
+        def run():
+            try:
+                fn()
             finally:
-                with self._lock:
-                    self._pending_count -= 1
+                self._done()
+
+        try:
+            self._executor.submit(run)
+        except Exception:
+            self._done()
+            raise
+
+    def _done(self):
+        """Count one unit of pending work as finished."""
+        with self._lock:
+            self._pending_count -= 1
+            if self._loop is not None and self._pending_count == 0:
+                self._idle.notify_all()
 
-        self._executor.submit(run_actor)
+    def _new_proc(self):
+        """Create the single-process executor for one worker slot."""
+        from concurrent.futures import ProcessPoolExecutor
+        return ProcessPoolExecutor(max_workers=1, mp_context=self._mp_context)
+
+    def _place(self):
+        """
+        Place a new actor on a worker process, round robin. Return the
+        (slot, key) pair identifying the actor on its worker.
+        """
+        with self._lock:
+            slot = self._next_proc
+            self._next_proc = (slot + 1) % len(self._procs)
+            self._actor_seq += 1
+            return (slot, self._actor_seq)
+
+    def _send_remote(self, actor, future):
+        """
+        Run actor's receive for future's message on the actor's worker
+        process and resolve future here when the result comes back.
+        """
+        slot, key = actor._placement
+        proc = self._procs[slot]
+
+        # Ship the receive func the first time the worker sees this actor
+        receive = None
+        if actor._placed_on is not proc:
+            receive = actor._receive_func
+            actor._placed_on = proc
+
+        with self._lock:
+            self._pending_count += 1
+        try:
+            remote = proc.submit(_remote_receive, key, receive, future.msg)
+        except Exception as e:
+            self._done()
+            self._remote_failed(slot, proc, future, e)
+            return
+
+        def done(remote):
+            try:
+                if remote.cancelled():
+                    future.cancel()
+                    return
+                e = remote.exception()
+                if e is not None:
+                    self._remote_failed(slot, proc, future, e)
+                else:
+                    future.complete(remote.result())
+            except Exception as e:
+                future.complete_err(Err.wrap(e))
+            finally:
+                self._done()
+        remote.add_done_callback(done)
+
+    def _remote_failed(self, slot, proc, future, e):
+        """Fail future with e, replacing the worker if its process died."""
+        from concurrent.futures.process import BrokenProcessPool
+        if isinstance(e, BrokenProcessPool) and not self.is_stopped():
+            # Actors on the slot are re-registered with the new worker,
+            # which starts them over with empty actor locals
+            with self._lock:
+                if self._procs[slot] is proc:
+                    self._procs[slot] = self._new_proc()
+        future.complete_err(Err.wrap(e))
+
+    def _spawn(self, fn):
+        """Start fn as a task; runs on the event loop thread."""
+        import inspect
+
+        async def run():
+            try:
+                result = fn()
+                if inspect.isawaitable(result):
+                    await result
+            except Exception:
+                import traceback
+                traceback.print_exc()
+            finally:
+                self._done()
+
+        task = self._loop.create_task(run())
+        # The loop only keeps weak references to its tasks
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    def _cancel_tasks(self):
+        """Cancel every running task; runs on the event loop thread."""
+        for task in list(self._tasks):
+            task.cancel()
+
+    def _stop_loop(self):
+        """Stop the event loop thread of an aio pool."""
+        if self._loop is None:
+            return
+        try:
+            self._loop.call_soon_threadsafe(self._loop.stop)
+        except RuntimeError:
+            pass    # loop already closed
 
     def schedule(self, actor, duration, future):
         """Schedule a future to be enqueued to an actor after a duration."""
@@ -229,7 +445,13 @@ class ActorPool(Obj):
         # Get duration in nanoseconds
         ns = duration.ticks() if hasattr(duration, 'ticks') else int(duration)
         work = ScheduledWork(actor, future)
-        self._scheduler.schedule(ns, work)
+        # Let future.cancel() drop the timer instead of leaving it queued
+        handle = self._scheduler.schedule(ns, work)
+        with future._condition:
+            if future._state == future.PENDING:
+                future._timer = (self._scheduler, handle)
+                return
+        self._scheduler.cancel(handle)
 
     def balance(self, actors):
         """Select actor with smallest queue size."""
@@ -259,6 +481,35 @@ class ActorPool(Obj):
         return best
 
 
+# Worker process side of a processes pool: actor key -> Actor._Context
+_remote_actors = {}
+
+
+def _remote_receive(key, receive, msg):
+    """Run one message for actor key in a worker process."""
+    from fan.concurrent.Actor import Actor
+    from fan.sys.Locale import Locale
+    if receive is not None:
+        context = Actor._Context(None)
+        context.receive = receive
+        _remote_actors[key] = context
+    context = _remote_actors.get(key)
+    if context is None:
+        raise Err.make("Actor not registered with worker process")
+    Actor._thread_locals.actor_locals = context.locals
+    Locale.set_cur(context.locale)
+    try:
+        try:
+            return context.receive(msg)
+        except TypeError as e:
+            # Same arity leniency as Actor.receive
+            if "positional argument" in str(e):
+                return context.receive()
+            raise
+    finally:
+        context.locale = Locale.cur()
+
+
 # Type metadata registration for reflection
 from fan.sys.Type import Type
 from fan.sys.Param import Param
@@ -270,6 +521,8 @@ _t.af_('name', 1, 'sys::Str', {})
 _t.af_('max_threads', 1, 'sys::Int', {})
 _t.af_('max_queue', 1, 'sys::Int', {})
 _t.af_('max_time_before_yield', 1, 'sys::Duration', {})
+_t.af_('aio', 1, 'sys::Bool', {})
+_t.af_('processes', 1, 'sys::Int', {})
 _t.am_('make', 257, 'sys::Void', [Param('f', Type.find('sys::Func?'), True)], {})
 _t.am_('is_stopped', 1, 'sys::Bool', [], {})
 _t.am_('is_done', 1, 'sys::Bool', [], {})
@@ -83,9 +83,9 @@ class Future(Obj):
         self._wrapped().wait_for(timeout)
         return self
 
-    def then(self, onOk, onErr=None):
+    def then(self, onOk, onErr=None, pool=None):
         """Register callback when this future completes."""
-        result = self._wrapped().then(onOk, onErr)
+        result = self._wrapped().then(onOk, onErr, pool)
         return self.wrap(result)
 
     def cancel(self):
@@ -102,6 +102,16 @@ class Future(Obj):
         self._wrapped().complete_err(err)
         return self
 
+    def __await__(self):
+        """Await completion from a coroutine; evaluates to get()."""
+        return (yield from self._wrapped().__await__())
+
+    @staticmethod
+    def from_aio(aw, loop=None):
+        """Wrap an asyncio future or coroutine as a Future."""
+        from fan.concurrent.ActorFuture import ActorFuture
+        return ActorFuture.from_aio(aw, loop)
+
     def promise(self):
         """Get JavaScript Promise object - not available in Python."""
         from fan.sys.Err import UnsupportedErr
@@ -4,6 +4,8 @@
 # It is optimized for use with the actor framework.
 #
 
+import heapq
+import itertools
 import threading
 import time
 
@@ -14,25 +16,42 @@ class Scheduler:
     period of time. It is optimized for use with the actor framework.
     Scheduler lazily launches a background thread the first time an
     item of work is scheduled.
+
+    Work is kept in a binary heap keyed by a time.monotonic_ns() deadline,
+    so wall clock changes don't shift timers. Each heap entry is a list
+    [deadline, seq, work]; seq keeps equal deadlines in FIFO order and
+    cancel clears work in place, leaving the entry to be skipped.
     """
 
+    # Rebuild the heap once at least this many entries are cancelled
+    # and they make up over half of it
+    _COMPACT_MIN = 64
+
     def __init__(self, name):
         """Constructor."""
         self.name = name
         self.alive = True
-        self.head = None  # Linked list of scheduled work, sorted by deadline
+        self._heap = []
+        self._seq = itertools.count()
+        self._cancelled = 0     # cancelled entries still in the heap
         self._lock = threading.Lock()
         self._condition = threading.Condition(self._lock)
         self._thread = None
 
+        # Metrics
+        self._fired = 0
+        self._late_total_ns = 0
+        self._late_max_ns = 0
+
     def schedule(self, ns, work):
         """
         Schedule the work item to be executed after
         the given duration of nanoseconds has elapsed.
+        Return a handle which may be passed to cancel.
         """
+        entry = [time.monotonic_ns() + ns, next(self._seq), work]
         with self._condition:
-            # Insert into our linked list
-            new_head = self._add(ns, work)
+            heapq.heappush(self._heap, entry)
 
             # If we haven't launched our thread yet, then launch it
             if self._thread is None:
@@ -43,49 +62,49 @@ class Scheduler:
                 )
                 self._thread.start()
 
-            # If we added to the head of our linked list, then we
-            # modified our earliest deadline, so we need to notify thread
-            if new_head:
+            # If we added to the top of our heap, then we modified
+            # our earliest deadline, so we need to notify thread
+            if self._heap[0] is entry:
                 self._condition.notify_all()
+        return entry
 
-    def _add(self, ns, work):
+    def cancel(self, handle):
         """
-        Add the work item into the linked list so that the list
-        is always sorted by earliest deadline to oldest deadline.
-        Return True if we have a new head which changes our
-        next earliest deadline.
+        Remove work scheduled with the given handle without running or
+        cancelling it. Return true if it was still pending.
         """
-        # Create new node for our linked list
-        node = _Node()
-        node.deadline = time.time_ns() + ns
-        node.work = work
-
-        # If no items, this is easy
-        if self.head is None:
-            self.head = node
-            return True
-
-        # If new item has earliest deadline it becomes new head
-        if node.deadline < self.head.deadline:
-            node.next = self.head
-            self.head = node
-            return True
-
-        # Find insertion point in linked list
-        last = self.head
-        cur = self.head.next
-        while cur is not None:
-            if node.deadline < cur.deadline:
-                node.next = cur
-                last.next = node
+        with self._condition:
+            if handle[2] is None:
                 return False
+            handle[2] = None
+            self._cancelled += 1
+            # Compact once the heap is mostly cancelled entries
+            heap = self._heap
+            if self._cancelled >= self._COMPACT_MIN and self._cancelled * 2 > len(heap):
+                heap[:] = [e for e in heap if e[2] is not None]
+                heapq.heapify(heap)
+                self._cancelled = 0
+            return True
 
-            last = cur
-            cur = cur.next
+    def size(self):
+        """Return the number of pending work items."""
+        with self._condition:
+            return len(self._heap) - self._cancelled
 
-        # This node has the oldest deadline, append to linked list
-        last.next = node
-        return False
+    def metrics(self):
+        """
+        Return a dict of scheduler metrics: pending work items, items
+        fired so far, and the average and max nanoseconds items ran
+        after their deadline.
+        """
+        with self._condition:
+            fired = self._fired
+            return {
+                "pending": len(self._heap) - self._cancelled,
+                "fired": fired,
+                "lateAvgNs": self._late_total_ns // fired if fired else 0,
+                "lateMaxNs": self._late_max_ns,
+            }
 
     def stop(self):
         """
@@ -97,18 +116,21 @@ class Scheduler:
             self.alive = False
             self._condition.notify_all()
 
-            # Call cancel on everything in queue
-            node = self.head
-            while node is not None:
+            # Call cancel on everything in queue, in deadline order
+            for entry in sorted(self._heap):
+                work = entry[2]
+                if work is None:
+                    continue
+                entry[2] = None
                 try:
-                    node.work.cancel()
+                    work.cancel()
                 except Exception as e:
                     import traceback
                     traceback.print_exc()
-                node = node.next
 
             # Clear queue
-            self.head = None
+            self._heap = []
+            self._cancelled = 0
 
     def _run(self):
         """Background thread that processes scheduled work."""
@@ -116,13 +138,19 @@ class Scheduler:
             try:
                 work = None
                 with self._condition:
+                    heap = self._heap
+
+                    # Drop cancelled entries off the top
+                    while heap and heap[0][2] is None:
+                        heapq.heappop(heap)
+                        self._cancelled -= 1
+
                     # If no work ready to go, then wait for next deadline
-                    now = time.time_ns()
-                    if self.head is None or self.head.deadline > now:
-                        if self.head is not None:
-                            to_sleep_ns = self.head.deadline - now
+                    now = time.monotonic_ns()
+                    if not heap or heap[0][0] > now:
+                        if heap:
                             # Convert nanoseconds to seconds for wait()
-                            to_sleep_sec = to_sleep_ns / 1_000_000_000.0
+                            to_sleep_sec = (heap[0][0] - now) / 1_000_000_000.0
                             self._condition.wait(timeout=to_sleep_sec)
                         else:
                             # No work, wait indefinitely until notified
@@ -130,8 +158,15 @@ class Scheduler:
                         continue
 
                     # Dequeue the next work item while holding lock
-                    work = self.head.work
-                    self.head = self.head.next
+                    entry = heapq.heappop(heap)
+                    work = entry[2]
+                    entry[2] = None
+
+                    late = now - entry[0]
+                    self._fired += 1
+                    self._late_total_ns += late
+                    if late > self._late_max_ns:
+                        self._late_max_ns = late
 
                 # Work callback - outside of lock
                 if work is not None:
@@ -147,19 +182,6 @@ class Scheduler:
                     traceback.print_exc()
 
 
-class _Node:
-    """Node in the linked list of scheduled work."""
-
-    def __init__(self):
-        self.deadline = 0  # time.time_ns() deadline
-        self.work = None   # Work item to execute
-        self.next = None   # Next node in linked list
-
-    def __str__(self):
-        ms = (self.deadline - time.time_ns()) // 1_000_000
-        return f"Deadline: {ms}ms  Work: {self.work}"
-
-
 class ScheduledWork:
     """
     Work item that enqueues a future to an actor when deadline hits.
@@ -92,6 +92,19 @@ class Crypto(Obj):
     super().__init__(*args, **kwargs)
 
 
+  def digest_all(self, algorithm, items):
+    return List.from_list([Crypto._item_buf(item).to_digest(algorithm) for item in items], "sys::Buf")
+
+  def hmac_all(self, algorithm, items, key):
+    return List.from_list([Crypto._item_buf(item).hmac(algorithm, key) for item in items], "sys::Buf")
+
+  def pbk_all(self, algorithm, pairs, iterations, key_len):
+    return List.from_list([Buf.pbk(algorithm, pair[0], pair[1], iterations, key_len) for pair in pairs], "sys::Buf")
+
+  @staticmethod
+  def _item_buf(item):
+    return item.read_all_buf() if isinstance(item, File) else item
+
   def load_certs_for_uri(self, uri):
     raise UnsupportedErr.make()
 
@@ -103,6 +116,9 @@ _t = Type.find('crypto::Crypto')
 _t.tf_({}, 140289, [], None)
 _t.af_('cur', 10241, 'crypto::Crypto', {})
 _t.am_('digest', 5121, 'crypto::Digest', [Param('algorithm', Type.find('sys::Str'), False)], {})
+_t.am_('digest_all', 4097, 'sys::Buf[]', [Param('algorithm', Type.find('sys::Str'), False), Param('items', Type.find('sys::Obj[]'), False)], {})
+_t.am_('hmac_all', 4097, 'sys::Buf[]', [Param('algorithm', Type.find('sys::Str'), False), Param('items', Type.find('sys::Obj[]'), False), Param('key', Type.find('sys::Buf'), False)], {})
+_t.am_('pbk_all', 4097, 'sys::Buf[]', [Param('algorithm', Type.find('sys::Str'), False), Param('pairs', Type.find('sys::Obj[][]'), False), Param('iterations', Type.find('sys::Int'), False), Param('key_len', Type.find('sys::Int'), False)], {})
 _t.am_('gen_csr', 5121, 'crypto::Csr', [Param('keys', Type.find('crypto::KeyPair'), False), Param('subject_dn', Type.find('sys::Str'), False), Param('opts', Type.find('[sys::Str:sys::Obj]'), True)], {})
 _t.am_('cert_signer', 5121, 'crypto::CertSigner', [Param('csr', Type.find('crypto::Csr'), False)], {})
 _t.am_('gen_key_pair', 5121, 'crypto::KeyPair', [Param('algorithm', Type.find('sys::Str'), False), Param('bits', Type.find('sys::Int'), False)], {})
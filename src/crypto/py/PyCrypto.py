@@ -47,11 +47,49 @@
 import hashlib
 import hmac
 import base64
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from fan.sys.Obj import Obj
 from fan.sys.Buf import Buf
 from fan.sys.Err import UnsupportedErr
 
 
+# Shared worker pool for the batch APIs; hashlib releases the GIL while
+# hashing large inputs, so the workers run on separate cores
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def _batch(fn, items):
+    """Apply fn to each item on the worker pool, returning results in input order."""
+    global _pool
+    items = list(items)
+    if len(items) < 2:
+        return [fn(item) for item in items]
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = ThreadPoolExecutor(thread_name_prefix="crypto")
+    return list(_pool.map(fn, items))
+
+
+def _feed(update, item):
+    """Feed update() with the bytes of a Buf or File, streaming files in chunks."""
+    if isinstance(item, Buf):
+        update(item._data_view())
+        return
+    in_stream = item.in_()
+    try:
+        chunk = in_stream._chunk_size
+        while True:
+            data = in_stream._read_bytes(chunk)
+            if not data:
+                break
+            update(data)
+    finally:
+        in_stream.close()
+
+
 class PyCrypto(Obj):
     """Python implementation of crypto::Crypto.
 
@@ -82,6 +120,80 @@ class PyCrypto(Obj):
         """
         return PyDigest(algorithm)
 
+    def digest_all(self, algorithm, items):
+        """Compute the digest of each Buf or File in parallel.
+
+        Bufs are hashed over all their bytes; Files are streamed in chunks.
+        Work runs on a shared thread pool since hashlib releases the GIL.
+
+        Args:
+            algorithm: Hash algorithm name (SHA-256, SHA-1, MD5, etc.)
+            items: List of Buf or File
+
+        Returns:
+            List of Buf digests in input order
+
+        Raises:
+            UnsupportedErr: If the algorithm is not supported
+        """
+        from fan.sys.List import List
+        algo_name = PyDigest(algorithm)._algo_name
+
+        def compute(item):
+            h = hashlib.new(algo_name)
+            _feed(h.update, item)
+            return Buf(h.digest())
+
+        return List.from_list(_batch(compute, items), "sys::Buf")
+
+    def hmac_all(self, algorithm, items, key):
+        """Compute the HMAC of each Buf or File in parallel with one key.
+
+        Args:
+            algorithm: Hash algorithm name (SHA-256, SHA-1, MD5, etc.)
+            items: List of Buf or File
+            key: Buf containing the secret key
+
+        Returns:
+            List of Buf HMACs in input order
+
+        Raises:
+            UnsupportedErr: If the algorithm is not supported
+        """
+        from fan.sys.List import List
+        algo_name = PyDigest(algorithm)._algo_name
+        key_bytes = key._get_data() if isinstance(key, Buf) else bytes(key)
+
+        def compute(item):
+            h = hmac.new(key_bytes, digestmod=algo_name)
+            _feed(h.update, item)
+            return Buf(h.digest())
+
+        return List.from_list(_batch(compute, items), "sys::Buf")
+
+    def pbk_all(self, algorithm, pairs, iterations, key_len):
+        """Derive a PBKDF2 key for each password/salt pair in parallel.
+
+        Args:
+            algorithm: Algorithm name (PBKDF2WithHmacSHA256, etc.)
+            pairs: List of [password, salt] pairs, each a Buf or Str
+            iterations: Number of iterations
+            key_len: Desired key length in bytes
+
+        Returns:
+            List of Buf keys in input order
+
+        Raises:
+            ArgErr: If the algorithm is not supported
+        """
+        from fan.sys.List import List
+
+        def compute(pair):
+            password, salt = pair
+            return Buf.pbk(algorithm, password, salt, iterations, key_len)
+
+        return List.from_list(_batch(compute, pairs), "sys::Buf")
+
     def gen_csr(self, keys, subject_dn, opts=None):
         """Generate a Certificate Signing Request.
 
@@ -261,9 +373,9 @@ class PyDigest(Obj):
             UnsupportedErr: If the algorithm is not supported
         """
         self._algorithm = algorithm
-        algo_name = self._ALGO_MAP.get(algorithm.upper(), algorithm.lower())
+        self._algo_name = self._ALGO_MAP.get(algorithm.upper(), algorithm.lower())
         try:
-            self._hasher = hashlib.new(algo_name)
+            self._hasher = hashlib.new(self._algo_name)
         except ValueError:
             raise UnsupportedErr.make(f"Unsupported digest algorithm: {algorithm}")
 
@@ -285,17 +397,11 @@ class PyDigest(Obj):
         """
         result = self._hasher.digest()
         # Reset for next use
-        algo_name = self._ALGO_MAP.get(self._algorithm.upper(), self._algorithm.lower())
-        self._hasher = hashlib.new(algo_name)
-        # Return as Buf
-        buf = Buf.make(len(result))
-        for b in result:
-            buf.write(b)
-        buf.flip()
-        return buf
+        self._hasher = hashlib.new(self._algo_name)
+        return Buf(result)
 
     def update(self, buf):
-        """Update with all bytes from Buf.
+        """Update with all bytes from Buf (regardless of current position).
 
         Args:
             buf: Buf containing bytes to hash
@@ -303,12 +409,52 @@ class PyDigest(Obj):
         Returns:
             self for chaining
         """
-        # Get the raw bytes from the Buf
-        data = buf.read_all_buf().to_hex()
-        # Convert hex to bytes
-        self._hasher.update(bytes.fromhex(data))
+        # Hash straight from the Buf storage without copying
+        self._hasher.update(buf._data_view())
         return self
 
+    def _update_in(self, in_stream, n=None):
+        """Update with bytes read from an InStream in chunks.
+
+        Memory use stays constant regardless of the stream length. The
+        stream is left open. Not part of crypto::Digest, so it is only
+        for Python callers of the runtime.
+
+        Args:
+            in_stream: InStream to read from
+            n: Number of bytes to read (None = until end of stream)
+
+        Returns:
+            self for chaining
+        """
+        update = self._hasher.update
+        chunk = in_stream._chunk_size
+        remaining = None if n is None else int(n)
+        while remaining is None or remaining > 0:
+            size = chunk if remaining is None else min(chunk, remaining)
+            data = in_stream._read_bytes(size)
+            if not data:
+                break
+            update(data)
+            if remaining is not None:
+                remaining -= len(data)
+        return self
+
+    def _update_file(self, file):
+        """Update with the full contents of a File, read in chunks.
+
+        Args:
+            file: File to hash
+
+        Returns:
+            self for chaining
+        """
+        in_stream = file.in_()
+        try:
+            return self._update_in(in_stream)
+        finally:
+            in_stream.close()
+
     def update_ascii(self, s):
         """Update with ASCII string (8-bit chars).
 
@@ -363,8 +509,7 @@ class PyDigest(Obj):
         Returns:
             self for chaining
         """
-        algo_name = self._ALGO_MAP.get(self._algorithm.upper(), self._algorithm.lower())
-        self._hasher = hashlib.new(algo_name)
+        self._hasher = hashlib.new(self._algo_name)
         return self
 
 
@@ -498,28 +498,18 @@ class TcpSocketInStream(InStream):
         # Delegate to read() which handles pushback
         return self.read()
 
-    def read_buf(self, buf, n):
-        """Read up to n bytes into buf."""
-        data = self._file.read(n)
-        if not data:
-            return None
-        if hasattr(buf, '_data'):
-            buf._data.extend(data)
-        elif hasattr(buf, 'write_bytes'):
-            buf.write_bytes(data)
-        else:
-            for b in data:
-                buf.write(b)
-        return len(data)
+    def _read_bytes(self, n):
+        """Read up to n bytes, draining pushback first.
 
-    def read_all_buf(self):
-        """Read all remaining bytes."""
-        from fan.sys.Buf import Buf
-        data = self._file.read()
-        buf = Buf.make(len(data))
-        buf._data = bytearray(data)
-        buf._size = len(data)
-        return buf
+        Uses read1 so a short read returns what the socket has rather than
+        blocking for the full count.
+        """
+        if not self._pushback:
+            return self._file.read1(n)
+        k = min(n, len(self._pushback))
+        head = bytes(reversed(self._pushback[-k:]))
+        del self._pushback[-k:]
+        return head
 
     def read_all_str(self, charset=None):
         """Read all as string."""
@@ -572,6 +562,11 @@ class TcpSocketOutStream(OutStream):
             self._file.write(bytes([int(val)]))
         return self
 
+    def _write_bytes(self, data):
+        """Write a block of bytes."""
+        self._file.write(data)
+        return self
+
     def write_buf(self, buf, n=None):
         """Write buffer contents.
 
@@ -3,32 +3,48 @@
 # Licensed under the Academic Free License version 3.0
 #
 
-import io
 import struct
 import random
 import hashlib
 import base64
 from .Obj import Obj
 from .OutStream import OutStream
-from .InStream import InStream
+from .InStream import InStream, _read_char, _read_line, _read_all_str, \
+    _read_chars, _read_str_token, _crc_algorithm
+
+# Compiled struct formats used by the numeric read/write paths
+_structs = {}
+
+
+def _struct(fmt):
+    """Return the cached compiled struct.Struct for fmt."""
+    st = _structs.get(fmt)
+    if st is None:
+        st = _structs[fmt] = struct.Struct(fmt)
+    return st
 
 
 class Buf(Obj):
     """Buf models a block of bytes with random access."""
 
     def __init__(self, data=None, capacity=1024):
-        if data is not None:
-            if isinstance(data, bytes):
-                self._bytes = io.BytesIO(data)
-                self._bytes.seek(0, 2)  # seek to end
-                self._size = len(data)
-                self._capacity = max(capacity, len(data))
-            else:
-                self._bytes = io.BytesIO()
-                self._size = 0
-                self._capacity = int(capacity)
+        # _bytes is either a private bytearray or, when _view is set, a
+        # read-only memoryview onto immutable bytes shared with other Bufs;
+        # a view is copied into a private bytearray on the first write;
+        # _exported marks a bytearray handed out through a writable memoryview
+        self._view = False
+        self._exported = False
+        if isinstance(data, bytes) or (isinstance(data, memoryview) and data.readonly):
+            self._bytes = memoryview(data)
+            self._view = True
+            self._size = len(self._bytes)
+            self._capacity = max(capacity, self._size)
+        elif isinstance(data, (bytearray, memoryview)):
+            self._bytes = bytearray(data)
+            self._size = len(self._bytes)
+            self._capacity = max(capacity, self._size)
         else:
-            self._bytes = io.BytesIO()
+            self._bytes = bytearray()
             self._size = 0
             self._capacity = int(capacity)
         self._pos = 0
@@ -36,8 +52,7 @@ class Buf(Obj):
         self._endian = None   # Lazy init
         self._in = None
         self._out = None
-        self._unread_stack = []  # Stack for unread bytes
-        self._unread_char_stack = []  # Stack for unread characters
+        self._unread_stack = []  # Stack for unread bytes (and unread chars' bytes)
 
     @staticmethod
     def make(capacity=1024):
@@ -126,6 +141,13 @@ class Buf(Obj):
         # Expand capacity if needed
         if val > self._capacity:
             self._capacity = val
+        if val > self._size:
+            # Grown region reads as zeros
+            if self._view:
+                self._unshare()
+            if val > len(self._bytes):
+                self._grow(val)
+            self._bytes[self._size:val] = bytes(val - self._size)
         self._size = val
         return self
 
@@ -175,7 +197,7 @@ class Buf(Obj):
     def seek(self, pos):
         """Seek to position. Negative seeks from end.
 
-        Clears any unread byte/char stacks to ensure clean read state.
+        Clears the unread stack to ensure clean read state.
         """
         pos = int(pos)
         if pos < 0:
@@ -184,9 +206,8 @@ class Buf(Obj):
             from .Err import IndexErr
             raise IndexErr.make(str(pos))
         self._pos = pos
-        # Clear unread stacks - seeking invalidates any pushed-back bytes/chars
+        # Clear unread stack - seeking invalidates any pushed-back bytes/chars
         self._unread_stack = []
-        self._unread_char_stack = []
         return self
 
     def flip(self):
@@ -203,42 +224,50 @@ class Buf(Obj):
         if pos < 0 or pos >= self._size:
             from .Err import IndexErr
             raise IndexErr.make(str(pos))
-        self._bytes.seek(pos)
-        b = self._bytes.read(1)
-        return b[0] if b else 0
+        return self._bytes[pos]
 
     def __getitem__(self, pos):
         return self.get(pos)
 
     def get_range(self, r):
-        """Get slice as new Buf."""
+        """Get slice as new Buf.
+
+        A Buf that is a view onto shared bytes returns another view of the
+        range without copying.
+        """
         s = r.start_(self._size)
         e = r.end_(self._size)
         n = e - s + 1
         if n < 0:
             from .Err import IndexErr
             raise IndexErr.make(str(r))
-        self._bytes.seek(s)
-        data = self._bytes.read(n)
-        result = Buf(data)
+        result = Buf(self._bytes[s:s + n])
         # Copy charset from parent buffer
         result._charset = self._charset
         return result
 
     def dup(self):
-        """Duplicate buffer."""
-        data = self._get_data()
-        return Buf(data)
+        """Duplicate buffer; a view is shared until either side writes."""
+        if self._view:
+            return Buf(self._bytes[0:self._size])
+        return Buf(self._get_data())
 
     def to_immutable(self):
         """Return an immutable ConstBuf, stealing content from this Buf.
 
         After this call, this Buf will be cleared (size=0, capacity=0).
         This is the expected "steal" semantic - the immutable buffer
-        takes ownership of the data.
+        takes ownership of the data without copying it.
         """
         from .ConstBuf import ConstBuf
-        data = self._get_data()
+        data = self._bytes
+        if self._view:
+            data = data[0:self._size]
+        elif type(data) is bytearray and not self._exported:
+            # Nothing else references the storage once this Buf is cleared
+            data = memoryview(data)[0:self._size].toreadonly()
+        else:
+            data = self._get_data()
         result = ConstBuf(data)
         # Clear the original buffer (steal semantic)
         self.clear()
@@ -261,8 +290,9 @@ class Buf(Obj):
         if pos < 0 or pos >= self._size:
             from .Err import IndexErr
             raise IndexErr.make(str(pos))
-        self._bytes.seek(pos)
-        self._bytes.write(bytes([int(b) & 0xFF]))
+        if self._view:
+            self._unshare()
+        self._bytes[pos] = int(b) & 0xFF
         return self
 
     def __setitem__(self, pos, b):
@@ -272,7 +302,9 @@ class Buf(Obj):
         """Clear buffer."""
         self._pos = 0
         self._size = 0
-        self._bytes = io.BytesIO()
+        self._bytes = bytearray()
+        self._view = False
+        self._exported = False
         return self
 
     def trim(self):
@@ -298,13 +330,7 @@ class Buf(Obj):
 
     def fill(self, b, times):
         """Fill with byte value."""
-        b = int(b) & 0xFF
-        self._bytes.seek(self._pos)
-        for _ in range(int(times)):
-            self._bytes.write(bytes([b]))
-        self._pos += int(times)
-        if self._pos > self._size:
-            self._size = self._pos
+        self._write_bytes(bytes((int(b) & 0xFF,)) * int(times))
         return self
 
     #################################################################
@@ -343,17 +369,16 @@ class Buf(Obj):
 
     def write(self, b):
         """Write single byte."""
-        # Check read-only mode (set by File.open_("r"))
-        if getattr(self, '_mode', None) == 'r':
-            from .Err import IOErr
-            raise IOErr.make("Buf is read-only")
+        pos = self._pos
         # Grow capacity if needed (double when exceeded)
-        if self._pos >= self._capacity:
-            new_capacity = max(self._capacity * 2, self._pos + 1)
-            self._capacity = new_capacity
-        self._bytes.seek(self._pos)
-        self._bytes.write(bytes([int(b) & 0xFF]))
-        self._pos += 1
+        if pos >= self._capacity:
+            self._capacity = max(self._capacity * 2, pos + 1)
+        if self._view:
+            self._unshare()
+        if pos >= len(self._bytes):
+            self._grow(pos + 1)
+        self._bytes[pos] = int(b) & 0xFF
+        self._pos = pos + 1
         if self._pos > self._size:
             self._size = self._pos
         return self
@@ -370,45 +395,23 @@ class Buf(Obj):
 
         # For immutable buffers, always read from start
         if other.is_immutable():
-            other._bytes.seek(0)
-            data = other._bytes.read(n)
             # Don't modify other._pos for immutable bufs
+            data = other._bytes[0:min(n, other._size)]
         else:
-            other._bytes.seek(other._pos)
-            data = other._bytes.read(n)
-            other._pos += len(data)
-
-        self._bytes.seek(self._pos)
-        self._bytes.write(data)
-        self._pos += len(data)
-        if self._pos > self._size:
-            self._size = self._pos
+            data = other._read_bytes(n)
+        self._write_bytes(data)
         return self
 
     def write_i2(self, x):
         """Write 16-bit int (handles full unsigned range)."""
         x = int(x) & 0xFFFF  # Mask to 16-bit
-        if self._is_big_endian():
-            self.write((x >> 8) & 0xFF)
-            self.write(x & 0xFF)
-        else:
-            self.write(x & 0xFF)
-            self.write((x >> 8) & 0xFF)
+        self._write_struct('>H' if self._is_big_endian() else '<H', x)
         return self
 
     def write_i4(self, x):
         """Write 32-bit int (handles full unsigned range)."""
         x = int(x) & 0xFFFFFFFF  # Mask to 32-bit
-        if self._is_big_endian():
-            self.write((x >> 24) & 0xFF)
-            self.write((x >> 16) & 0xFF)
-            self.write((x >> 8) & 0xFF)
-            self.write(x & 0xFF)
-        else:
-            self.write(x & 0xFF)
-            self.write((x >> 8) & 0xFF)
-            self.write((x >> 16) & 0xFF)
-            self.write((x >> 24) & 0xFF)
+        self._write_struct('>I' if self._is_big_endian() else '<I', x)
         return self
 
     def write_i8(self, x):
@@ -448,23 +451,12 @@ class Buf(Obj):
         """Write modified UTF-8 string."""
         data = str(s).encode('utf-8')
         self.write_i2(len(data))
-        self._bytes.seek(self._pos)
-        self._bytes.write(data)
-        self._pos += len(data)
-        if self._pos > self._size:
-            self._size = self._pos
+        self._write_bytes(data)
         return self
 
     def write_char(self, c):
         """Write character using charset."""
-        ch = chr(int(c))
-        charset_name = self._get_python_encoding()
-        data = ch.encode(charset_name)
-        self._bytes.seek(self._pos)
-        self._bytes.write(data)
-        self._pos += len(data)
-        if self._pos > self._size:
-            self._size = self._pos
+        self._write_bytes(self.charset()._encode(chr(int(c))))
         return self
 
     def write_chars(self, s, off=0, length=None):
@@ -474,13 +466,7 @@ class Buf(Obj):
             s = s[int(off):]
         else:
             s = s[int(off):int(off)+int(length)]
-        charset_name = self._get_python_encoding()
-        data = s.encode(charset_name)
-        self._bytes.seek(self._pos)
-        self._bytes.write(data)
-        self._pos += len(data)
-        if self._pos > self._size:
-            self._size = self._pos
+        self._write_bytes(self.charset()._encode(s))
         return self
 
     def print_(self, obj):
@@ -677,30 +663,19 @@ class Buf(Obj):
         # Check unread stack first
         if self._unread_stack:
             return self._unread_stack.pop()
-        if self._pos >= self._size:
-            return None
-        self._bytes.seek(self._pos)
-        b = self._bytes.read(1)
-        if not b:
+        pos = self._pos
+        if pos >= self._size:
             return None
-        self._pos += 1
-        return b[0]
+        self._pos = pos + 1
+        return self._bytes[pos]
 
     def read_buf(self, other, n):
         """Read into another Buf."""
         n = int(n)
-        avail = self._size - self._pos
-        to_read = min(n, avail)
-        if to_read <= 0:
+        if (self._size - self._pos <= 0 and not self._unread_stack) or n <= 0:
             return None
-        self._bytes.seek(self._pos)
-        data = self._bytes.read(to_read)
-        self._pos += len(data)
-        other._bytes.seek(other._pos)
-        other._bytes.write(data)
-        other._pos += len(data)
-        if other._pos > other._size:
-            other._size = other._pos
+        data = self._read_bytes(n)
+        other._write_bytes(data)
         return len(data)
 
     def unread(self, b):
@@ -710,10 +685,7 @@ class Buf(Obj):
 
     def read_all_buf(self):
         """Read remaining as new Buf."""
-        self._bytes.seek(self._pos)
-        data = self._bytes.read(self._size - self._pos)
-        self._pos = self._size
-        return Buf(data)
+        return Buf(self._read_bytes(self._size - self._pos + len(self._unread_stack)))
 
     def read_buf_fully(self, buf, n):
         """Read exactly n bytes into buf, then flip buf for reading."""
@@ -734,9 +706,7 @@ class Buf(Obj):
             return self._unread_stack[-1]  # peek top of stack without pop
         if self._pos >= self._size:
             return None
-        self._bytes.seek(self._pos)
-        b = self._bytes.read(1)
-        return b[0] if b else None
+        return self._bytes[self._pos]
 
     def read_u1(self):
         """Read unsigned 8-bit."""
@@ -793,10 +763,7 @@ class Buf(Obj):
     def read_utf(self):
         """Read modified UTF-8 string."""
         length = self.read_u2()
-        self._bytes.seek(self._pos)
-        data = self._bytes.read(length)
-        self._pos += len(data)
-        return data.decode('utf-8')
+        return str(self._read_bytes(length), 'utf-8')
 
     def read_decimal(self):
         """Read decimal serialized as UTF string."""
@@ -804,7 +771,7 @@ class Buf(Obj):
 
     def read_str_token(self, max_chars=None, func=None):
         """Read string token until whitespace or func returns true."""
-        return self.in_().read_str_token(max_chars, func)
+        return _read_str_token(self, max_chars, func)
 
     def read_props(self):
         """Read a properties file format and return as a Map.
@@ -815,41 +782,25 @@ class Buf(Obj):
 
     def read_char(self):
         """Read character using charset."""
-        # Check unread char stack first
-        if self._unread_char_stack:
-            return self._unread_char_stack.pop()
-        if self._pos >= self._size:
-            return None
-        charset_name = self._get_python_encoding()
-        self._bytes.seek(self._pos)
-        # For UTF-8, read up to 4 bytes to decode one char
-        for byte_count in range(1, 5):
-            if self._pos + byte_count > self._size:
-                break
-            self._bytes.seek(self._pos)
-            data = self._bytes.read(byte_count)
-            try:
-                ch = data.decode(charset_name)
-                if len(ch) == 1:
-                    self._pos += byte_count
-                    return ord(ch)
-            except:
-                continue
-        return None
+        return _read_char(self)
 
     def unread_char(self, c):
         """Push character to be read next (stack behavior)."""
-        self._unread_char_stack.append(int(c))
+        data = self.charset()._encode(chr(int(c)))
+        self._unread_stack.extend(reversed(data))
         return self
 
     def peek_char(self):
         """Peek character without advancing."""
-        # Check unread char stack first
-        if self._unread_char_stack:
-            return self._unread_char_stack[-1]  # peek top of stack without pop
+        if self._unread_stack:
+            ch = self.read_char()
+            if ch is not None:
+                self.unread_char(ch)
+            return ch
         old_pos = self._pos
         ch = self.read_char()
         self._pos = old_pos
+        self._unread_stack.clear()
         return ch
 
     def read_chars(self, n):
@@ -857,54 +808,15 @@ class Buf(Obj):
 
         Throws IOErr if fewer than n characters are available.
         """
-        if n < 0:
-            from .Err import ArgErr
-            raise ArgErr.make(f"readChars n < 0: {n}")
-        chars = []
-        for _ in range(int(n)):
-            ch = self.read_char()
-            if ch is None:
-                from .Err import IOErr
-                raise IOErr.make("Unexpected end of stream")
-            chars.append(chr(ch))
-        return ''.join(chars)
+        return _read_chars(self, n)
 
     def read_line(self, max_chars=None):
         """Read line of text."""
-        if self._pos >= self._size:
-            return None
-        chars = []
-        count = 0
-        while self._pos < self._size:
-            if max_chars is not None and count >= max_chars:
-                break
-            ch = self.read_char()
-            if ch is None:
-                break
-            if ch == ord('\n'):
-                break
-            if ch == ord('\r'):
-                # Check for \r\n
-                next_ch = self.peek_char()
-                if next_ch == ord('\n'):
-                    self.read_char()
-                break
-            chars.append(chr(ch))
-            count += 1
-        if not chars and self._pos >= self._size:
-            return None
-        return ''.join(chars)
+        return _read_line(self, max_chars)
 
     def read_all_str(self, normalize=True):
         """Read all remaining as string."""
-        self._bytes.seek(self._pos)
-        data = self._bytes.read(self._size - self._pos)
-        self._pos = self._size
-        charset_name = self._get_python_encoding()
-        s = data.decode(charset_name)
-        if normalize:
-            s = s.replace('\r\n', '\n').replace('\r', '\n')
-        return s
+        return _read_all_str(self, normalize)
 
     def read_all_lines(self):
         """Read all lines."""
@@ -971,9 +883,7 @@ class Buf(Obj):
         }
         alg = alg_map.get(algorithm, algorithm.lower())
         try:
-            h = hashlib.new(alg)
-            h.update(self._get_data())
-            return Buf(h.digest())
+            return Buf(hashlib.new(alg, self._data_view()).digest())
         except ValueError:
             from .Err import ArgErr
             raise ArgErr.make(f"Unknown digest algorithm: {algorithm}")
@@ -1000,7 +910,7 @@ class Buf(Obj):
         alg = alg_map.get(algorithm, algorithm.lower().replace('-', ''))
         try:
             key_bytes = key._get_data() if isinstance(key, Buf) else bytes(key)
-            h = hmac_module.new(key_bytes, self._get_data(), alg)
+            h = hmac_module.new(key_bytes, self._data_view(), alg)
             return Buf(h.digest())
         except ValueError:
             from .Err import ArgErr
@@ -1050,42 +960,21 @@ class Buf(Obj):
                                    int(iterations), int(keyLen))
         return Buf(key)
 
-    # CRC-16 odd parity lookup table (from Fantom JS implementation)
-    _CRC16_ODD_PARITY = [0, 1, 1, 0, 1, 0, 0, 1, 1, 0, 0, 1, 0, 1, 1, 0]
-
     def crc(self, algorithm):
-        """Compute CRC checksum."""
-        import zlib
-        if algorithm == "CRC-16":
-            return self._crc16()
-        if algorithm == "CRC-32":
-            return zlib.crc32(self._get_data()) & 0xFFFFFFFF
-        if algorithm == "CRC-32-Adler":
-            return zlib.adler32(self._get_data()) & 0xFFFFFFFF
-        from .Err import ArgErr
-        raise ArgErr.make(f"Unknown CRC algorithm: {algorithm}")
-
-    def _crc16(self):
-        """Compute CRC-16 checksum using standard algorithm."""
-        data = self._get_data()
-        seed = 0xFFFF
-        for byte in data:
-            seed = self._do_crc16(byte, seed)
-        return seed
-
-    def _do_crc16(self, data_to_crc, seed):
-        """Single byte CRC-16 computation."""
-        dat = (data_to_crc ^ (seed & 0xFF)) & 0xFF
-        seed = (seed & 0xFFFF) >> 8
-        index1 = dat & 0x0F
-        index2 = dat >> 4
-        if (Buf._CRC16_ODD_PARITY[index1] ^ Buf._CRC16_ODD_PARITY[index2]) == 1:
-            seed ^= 0xC001
-        dat <<= 6
-        seed ^= dat
-        dat <<= 1
-        seed ^= dat
-        return seed & 0xFFFF
+        """Compute CRC checksum of all bytes from 0 to size."""
+        return self._crc(algorithm)
+
+    def _crc(self, algorithm, seed=None):
+        """CRC of all bytes from 0 to size, continuing from seed if given.
+
+        Pass the result of a previous call as seed to continue the
+        checksum across several Bufs, e.g. a packet built in chunks.
+        The seed is intentionally internal; sys::Buf only declares crc.
+        """
+        update, crc = _crc_algorithm(algorithm)
+        if seed is not None:
+            crc = int(seed)
+        return update(self._data_view(), crc)
 
     #################################################################
     # Python Interop (to_py / from_py)
@@ -1123,52 +1012,138 @@ class Buf(Obj):
             data = bytes(data)
         return Buf(data)
 
+    def memoryview(self):
+        """Zero-copy memoryview over the buffer content from 0 to size.
+
+        The view is read-only for immutable and shared Bufs. For a mutable
+        Buf it is writable and tracks in-place writes; growing the Buf
+        while the view is alive moves the Buf to new storage, leaving the
+        view on the old bytes.
+
+        Example:
+            >>> hashlib.sha256(buf.memoryview())
+            >>> sock.sendall(buf.memoryview())
+        """
+        if self._view or self.is_immutable():
+            return self._data_view()
+        self._exported = True
+        return memoryview(self._bytes)[0:self._size]
+
+    def __buffer__(self, flags):
+        """Python buffer protocol (PEP 688), so ``memoryview(buf)`` and
+        native APIs such as ``hashlib`` accept a Buf directly (Python 3.12+).
+        """
+        return self.memoryview()
+
     #################################################################
     # Internal
     #################################################################
 
     def _get_data(self):
         """Get bytes from 0 to size."""
-        self._bytes.seek(0)
-        return self._bytes.read(self._size)
+        data = self._bytes
+        if self._view and len(data.obj) == self._size and data.nbytes == self._size \
+                and type(data.obj) is bytes:
+            return data.obj
+        return bytes(data[0:self._size])
+
+    def _data_view(self):
+        """Read-only view of bytes from 0 to size, for short-lived internal use."""
+        return memoryview(self._bytes)[0:self._size].toreadonly()
+
+    def _unshare(self):
+        """Copy a shared view into private storage before writing to it."""
+        self._bytes = bytearray(self._bytes)
+        self._view = False
+        self._exported = False
 
     def _get_python_encoding(self):
         """Get Python encoding name for current charset."""
-        name = self.charset().name()
-        # Map Fantom charset names to Python encoding names
-        encoding_map = {
-            'UTF-8': 'utf-8',
-            'UTF-16BE': 'utf-16-be',
-            'UTF-16LE': 'utf-16-le',
-            'UTF-16': 'utf-16',
-            'US-ASCII': 'ascii',
-            'ISO-8859-1': 'iso-8859-1',
-        }
-        return encoding_map.get(name, name.lower().replace('-', '_'))
+        return self.charset()._codec()
 
     def _is_big_endian(self):
-        """Check if big endian."""
-        return self.endian().name == "big"
+        """Check if big endian (the default until endian is set)."""
+        endian = self._endian
+        return endian is None or endian.name == "big"
+
+    def _read_bytes(self, n):
+        """Read up to n raw bytes from pos, advancing pos.
+
+        Drains the unread stack first.
+        """
+        stack = self._unread_stack
+        if stack:
+            k = min(n, len(stack))
+            head = bytes(reversed(stack[-k:]))
+            del stack[-k:]
+            return head + self._read_bytes(n - k) if k < n else head
+        pos = self._pos
+        end = min(pos + max(int(n), 0), self._size)
+        if end <= pos:
+            return b''
+        self._pos = end
+        return self._bytes[pos:end]
+
+    def _peek_bytes(self, n):
+        """Return up to n upcoming bytes without advancing pos."""
+        stack = self._unread_stack
+        if stack:
+            return bytes(reversed(stack[-n:]))
+        pos = self._pos
+        data = self._bytes[pos:min(pos + n, self._size)]
+        return data.tobytes() if self._view else data
+
+    def _grow(self, n):
+        """Grow storage to hold at least n bytes (amortized doubling)."""
+        data = self._bytes
+        extra = bytes(max(n, len(data) * 2) - len(data))
+        try:
+            data.extend(extra)
+        except BufferError:
+            # Storage is pinned by an exported memoryview
+            self._bytes = data + extra
+            self._exported = False
+
+    def _write_bytes(self, data):
+        """Write raw bytes at pos, growing size as needed."""
+        if self._view:
+            self._unshare()
+        pos = self._pos
+        end = pos + len(data)
+        if end > len(self._bytes):
+            self._grow(end)
+        self._bytes[pos:end] = data
+        self._pos = end
+        if end > self._size:
+            self._size = end
+        if end > self._capacity:
+            self._capacity = end
 
     def _write_struct(self, fmt, value):
         """Write using struct format."""
-        data = struct.pack(fmt, value)
-        self._bytes.seek(self._pos)
-        self._bytes.write(data)
-        self._pos += len(data)
-        if self._pos > self._size:
-            self._size = self._pos
+        if self._view:
+            self._unshare()
+        st = _structs.get(fmt) or _struct(fmt)
+        pos = self._pos
+        end = pos + st.size
+        if end > len(self._bytes):
+            self._grow(end)
+        st.pack_into(self._bytes, pos, value)
+        self._pos = end
+        if end > self._size:
+            self._size = end
+        if end > self._capacity:
+            self._capacity = end
 
     def _read_struct(self, fmt):
         """Read using struct format."""
-        size = struct.calcsize(fmt)
-        if self._pos + size > self._size:
+        st = _structs.get(fmt) or _struct(fmt)
+        pos = self._pos
+        if pos + st.size > self._size:
             from .Err import IOErr
             raise IOErr.make("Unexpected end of stream")
-        self._bytes.seek(self._pos)
-        data = self._bytes.read(size)
-        self._pos += size
-        return struct.unpack(fmt, data)[0]
+        self._pos = pos + st.size
+        return st.unpack_from(self._bytes, pos)[0]
 
 
 class BufOutStream(OutStream):
@@ -1183,6 +1158,10 @@ class BufOutStream(OutStream):
         self._buf.write(b)
         return self
 
+    def _write_bytes(self, data):
+        self._buf._write_bytes(data)
+        return self
+
     def write_buf(self, other, n=None):
         self._buf.write_buf(other, n)
         return self
@@ -1384,6 +1363,7 @@ class BufInStream(InStream):
         super().__init__(None)  # No underlying stream - we wrap a Buf
         self._buf = buf
         self._charset = None  # Own charset field, lazy init to UTF-8 for isolation
+        self._unread_stack = []  # Own unread bytes (and unread chars' bytes)
         self._bitsBuf = 0  # Lower 8 bits = buffered byte, bits 8-15 = buffer size
 
     def avail(self):
@@ -1395,38 +1375,38 @@ class BufInStream(InStream):
         Checks BufInStream's own unread stack first, then reads directly from
         underlying bytes. This enables reading from immutable ConstBuf.
         """
-        if hasattr(self, '_unread_stack') and self._unread_stack:
+        if self._unread_stack:
             return self._unread_stack.pop()
         # Read directly from _bytes to avoid ConstBuf.read() throwing
-        if self._buf._pos >= self._buf._size:
-            return None
-        self._buf._bytes.seek(self._buf._pos)
-        b = self._buf._bytes.read(1)
-        if not b:
+        buf = self._buf
+        pos = buf._pos
+        if pos >= buf._size:
             return None
-        self._buf._pos += 1
-        return b[0]
+        buf._pos = pos + 1
+        return buf._bytes[pos]
 
-    def read_buf(self, other, n):
-        """Read into another Buf.
+    def _read_bytes(self, n):
+        """Read up to n bytes straight from the Buf storage.
 
-        Direct implementation that reads from underlying _bytes to avoid
-        calling ConstBuf.read_buf() which throws ReadonlyErr.
+        Drains this stream's unread stack first. Reads storage directly so
+        that immutable ConstBufs can be read in bulk.
         """
-        n = int(n)
-        avail = self._buf._size - self._buf._pos
-        to_read = min(n, avail)
-        if to_read <= 0:
-            return None
-        self._buf._bytes.seek(self._buf._pos)
-        data = self._buf._bytes.read(to_read)
-        self._buf._pos += len(data)
-        other._bytes.seek(other._pos)
-        other._bytes.write(data)
-        other._pos += len(data)
-        if other._pos > other._size:
-            other._size = other._pos
-        return len(data)
+        stack = self._unread_stack
+        if not stack:
+            return self._buf._read_bytes(n)
+        k = min(n, len(stack))
+        head = bytes(reversed(stack[-k:]))
+        del stack[-k:]
+        if k < n:
+            return head + self._buf._read_bytes(n - k)
+        return head
+
+    def _peek_bytes(self, n):
+        """Return up to n upcoming bytes without consuming them."""
+        stack = self._unread_stack
+        if stack:
+            return bytes(reversed(stack[-n:]))
+        return self._buf._peek_bytes(n)
 
     def unread(self, n):
         """Push byte to be read next.
@@ -1441,32 +1421,32 @@ class BufInStream(InStream):
             # Get the byte at current position (what would be read next)
             # If unreading would change what's read, throw ReadonlyErr
             if self._buf._pos > 0:
-                self._buf._bytes.seek(self._buf._pos - 1)
-                expected = self._buf._bytes.read(1)
-                if expected and expected[0] != n:
+                if self._buf._bytes[self._buf._pos - 1] != n:
                     from .Err import ReadonlyErr
                     raise ReadonlyErr.make("ConstBuf is immutable")
 
-        if not hasattr(self, '_unread_stack'):
-            self._unread_stack = []
         self._unread_stack.append(n)
         return self
 
-    def read_all_buf(self):
-        return self._buf.read_all_buf()
-
-    def read_buf_fully(self, buf, n):
-        return self._buf.read_buf_fully(buf, n)
-
     def peek(self):
         """Peek next byte without advancing.
 
         Checks this stream's unread stack first, then underlying Buf.
         """
-        if hasattr(self, '_unread_stack') and self._unread_stack:
+        if self._unread_stack:
             return self._unread_stack[-1]
         return self._buf.peek()
 
+    def read_all_buf(self):
+        """Read all remaining bytes as a new Buf.
+
+        When the Buf is a view onto shared bytes (e.g. a ConstBuf), the
+        result shares them too instead of copying.
+        """
+        buf = self._buf
+        n = buf._size - buf._pos + len(buf._unread_stack) + len(self._unread_stack)
+        return Buf(self._read_bytes(n))
+
     def read_u1(self):
         return self._buf.read_u1()
 
@@ -1772,57 +1752,11 @@ class BufInStream(InStream):
         This is critical for charset isolation - when the test sets in.charset(UTF-16BE),
         the InStream should read using UTF-16BE, not the underlying Buf's UTF-8.
         """
-        # Check unread char stack first
-        if hasattr(self, '_unread_char_stack') and self._unread_char_stack:
-            return self._unread_char_stack.pop()
-        if self._buf._pos >= self._buf._size:
-            return None
-
-        # Use THIS stream's charset, not the underlying Buf's charset
-        charset_name = self._get_python_encoding()
-        self._buf._bytes.seek(self._buf._pos)
-
-        # Determine bytes per char based on encoding
-        if 'utf-16' in charset_name.lower():
-            # UTF-16 is 2 bytes per char
-            if self._buf._pos + 2 > self._buf._size:
-                return None
-            data = self._buf._bytes.read(2)
-            try:
-                ch = data.decode(charset_name)
-                if len(ch) >= 1:
-                    self._buf._pos += 2
-                    return ord(ch[0])
-            except:
-                return None
-        else:
-            # UTF-8 and others: variable length, read up to 4 bytes
-            for byte_count in range(1, 5):
-                if self._buf._pos + byte_count > self._buf._size:
-                    break
-                self._buf._bytes.seek(self._buf._pos)
-                data = self._buf._bytes.read(byte_count)
-                try:
-                    ch = data.decode(charset_name)
-                    if len(ch) == 1:
-                        self._buf._pos += byte_count
-                        return ord(ch)
-                except:
-                    continue
-        return None
+        return _read_char(self)
 
     def _get_python_encoding(self):
         """Get Python encoding name for this stream's charset."""
-        name = self.charset().name()
-        encoding_map = {
-            'UTF-8': 'utf-8',
-            'UTF-16BE': 'utf-16-be',
-            'UTF-16LE': 'utf-16-le',
-            'UTF-16': 'utf-16',
-            'US-ASCII': 'ascii',
-            'ISO-8859-1': 'iso-8859-1',
-        }
-        return encoding_map.get(name, name.lower().replace('-', '_'))
+        return self.charset()._codec()
 
     def r_char(self):
         """Read character as int code point for Tokenizer compatibility."""
@@ -1830,58 +1764,35 @@ class BufInStream(InStream):
         return c if c is not None else None
 
     def unread_char(self, c):
-        if not hasattr(self, '_unread_char_stack'):
-            self._unread_char_stack = []
-        self._unread_char_stack.append(int(c))
+        """Push back a character by pushing its encoded bytes.
+
+        Goes straight to this stream's unread stack, so chars can be
+        unread on a ConstBuf stream too.
+        """
+        data = self.charset()._encode(chr(int(c)))
+        self._unread_stack.extend(reversed(data))
         return self
 
     def peek_char(self):
         """Peek character without advancing, using this stream's charset."""
-        if hasattr(self, '_unread_char_stack') and self._unread_char_stack:
-            return self._unread_char_stack[-1]
+        if self._unread_stack:
+            ch = self.read_char()
+            if ch is not None:
+                self.unread_char(ch)
+            return ch
         old_pos = self._buf._pos
         ch = self.read_char()
         self._buf._pos = old_pos
+        self._unread_stack.clear()
         return ch
 
     def read_chars(self, n):
         """Read exactly n characters using this stream's charset."""
-        if n < 0:
-            from .Err import ArgErr
-            raise ArgErr.make(f"readChars n < 0: {n}")
-        chars = []
-        for _ in range(int(n)):
-            ch = self.read_char()
-            if ch is None:
-                from .Err import IOErr
-                raise IOErr.make("Unexpected end of stream")
-            chars.append(chr(ch))
-        return ''.join(chars)
+        return _read_chars(self, n)
 
     def read_line(self, max_chars=None):
         """Read line of text using this stream's charset."""
-        if self._buf._pos >= self._buf._size:
-            return None
-        chars = []
-        count = 0
-        while self._buf._pos < self._buf._size:
-            if max_chars is not None and count >= max_chars:
-                break
-            ch = self.read_char()
-            if ch is None:
-                break
-            if ch == ord('\n'):
-                break
-            if ch == ord('\r'):
-                next_ch = self.peek_char()
-                if next_ch == ord('\n'):
-                    self.read_char()
-                break
-            chars.append(chr(ch))
-            count += 1
-        if not chars and self._buf._pos >= self._buf._size:
-            return None
-        return ''.join(chars)
+        return _read_line(self, max_chars)
 
     def read_all_str(self, normalize=True):
         """Read all remaining as string using this stream's charset.
@@ -1889,14 +1800,7 @@ class BufInStream(InStream):
         Direct implementation that doesn't delegate to _buf.read_all_str(),
         because ConstBuf.read_all_str() throws ReadonlyErr.
         """
-        self._buf._bytes.seek(self._buf._pos)
-        data = self._buf._bytes.read(self._buf._size - self._buf._pos)
-        self._buf._pos = self._buf._size
-        charset_name = self._get_python_encoding()
-        s = data.decode(charset_name)
-        if normalize:
-            s = s.replace('\r\n', '\n').replace('\r', '\n')
-        return s
+        return _read_all_str(self, normalize)
 
     def read_all_lines(self):
         return self._buf.read_all_lines()
@@ -1904,45 +1808,6 @@ class BufInStream(InStream):
     def each_line(self, f):
         self._buf.each_line(f)
 
-    def pipe(self, out, n=None, close=True):
-        """Pipe data from this InStream to an OutStream.
-
-        Args:
-            out: The OutStream to write to
-            n: Number of bytes to pipe (None = all remaining)
-            close: Whether to close this stream when done
-
-        Returns:
-            Number of bytes piped
-
-        Raises:
-            IOErr: If n is specified but not enough bytes available
-        """
-        from .Err import IOErr
-
-        try:
-            total = 0
-            if n is None:
-                # Pipe all remaining
-                while True:
-                    b = self._buf.read()
-                    if b is None:
-                        break
-                    out.write(b)
-                    total += 1
-            else:
-                # Pipe exactly n bytes - throw IOErr if not enough
-                for _ in range(int(n)):
-                    b = self._buf.read()
-                    if b is None:
-                        raise IOErr.make("Unexpected end of stream")
-                    out.write(b)
-                    total += 1
-            return total
-        finally:
-            if close:
-                self.close()
-
     def read_str_token(self, max_chars=None, func=None):
         """Read string token until whitespace or func returns true.
 
@@ -1953,42 +1818,10 @@ class BufInStream(InStream):
         Returns:
             The string token, or None at end of stream
 
-        Note: Uses byte-level read/unread on THIS stream (BufInStream),
-        not the underlying Buf, so that subsequent read() calls see the pushed-back byte.
+        Note: Reads through THIS stream (BufInStream), not the underlying
+        Buf, so that subsequent read() calls see a pushed-back terminator.
         """
-        from .Int import Int
-
-        max_len = int(max_chars) if max_chars is not None else 2147483647
-        if max_len <= 0:
-            return ""
-
-        # Read first byte using THIS stream's read()
-        c = self.read()
-        if c is None:
-            return None
-
-        chars = []
-        while True:
-            # Check termination condition
-            if func is None:
-                terminate = Int.is_space(c)
-            else:
-                terminate = func.call(c)
-
-            if terminate:
-                # Push back byte using THIS stream's unread() so subsequent read() sees it
-                self.unread(c)
-                break
-
-            chars.append(chr(c))
-            if len(chars) >= max_len:
-                break
-
-            c = self.read()
-            if c is None:
-                break
-
-        return ''.join(chars)
+        return _read_str_token(self, max_chars, func)
 
     def read_null_terminated_str(self, max_chars=None):
         """Read string until null byte or max chars.
@@ -1,6 +1,7 @@
 #
 # Charset - Character encoding for Fantom
 #
+import codecs
 from fan.sys.Obj import Obj
 
 
@@ -16,9 +17,22 @@ class Charset(Obj):
     _utf16_le = None
     _iso8859_1 = None
 
+    # Python codec names for Fantom charset names that don't map by rule
+    _CODECS = {
+        'UTF-8': 'utf-8',
+        'UTF-16BE': 'utf-16-be',
+        'UTF-16LE': 'utf-16-le',
+        'UTF-16': 'utf-16',
+        'US-ASCII': 'ascii',
+        'ISO-8859-1': 'iso-8859-1',
+    }
+
     def __init__(self, name):
         """Create a Charset with the given name"""
         self._name = name
+        self._py_codec = Charset._CODECS.get(name, name.lower().replace('-', '_'))
+        self._decoder_factory = None
+        self._encoder = None
 
     @staticmethod
     def make():
@@ -145,6 +159,24 @@ class Charset(Obj):
         """Get the charset name"""
         return self._name
 
+    def _codec(self):
+        """Python codec name for this charset"""
+        return self._py_codec
+
+    def _decoder(self, errors='replace'):
+        """Return a new incremental decoder for this charset"""
+        factory = self._decoder_factory
+        if factory is None:
+            factory = self._decoder_factory = codecs.getincrementaldecoder(self._py_codec)
+        return factory(errors)
+
+    def _encode(self, s):
+        """Encode s to bytes, replacing chars this charset can't represent"""
+        encoder = self._encoder
+        if encoder is None:
+            encoder = self._encoder = codecs.getencoder(self._py_codec)
+        return encoder(s, 'replace')[0]
+
     def to_str(self):
         """String representation"""
         return self._name
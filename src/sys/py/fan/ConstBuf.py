@@ -63,6 +63,9 @@ class ConstBuf(Buf):
     def write(self, b):
         self._readonly_err()
 
+    def _write_bytes(self, data):
+        self._readonly_err()
+
     def write_buf(self, other, n=None):
         self._readonly_err()
 
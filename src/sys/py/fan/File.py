@@ -3,8 +3,10 @@
 # Licensed under the Academic Free License version 3.0
 #
 
+import io
 import os
 import stat
+import struct
 import tempfile
 import shutil
 from pathlib import Path
@@ -695,57 +697,50 @@ class File(Obj):
             mode: "r" for read, "w" for write, "rw" for read/write
 
         Returns:
-            Buf for random access to file contents
+            Memory-mapped FileBuf over the file contents
         """
-        from .Buf import Buf
+        from .FileBuf import FileBuf
+        from .Err import IOErr
 
         if not self._path.exists():
             # Create empty file if it doesn't exist
             self._path.touch()
 
-        # Read existing content
-        data = self._path.read_bytes()
-        buf = Buf(data)
-
-        # Store reference to file for sync operations
-        buf._file = self
-        buf._mode = mode
-
-        return buf
+        try:
+            fp = open(self._path, 'rb' if mode == "r" else 'r+b')
+        except OSError as e:
+            raise IOErr.make(f"Cannot open file: {self._uri}: {e}")
+        return FileBuf(self, fp, mode)
 
     def in_(self, bufSize=None):
-        """Open file for reading, return InStream."""
-        from .Buf import Buf
-        data = self._path.read_bytes() if self._path.exists() else b''
-        buf = Buf(data)
-        return SysInStream(buf)
+        """Open file for reading, return InStream.
+
+        The stream reads through an OS file handle buffered by bufSize,
+        so the file is never loaded into memory as a whole.
+        """
+        from .Err import IOErr
+        try:
+            fp = open(self._path, 'rb', buffering=_buffer_size(bufSize))
+        except OSError as e:
+            raise IOErr.make(f"Cannot open file: {self._uri}: {e}")
+        return SysInStream(fp)
 
     def out(self, append=False, bufSize=None):
-        """Open file for writing, return OutStream."""
-        from .Buf import Buf
+        """Open file for writing, return OutStream.
+
+        The file is opened in append or truncate mode and written through
+        an OS file handle buffered by bufSize.
+        """
         from .Err import IOErr
 
         # Create parent directories if needed
         self._path.parent.mkdir(parents=True, exist_ok=True)
 
-        # Create the file immediately if it doesn't exist (like JavaScript impl)
-        # This ensures f.size() returns 0 right after f.out()
-        if not self._path.exists():
-            self._path.touch()
-
-        # Create a Buf that will write to file on close
-        if append and self._path.exists():
-            data = self._path.read_bytes()
-            buf = Buf(data)
-            buf.seek(buf.size())  # Position at end for append
-        else:
-            buf = Buf()
-
-        # Store reference for writing on close
-        buf._file = self
-        buf._mode = "w"
-
-        return FileOutStream(buf, self._path, append)
+        try:
+            fp = open(self._path, 'ab' if append else 'wb', buffering=_buffer_size(bufSize))
+        except OSError as e:
+            raise IOErr.make(f"Cannot open file: {self._uri}: {e}")
+        return FileOutStream(fp)
 
     def read_all_str(self, normalizeNewlines=True):
         """Read entire file as string.
@@ -781,8 +776,11 @@ class File(Obj):
 
     def each_line(self, callback):
         """Iterate over each line in file."""
-        for line in self.read_all_lines():
-            callback(line)
+        inp = self.in_()
+        try:
+            inp.each_line(callback)
+        finally:
+            inp.close()
 
     def write_props(self, props):
         """Write a properties file format.
@@ -843,7 +841,11 @@ class File(Obj):
             Deserialized object
         """
         from fanx.ObjDecoder import ObjDecoder
-        return ObjDecoder(self.in_(), options).read_obj()
+        inp = self.in_()
+        try:
+            return ObjDecoder(inp, options).read_obj()
+        finally:
+            inp.close()
 
     def write_obj(self, obj, options=None):
         """Write a serialized object to this file.
@@ -936,118 +938,107 @@ class File(Obj):
         raise UnknownSlotErr.make(f"sys::File.{name}")
 
 
+def _buffer_size(bufSize):
+    """Map a Fantom bufSize to a Python buffering size for open()."""
+    if bufSize is None or int(bufSize) < 2:
+        return io.DEFAULT_BUFFER_SIZE
+    return int(bufSize)
+
+
 class SysOutStream(OutStream):
     """SysOutStream - file-backed output stream.
 
     This is returned by File.out() and reports type sys::SysOutStream.
     Extends OutStream (matching JS: SysOutStream extends OutStream)
     so it inherits writeProps, writeXml, writeObj etc.
+
+    Writes go through a buffered OS file handle opened in append or
+    truncate mode. flush() pushes buffered bytes to the OS and sync()
+    additionally forces them to disk with fsync.
     """
 
-    def __init__(self, buf, path, append=False):
+    def __init__(self, fp):
         super().__init__()  # OutStream.__init__ sets _out=None, _charset=None, _endian=None
-        self._buf = buf
-        self._path = path
-        self._append = append
-        self._dirty = append  # Only sync on close if data was actually written
+        self._fp = fp
 
     def typeof(self):
         from .Type import Type
         return Type.find("sys::SysOutStream")
 
+    def _write_struct(self, fmt, value):
+        fmt = ('>' if self.endian().name == "big" else '<') + fmt
+        self._fp.write(struct.pack(fmt, value))
+        return self
+
     def write(self, b):
-        self._dirty = True
-        self._buf.write(b)
+        self._fp.write(bytes((int(b) & 0xFF,)))
+        return self
+
+    def _write_bytes(self, data):
+        self._fp.write(data)
         return self
 
     def write_buf(self, other, n=None):
-        self._dirty = True
-        self._buf.write_buf(other, n)
+        if n is None:
+            n = other.remaining()
+        n = int(n)
+        # Immutable buffers always present their full content from the start
+        if other.is_immutable():
+            data = other._get_data()[:n]
+        else:
+            data = other._read_bytes(n)
+        self._fp.write(data)
         return self
 
     def write_i2(self, x):
-        self._dirty = True
-        self._buf.write_i2(x)
-        return self
+        return self._write_struct('H', int(x) & 0xFFFF)
 
     def write_i4(self, x):
-        self._dirty = True
-        self._buf.write_i4(x)
-        return self
+        return self._write_struct('I', int(x) & 0xFFFFFFFF)
 
     def write_i8(self, x):
-        self._dirty = True
-        self._buf.write_i8(x)
-        return self
+        return self._write_struct('Q', int(x) & 0xFFFFFFFFFFFFFFFF)
 
     def write_f4(self, x):
-        self._dirty = True
-        self._buf.write_f4(x)
-        return self
+        return self._write_struct('f', float(x))
 
     def write_f8(self, x):
-        self._dirty = True
-        self._buf.write_f8(x)
-        return self
+        return self._write_struct('d', float(x))
 
     def write_bool(self, x):
-        self._dirty = True
-        self._buf.write_bool(x)
-        return self
+        return self.write(1 if x else 0)
 
     def write_decimal(self, x):
-        self._dirty = True
-        self._buf.write_decimal(x)
-        return self
+        """Write decimal as string (Fantom serialization)."""
+        return self.write_utf(str(float(x)))
 
     def write_utf(self, s):
-        self._dirty = True
-        self._buf.write_utf(s)
-        return self
-
-    def write_char(self, c):
-        self._dirty = True
-        self._buf.write_char(c)
-        return self
-
-    def write_chars(self, s, off=0, length=None):
-        self._dirty = True
-        self._buf.write_chars(s, off, length)
-        return self
-
-    def print_(self, obj):
-        self._dirty = True
-        self._buf.print_(obj)
-        return self
-
-    print = print_
-
-    def print_line(self, obj=None):
-        self._dirty = True
-        self._buf.print_line(obj)
+        """Write modified UTF-8 string."""
+        data = str(s).encode('utf-8')
+        self.write_i2(len(data))
+        self._fp.write(data)
         return self
 
     def flush(self):
-        self.sync()
+        """Push buffered bytes to the OS."""
+        self._fp.flush()
         return self
 
     def sync(self):
-        """Write buffer content to file (only if data was written)."""
-        if self._dirty:
-            data = self._buf._get_data()
-            self._path.write_bytes(data)
+        """Flush and force written bytes to the storage device."""
+        self._fp.flush()
+        os.fsync(self._fp.fileno())
         return self
 
     def close(self):
-        """Close and write to file if dirty."""
-        self.sync()
-        return True
-
-    def charset(self, val=None):
-        return self._buf.charset(val)
-
-    def endian(self, val=None):
-        return self._buf.endian(val)
+        """Flush and close the file handle."""
+        if self._fp.closed:
+            return True
+        try:
+            self._fp.close()
+            return True
+        except OSError:
+            return False
 
 
 class SysInStream(InStream):
@@ -1056,167 +1047,182 @@ class SysInStream(InStream):
     This is returned by File.in_() and reports type sys::SysInStream.
     Extends InStream (matching JS: SysInStream extends InStream)
     so it inherits readProps, readObj etc.
+
+    Reads through a buffered OS file handle, so memory use is bounded by
+    the buffer size rather than the size of the file. Unread bytes (and the
+    encoded bytes of unread chars) are kept on a small pushback stack.
     """
 
-    def __init__(self, buf):
+    def __init__(self, fp):
         super().__init__()
-        self._buf = buf
+        self._fp = fp
+        self._endian = None
+        self._unread_stack = []  # Stack for unread bytes
 
     def typeof(self):
         from .Type import Type
         return Type.find("sys::SysInStream")
 
     def avail(self):
-        return self._buf.remaining()
+        return len(self._unread_stack) + len(self._fp.peek(1))
 
     def read(self):
-        return self._buf.read()
-
-    def read_buf(self, other, n):
-        return self._buf.read_buf(other, n)
+        if self._unread_stack:
+            return self._unread_stack.pop()
+        b = self._fp.read(1)
+        return b[0] if b else None
+
+    def _read_bytes(self, n):
+        """Read up to n bytes, draining the unread stack first."""
+        stack = self._unread_stack
+        if not stack:
+            return self._fp.read(n)
+        k = min(n, len(stack))
+        head = bytes(reversed(stack[-k:]))
+        del stack[-k:]
+        if k < n:
+            return head + self._fp.read(n - k)
+        return head
+
+    def _peek_bytes(self, n):
+        """Return upcoming bytes from the unread stack or read buffer."""
+        stack = self._unread_stack
+        if stack:
+            return bytes(reversed(stack[-n:]))
+        return self._fp.peek(n)
+
+    def _read_rest(self):
+        """Read all remaining bytes."""
+        head = bytes(reversed(self._unread_stack))
+        self._unread_stack.clear()
+        return head + self._fp.read()
+
+    def _read_fully(self, n):
+        """Read exactly n bytes or raise IOErr."""
+        data = self._read_bytes(n)
+        if len(data) < n:
+            from .Err import IOErr
+            raise IOErr.make("Unexpected end of stream")
+        return data
 
     def unread(self, n):
-        self._buf.unread(n)
+        self._unread_stack.append(int(n) & 0xFF)
         return self
 
     def read_all_buf(self):
-        return self._buf.read_all_buf()
+        from .Buf import Buf
+        try:
+            return Buf(self._read_rest())
+        finally:
+            self.close()
+
+    def read_all_str(self, normalizeNewlines=True):
+        try:
+            return super().read_all_str(normalizeNewlines)
+        finally:
+            self.close()
+
+    def read_props(self):
+        try:
+            from .InStream import StrInStream
+            return StrInStream(super().read_all_str(False)).read_props()
+        finally:
+            self.close()
 
-    def read_buf_fully(self, buf, n):
-        return self._buf.read_buf_fully(buf, n)
+    def read_props_list_vals(self):
+        try:
+            return super().read_props_list_vals()
+        finally:
+            self.close()
 
     def peek(self):
-        return self._buf.peek()
+        if self._unread_stack:
+            return self._unread_stack[-1]
+        b = self._fp.peek(1)
+        return b[0] if b else None
+
+    def _is_big_endian(self):
+        return self.endian().name == "big"
+
+    def _read_struct(self, fmt):
+        fmt = ('>' if self._is_big_endian() else '<') + fmt
+        return struct.unpack(fmt, self._read_fully(struct.calcsize(fmt)))[0]
 
     def read_u1(self):
-        return self._buf.read_u1()
+        return self._read_fully(1)[0]
 
     def read_s1(self):
-        return self._buf.read_s1()
+        b = self.read_u1()
+        return b if b < 128 else b - 256
 
     def read_u2(self):
-        return self._buf.read_u2()
+        return self._read_struct('H')
 
     def read_s2(self):
-        return self._buf.read_s2()
+        return self._read_struct('h')
 
     def read_u4(self):
-        return self._buf.read_u4()
+        return self._read_struct('I')
 
     def read_s4(self):
-        return self._buf.read_s4()
+        return self._read_struct('i')
 
     def read_s8(self):
-        return self._buf.read_s8()
+        return self._read_struct('q')
 
     def read_f4(self):
-        return self._buf.read_f4()
+        return self._read_struct('f')
 
     def read_f8(self):
-        return self._buf.read_f8()
+        return self._read_struct('d')
 
     def read_bool(self):
-        return self._buf.read_bool()
+        return self.read_u1() != 0
 
     def read_utf(self):
-        return self._buf.read_utf()
-
-    def read_char(self):
-        return self._buf.read_char()
-
-    def r_char(self):
-        """Read character as int code point for Tokenizer compatibility."""
-        c = self.read_char()
-        return c if c is not None else None
-
-    def unread_char(self, c):
-        self._buf.unread_char(c)
-        return self
-
-    def peek_char(self):
-        return self._buf.peek_char()
-
-    def read_chars(self, n):
-        return self._buf.read_chars(n)
-
-    def read_line(self, max_chars=None):
-        return self._buf.read_line(max_chars)
-
-    def read_all_str(self, normalize=True):
-        return self._buf.read_all_str(normalize)
+        length = self.read_u2()
+        return self._read_fully(length).decode('utf-8')
 
     def read_all_lines(self):
-        return self._buf.read_all_lines()
+        from .List import List
+        lines = []
+        try:
+            while True:
+                line = self.read_line()
+                if line is None:
+                    break
+                lines.append(line)
+        finally:
+            self.close()
+        return List.from_literal(lines, "sys::Str")
 
     def each_line(self, f):
-        self._buf.each_line(f)
+        try:
+            while True:
+                line = self.read_line()
+                if line is None:
+                    break
+                f(line)
+        finally:
+            self.close()
 
     def skip(self, n):
         """Skip n bytes."""
+        n = int(n)
         skipped = 0
-        for _ in range(int(n)):
-            b = self._buf.read()
-            if b is None:
+        while skipped < n:
+            data = self._read_bytes(min(n - skipped, self._chunk_size))
+            if not data:
                 break
-            skipped += 1
+            skipped += len(data)
         return skipped
 
-    def pipe(self, out, n=None, close=True):
-        """Pipe data from this InStream to an OutStream."""
-        from .Err import IOErr
-        try:
-            total = 0
-            if n is None:
-                while True:
-                    b = self._buf.read()
-                    if b is None:
-                        break
-                    out.write(b)
-                    total += 1
-            else:
-                for _ in range(int(n)):
-                    b = self._buf.read()
-                    if b is None:
-                        raise IOErr.make("Unexpected end of stream")
-                    out.write(b)
-                    total += 1
-            return total
-        finally:
-            if close:
-                self.close()
-
-    def read_str_token(self, max_chars=None, func=None):
-        """Read string token until whitespace or func returns true."""
-        from .Int import Int
-        max_len = int(max_chars) if max_chars is not None else 2147483647
-        if max_len <= 0:
-            return ""
-        c = self._buf.read_char()
-        if c is None:
-            return None
-        chars = []
-        while True:
-            if func is None:
-                terminate = Int.is_space(c)
-            else:
-                terminate = func.call(c)
-            if terminate:
-                self._buf.unread_char(c)
-                break
-            chars.append(chr(c))
-            if len(chars) >= max_len:
-                break
-            c = self._buf.read_char()
-            if c is None:
-                break
-        return ''.join(chars)
-
     def read_null_terminated_str(self, max_chars=None):
         """Read string until null byte or max chars."""
         max_len = int(max_chars) if max_chars is not None else 2147483647
         if max_len <= 0:
             return ""
-        c = self._buf.read_char()
+        c = self.read_char()
         if c is None:
             return None
         chars = []
@@ -1226,24 +1232,29 @@ class SysInStream(InStream):
             chars.append(chr(c))
             if len(chars) >= max_len:
                 break
-            c = self._buf.read_char()
+            c = self.read_char()
             if c is None:
                 break
         return ''.join(chars)
 
     def read_decimal(self):
         """Read decimal as string (Fantom serialization)."""
-        s = self._buf.read_utf()
+        s = self.read_utf()
         from .Decimal import Decimal
         return Decimal.from_str(s)
 
-    def charset(self, val=None):
-        return self._buf.charset(val)
-
     def endian(self, val=None):
-        return self._buf.endian(val)
+        """Get or set endian."""
+        if val is None:
+            if self._endian is None:
+                from .Endian import Endian
+                self._endian = Endian.big()
+            return self._endian
+        self._endian = val
+        return self
 
     def close(self):
+        self._fp.close()
         return True
 
 
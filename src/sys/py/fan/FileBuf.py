@@ -0,0 +1,152 @@
+#
+# Copyright (c) 2025, Brian Frank and Andy Frank
+# Licensed under the Academic Free License version 3.0
+#
+
+import mmap
+import os
+from .Buf import Buf
+
+
+class FileBuf(Buf):
+    """Buf returned from File.open_, backed by a memory-mapped file.
+
+    Reads and writes go straight to the mapping, so a large file is paged
+    in on demand instead of being loaded whole. Writes past the end grow
+    the file; the mapping is grown geometrically and the file is trimmed
+    back to the logical size on sync and close. Reads return bytes copied
+    out of the mapping: a view would pin it (blocking resize and close),
+    and Buf adopts read-only views as shared immutable storage, which
+    would alias file pages that can still change.
+    """
+
+    def __init__(self, file, fp, mode):
+        super().__init__()
+        self._file = file
+        self._fp = fp
+        self._mode = mode
+        self._map = None
+        self._bytes = b''
+        size = os.fstat(fp.fileno()).st_size
+        if size > 0:
+            self._map = self._bytes = mmap.mmap(fp.fileno(), 0, access=self._access())
+        self._size = size
+        self._capacity = size
+
+    def typeof(self):
+        from .Type import Type
+        return Type.find("sys::FileBuf")
+
+    def _access(self):
+        return mmap.ACCESS_READ if self._mode == "r" else mmap.ACCESS_WRITE
+
+    def _check_writable(self):
+        if self._mode == "r":
+            from .Err import IOErr
+            raise IOErr.make("Buf is read-only")
+
+    def _grow(self, n):
+        """Make sure at least n bytes are mapped, growing the file if needed."""
+        self._check_writable()
+        m = self._map
+        if n <= 0 or (m is not None and len(m) >= n):
+            return
+        if m is None:
+            os.ftruncate(self._fp.fileno(), n)
+            self._map = self._bytes = mmap.mmap(self._fp.fileno(), n, access=self._access())
+        else:
+            try:
+                m.resize(max(n, len(m) * 2))
+            except BufferError:
+                from .Err import IOErr
+                raise IOErr.make("Cannot grow Buf while a memoryview is exported")
+            # The resize succeeded, so no view onto the mapping is alive
+            self._exported = False
+        self._capacity = len(self._map)
+
+    def _read_bytes(self, n):
+        """Read up to n bytes from pos, copied out of the mapping."""
+        if self._unread_stack:
+            return super()._read_bytes(n)
+        pos = self._pos
+        end = min(pos + max(int(n), 0), self._size)
+        if end <= pos:
+            return b''
+        self._pos = end
+        return self._map[pos:end]
+
+    def write(self, b):
+        self._check_writable()
+        return super().write(b)
+
+    def set_(self, pos, b):
+        self._check_writable()
+        return super().set_(pos, b)
+
+    def _write_bytes(self, data):
+        self._check_writable()
+        super()._write_bytes(data)
+
+    def _write_struct(self, fmt, value):
+        self._check_writable()
+        super()._write_struct(fmt, value)
+
+    def size(self, val=None):
+        """Get or set size, growing the file if needed."""
+        if val is None:
+            return self._size
+        val = int(val)
+        self._grow(val)
+        if val > self._size:
+            # Regained region reads as zeros, not stale file bytes
+            self._map[self._size:val] = bytes(val - self._size)
+        self._size = val
+        return self
+
+    def clear(self):
+        """Clear buffer; the file is truncated on the next sync."""
+        self._pos = 0
+        self._size = 0
+        return self
+
+    def sync(self):
+        """Trim the file to size and flush the mapping to disk."""
+        m = self._map
+        if m is None or self._mode == "r":
+            return self
+        try:
+            if self._size == 0:
+                m.close()
+                self._map = None
+                self._bytes = b''
+                os.ftruncate(self._fp.fileno(), 0)
+            else:
+                if len(m) != self._size:
+                    m.resize(self._size)
+                m.flush()
+        except BufferError:
+            from .Err import IOErr
+            raise IOErr.make("Cannot sync Buf while a memoryview is exported")
+        self._capacity = self._size
+        return self
+
+    def close(self):
+        """Sync and release the mapping and file handle."""
+        if self._fp.closed:
+            return True
+        from .Err import IOErr
+        ok = True
+        try:
+            self.sync()
+            if self._map is not None:
+                self._map.close()
+                self._map = None
+                self._bytes = b''
+        except (OSError, ValueError, BufferError, IOErr):
+            ok = False
+        # The mapping holds its own descriptor, so the handle can always go
+        try:
+            self._fp.close()
+        except OSError:
+            ok = False
+        return ok
@@ -3,6 +3,8 @@
 # Licensed under the Academic Free License version 3.0
 #
 
+import types
+import weakref
 from .Obj import Obj
 
 
@@ -14,6 +16,12 @@ class Func(Obj):
     # parameter signature is used repeatedly (very common in transpiled code)
     _param_cache = {}
 
+    # Cache of required parameter count for plain Python functions keyed by
+    # code object. Every lambda created from the same source shares one code
+    # object (and therefore the same parameter/default layout), so each one
+    # only pays for inspect.signature() the first time it is seen.
+    _arity_cache = weakref.WeakKeyDictionary()
+
     def __init__(self, func=None, returns=None, params=None, immutable=False):
         super().__init__()
         self._func = func
@@ -370,6 +378,45 @@ class Func(Obj):
         """Wrap a Python callable in a Func"""
         return Func(func)
 
+    @staticmethod
+    def _arity(f):
+        """Get number of required positional parameters for a Func or Python callable.
+
+        Used by the iteration methods (List.each, Map.find, Str.each_while,
+        Int.times, etc) to choose between their |V| and |V,K| call styles.
+        Funcs answer from their param metadata; plain Python functions are
+        introspected once per code object and cached in _arity_cache.
+        """
+        if isinstance(f, Func):
+            return len(f._params)
+        if type(f) is types.FunctionType:
+            code = f.__code__
+            count = Func._arity_cache.get(code)
+            if count is None:
+                count = Func._inspect_arity(f)
+                Func._arity_cache[code] = count
+            return count
+        if type(f) is types.MethodType and type(f.__func__) is types.FunctionType:
+            return max(Func._arity(f.__func__) - 1, 0)
+        return Func._inspect_arity(f)
+
+    @staticmethod
+    def _inspect_arity(f):
+        """Count required positional params via inspect.signature (uncached).
+
+        *args, **kwargs and keyword-only params (such as a bound _self=self)
+        are not counted.
+        """
+        import inspect
+        try:
+            sig = inspect.signature(f)
+            return len([p for p in sig.parameters.values()
+                       if p.kind in (inspect.Parameter.POSITIONAL_ONLY,
+                                     inspect.Parameter.POSITIONAL_OR_KEYWORD)
+                       and p.default is inspect.Parameter.empty])
+        except:
+            return 1
+
     @staticmethod
     def _get_cached_param(name, type_sig):
         """Get or create a cached Param object.
@@ -6,9 +6,22 @@
 from .Obj import Obj
 
 
+def _write_block(out, data):
+    """Write a block of bytes to out, in bulk when it supports it."""
+    write_bytes = getattr(out, '_write_bytes', None)
+    if write_bytes is not None:
+        write_bytes(data)
+    else:
+        for b in data:
+            out.write(b)
+
+
 class InStream(Obj):
     """Input stream for reading text/binary data"""
 
+    # Block size used by the bulk read_buf/read_all_buf/pipe paths
+    _chunk_size = 64 * 1024
+
     def __init__(self, in_stream=None):
         """
         Initialize InStream.
@@ -46,21 +59,12 @@ class InStream(Obj):
     def read_all_str(self, normalizeNewlines=True):
         """Read entire stream as a string.
 
-        For wrapped streams, read character by character using THIS stream's charset,
-        not the wrapped stream's charset. This ensures proper charset isolation.
+        Decodes with THIS stream's charset, not the wrapped stream's charset,
+        so charset isolation is preserved for wrapped streams.
         """
-        # Read all chars using this stream's charset
-        chars = []
-        while True:
-            c = self.read_char()
-            if c is None:
-                break
-            chars.append(chr(c))
-        content = ''.join(chars)
-
-        if normalizeNewlines:
-            content = content.replace('\r\n', '\n').replace('\r', '\n')
-        return content
+        if isinstance(self._in, StrInStream):
+            return self._in.read_all_str(normalizeNewlines)
+        return _read_all_str(self, normalizeNewlines)
 
     def read_all_lines(self):
         """Read all lines from stream"""
@@ -73,7 +77,15 @@ class InStream(Obj):
             # Otherwise it's a raw Python stream
             content = self._in.read()
         else:
-            content = ""
+            # Block stream (gzip, zip entry...): go through the text layer
+            from .List import List
+            lines = []
+            while True:
+                line = _read_line(self, None)
+                if line is None:
+                    break
+                lines.append(line)
+            return List.from_literal(lines, "sys::Str")
 
         if isinstance(content, bytes):
             content = content.decode('utf-8')
@@ -87,40 +99,20 @@ class InStream(Obj):
     def read_line(self, max_chars=None):
         """Read a single line from stream.
 
-        Uses self.read_char() to respect subclass overrides (e.g., ChunkInStream).
         Handles both \n and \r\n line endings, stripping the terminator.
-        Returns None at end of stream.
+        Returns None at end of stream. Streams that can look ahead are
+        decoded a window at a time; others go through self.read_char() so
+        subclass overrides (e.g., ChunkInStream) are respected.
         """
-        max_len = int(max_chars) if max_chars is not None else 2147483647
-        if max_len <= 0:
-            return ""
-
-        # Read first character
-        c = self.read_char()
-        if c is None:
-            return None
+        return _read_line(self, max_chars)
 
-        chars = []
+    def each_line(self, f):
+        """Call f with each line until end of stream."""
         while True:
-            # Check for newlines
-            if c == ord('\n'):  # \n
-                break
-            if c == ord('\r'):  # \r
-                # Check for \r\n
-                next_c = self.read_char()
-                if next_c is not None and next_c != ord('\n'):
-                    self.unread_char(next_c)
-                break
-
-            chars.append(chr(c))
-            if len(chars) >= max_len:
-                break
-
-            c = self.read_char()
-            if c is None:
+            line = self.read_line()
+            if line is None:
                 break
-
-        return ''.join(chars)
+            f(line)
 
     def read_char(self):
         """Read a single character, return as Int (unicode code point) or None at end.
@@ -132,68 +124,18 @@ class InStream(Obj):
         # Check if wrapped stream is a character stream (StrInStream)
         if self._in is not None and isinstance(self._in, StrInStream):
             return self._in.read_char()
+        return _read_char(self)
 
-        # For binary streams, use self.read() to get bytes (respects overrides)
-        charset_name = self._get_python_encoding()
+    def read_chars(self, n):
+        """Read exactly n characters.
 
-        if 'utf-16' in charset_name.lower():
-            # UTF-16 is 2 bytes per char
-            b1 = self.read()
-            if b1 is None:
-                return None
-            b2 = self.read()
-            if b2 is None:
-                return None
-            data = bytes([b1, b2])
-            try:
-                ch = data.decode(charset_name)
-                return ord(ch[0]) if ch else None
-            except:
-                return None
-        else:
-            # UTF-8 and others: variable length
-            b = self.read()
-            if b is None:
-                return None
-            # For UTF-8, handle multi-byte chars
-            if b < 0x80:
-                return b
-            elif b < 0xE0:
-                b2 = self.read()
-                if b2 is None:
-                    return None
-                data = bytes([b, b2])
-            elif b < 0xF0:
-                b2 = self.read()
-                b3 = self.read()
-                if b2 is None or b3 is None:
-                    return None
-                data = bytes([b, b2, b3])
-            else:
-                b2 = self.read()
-                b3 = self.read()
-                b4 = self.read()
-                if b2 is None or b3 is None or b4 is None:
-                    return None
-                data = bytes([b, b2, b3, b4])
-            try:
-                ch = data.decode(charset_name)
-                return ord(ch[0]) if ch else None
-            except:
-                return None
+        Throws IOErr if fewer than n characters are available.
+        """
+        return _read_chars(self, n)
 
     def _get_python_encoding(self):
         """Get Python encoding name for this stream's charset."""
-        name = self._get_charset().name()
-        encoding_map = {
-            'UTF-8': 'utf-8',
-            'UTF-16BE': 'utf-16-be',
-            'UTF-16LE': 'utf-16-le',
-            'UTF-16': 'utf-16',
-            'US-ASCII': 'ascii',
-            'ISO-8859-1': 'iso-8859-1',
-        }
-        return encoding_map.get(name, name.lower().replace('-', '_'))
+        return self._get_charset()._codec()
 
     def read(self):
         """Read a single byte, return as Int or None at end"""
@@ -209,24 +151,52 @@ class InStream(Obj):
             return b[0] if b else None
         return None
 
-    def read_buf(self, buf, n):
-        """Read up to n bytes into buf, return bytes read or None at end.
+    def _read_bytes(self, n):
+        """Read up to n bytes as a bytes-like object, empty at end of stream.
 
-        Uses self.read() to respect subclass overrides.
+        This is the bulk-transfer primitive behind read_buf, read_buf_fully,
+        read_all_buf and pipe. The default pulls bytes through self.read()
+        so subclasses that only override read() keep working; streams with
+        a native block source override it.
         """
-        n = int(n)
-        if n <= 0:
-            return 0
-
-        bytes_read = 0
+        if type(self).read is InStream.read:
+            if self._in is not None and hasattr(self._in, '_read_bytes'):
+                return self._in._read_bytes(n)
+            if hasattr(self, '_stream'):
+                data = self._stream.read(n)
+                return data.encode('utf-8') if isinstance(data, str) else data
+        data = bytearray()
+        read = self.read
         for _ in range(n):
-            b = self.read()
+            b = read()
             if b is None:
                 break
-            buf.write(b)
-            bytes_read += 1
+            data.append(b)
+        return bytes(data)
+
+    def _peek_bytes(self, n):
+        """Return up to n upcoming bytes without consuming them.
 
-        return bytes_read if bytes_read > 0 else None
+        Returns None if this stream can't look ahead, in which case the text
+        paths fall back to reading char by char. The default only passes
+        through to a wrapped stream when read() and unread() aren't
+        overridden; streams with a native look-ahead buffer override it.
+        """
+        if type(self).read is InStream.read and type(self).unread is InStream.unread:
+            if self._in is not None and hasattr(self._in, '_peek_bytes'):
+                return self._in._peek_bytes(n)
+        return None
+
+    def read_buf(self, buf, n):
+        """Read up to n bytes into buf, return bytes read or None at end."""
+        n = int(n)
+        if n <= 0:
+            return 0
+        data = self._read_bytes(n)
+        if not data:
+            return None
+        buf._write_bytes(data)
+        return len(data)
 
     def read_buf_fully(self, buf, n):
         """Read exactly n bytes into buf, then flip buf for reading.
@@ -239,13 +209,13 @@ class InStream(Obj):
             from .Buf import Buf
             buf = Buf.make(n)
 
-        bytes_read = 0
-        for _ in range(n):
-            b = self.read()
-            if b is None:
+        remaining = n
+        while remaining > 0:
+            data = self._read_bytes(min(remaining, self._chunk_size))
+            if not data:
                 raise IOErr.make("Unexpected end of stream")
-            buf.write(b)
-            bytes_read += 1
+            buf._write_bytes(data)
+            remaining -= len(data)
 
         buf.flip()
         return buf
@@ -255,10 +225,10 @@ class InStream(Obj):
         from .Buf import Buf
         buf = Buf.make()
         while True:
-            b = self.read()
-            if b is None:
+            data = self._read_bytes(self._chunk_size)
+            if not data:
                 break
-            buf.write(b)
+            buf._write_bytes(data)
         buf.flip()
         return buf
 
@@ -352,45 +322,18 @@ class InStream(Obj):
         Returns:
             Token string, or None at end of stream.
         """
-        from .Int import Int
-
-        max_len = int(max_chars) if max_chars is not None else 2147483647
-        if max_len <= 0:
-            return ""
-
-        # Read first char
-        c = self.read_char()
-        if c is None:
-            return None
-
-        chars = []
-        while True:
-            # Check termination
-            if func is None:
-                terminate = Int.is_space(c)
-            else:
-                terminate = func.call(c) if hasattr(func, 'call') else func(c)
-
-            if terminate:
-                # Push back the terminator
-                self.unread_char(c)
-                break
-
-            chars.append(chr(c))
-            if len(chars) >= max_len:
-                break
-
-            c = self.read_char()
-            if c is None:
-                break
-
-        return ''.join(chars)
+        return _read_str_token(self, max_chars, func)
 
     def unread_char(self, c):
-        """Push back a character"""
-        if self._in is not None and hasattr(self._in, 'unread_char'):
+        """Push back a character.
+
+        The char is encoded with this stream's charset and its bytes are
+        pushed back with unread(), so byte and char reads stay in step.
+        """
+        if isinstance(self._in, StrInStream):
             return self._in.unread_char(c)
-        # Default implementation - may not be supported
+        for b in reversed(self._get_charset()._encode(chr(int(c)))):
+            self.unread(b)
         return self
 
     def read_props(self):
@@ -403,7 +346,8 @@ class InStream(Obj):
         elif self._in is not None:
             return self._in.read_props()
         else:
-            return result
+            # Block stream: decode with our charset and use the full parser
+            return StrInStream(_read_all_str(self, False)).read_props()
 
         if isinstance(content, bytes):
             content = content.decode('utf-8')
@@ -452,6 +396,8 @@ class InStream(Obj):
                         break
                     data += bytes([b])
                 content = data.decode('utf-8')
+        else:
+            content = _read_all_str(self, True)
 
         if isinstance(content, bytes):
             content = content.decode('utf-8')
@@ -494,27 +440,57 @@ class InStream(Obj):
 
         try:
             total = 0
-            if n is None:
-                # Pipe all remaining
-                while True:
-                    b = self.read()
-                    if b is None:
-                        break
-                    out.write(b)
-                    total += 1
-            else:
-                # Pipe exactly n bytes
-                for _ in range(int(n)):
-                    b = self.read()
-                    if b is None:
+            remaining = None if n is None else int(n)
+            while remaining is None or remaining > 0:
+                size = self._chunk_size
+                if remaining is not None:
+                    size = min(size, remaining)
+                data = self._read_bytes(size)
+                if not data:
+                    if remaining is not None:
                         raise IOErr.make("Unexpected end of stream")
-                    out.write(b)
-                    total += 1
+                    break
+                _write_block(out, data)
+                total += len(data)
+                if remaining is not None:
+                    remaining -= len(data)
             return total
         finally:
             if close:
                 self.close()
 
+    def _crc(self, algorithm, n=None, seed=None):
+        """Compute a CRC checksum over the bytes read from this stream.
+
+        Reads in chunks, so memory use is constant. Pass the result of a
+        previous call as seed to continue a checksum across streams or
+        packets. The stream is left open. This is intentionally internal,
+        since sys::InStream declares no crc.
+
+        Args:
+            algorithm: "CRC-16", "CRC-32" or "CRC-32-Adler"
+            n: Number of bytes to read (None = until end of stream)
+            seed: Checksum to continue from (None = start fresh)
+
+        Returns:
+            The checksum as an Int
+        """
+        update, crc = _crc_algorithm(algorithm)
+        if seed is not None:
+            crc = int(seed)
+        remaining = None if n is None else int(n)
+        while remaining is None or remaining > 0:
+            size = self._chunk_size
+            if remaining is not None:
+                size = min(size, remaining)
+            data = self._read_bytes(size)
+            if not data:
+                break
+            crc = update(data, crc)
+            if remaining is not None:
+                remaining -= len(data)
+        return crc
+
     def close(self):
         """Close the stream"""
         if self._in is not None and hasattr(self._in, 'close'):
@@ -950,3 +926,323 @@ class StrInStream(InStream):
                 pod_name = parts[1]  # 'web', 'sys', etc.
                 return Type.find(f"{pod_name}::{class_name}")
         return Type.find(f"sys::{class_name}")
+
+
+#################################################################
+# Text Decoding
+#################################################################
+
+# Python encodings where every byte < 0x80 decodes to the same code point
+_ASCII_COMPATIBLE = frozenset(('utf-8', 'ascii', 'iso-8859-1'))
+
+# Stateless codecs that round-trip valid text and encode '\n' and '\r' as a
+# single fixed-width code unit, mapped to those encoded terminators. For
+# these the text paths can scan raw bytes for terminators and map decoded
+# chars back to a byte count, so they decode whole windows at a time.
+_WINDOW_CODECS = {
+    codec: ('\n'.encode(codec), '\r'.encode(codec))
+    for codec in ('utf-8', 'ascii', 'iso-8859-1', 'utf-16-be', 'utf-16-le')
+}
+
+# Initial look-ahead windows for line and token scans; doubled up to
+# InStream._chunk_size while no terminator turns up
+_TEXT_WINDOW = 1024
+_TOKEN_WINDOW = 64
+
+
+def _read_char(src):
+    """Read one char from src using its charset, or None at end of stream.
+
+    src is anything with read(), charset() and unread_char(). Bytes are fed
+    to an incremental decoder until it yields a char; ASCII short-circuits.
+    """
+    b = src.read()
+    if b is None:
+        return None
+    cs = src.charset()
+    if b < 0x80 and cs._codec() in _ASCII_COMPATIBLE:
+        return b
+    dec = cs._decoder()
+    s = dec.decode(bytes((b,)))
+    while not s:
+        b = src.read()
+        if b is None:
+            s = dec.decode(b'', True)
+            break
+        s = dec.decode(bytes((b,)))
+    if not s:
+        return None
+    # A malformed sequence can flush a replacement char plus the next char
+    for ch in reversed(s[1:]):
+        src.unread_char(ord(ch))
+    return ord(s[0])
+
+
+def _find_unit(data, pat, start):
+    """Index of pat in data at an offset aligned to len(pat) from start."""
+    unit = len(pat)
+    i = data.find(pat, start)
+    while i >= 0 and (i - start) % unit:
+        i = data.find(pat, i + 1)
+    return i
+
+
+def _read_line(src, max_chars):
+    """Read a line from src, stripping the terminator; None at end.
+
+    Streams that can look ahead (see InStream._peek_bytes) are scanned a
+    window at a time for the terminator bytes and the line is decoded in
+    bulk; everything else goes char by char. Windows may be any length
+    (short raw reads, odd buffer sizes), so for multi-byte charsets the
+    trailing partial unit of a window is carried into the next scan.
+    """
+    cs = src.charset()
+    codec = cs._codec()
+    eol = _WINDOW_CODECS.get(codec) if max_chars is None else None
+    window = src._peek_bytes(_TEXT_WINDOW) if eol is not None else None
+    if window is None:
+        return _read_line_chars(src, max_chars)
+    if not window:
+        return None
+    nl, cr = eol
+    unit = len(nl)
+    dec = None      # only needed once a line spans more than one window
+    carry = b''     # consumed bytes short of a whole unit
+    size = _TEXT_WINDOW
+    parts = []
+    while window:
+        data = carry + window if carry else window
+        i = _find_unit(data, nl, 0)
+        j = _find_unit(data, cr, 0)
+        if i < 0 or 0 <= j < i:
+            i = j
+        if i < 0:
+            if dec is None:
+                dec = cs._decoder()
+            whole = len(data) - len(data) % unit
+            src._read_bytes(len(window))
+            parts.append(dec.decode(data[:whole]))
+            carry = bytes(data[whole:])
+            size = min(size * 2, InStream._chunk_size)
+            window = src._peek_bytes(size)
+            continue
+        line = data[:i]
+        # Consume the line and terminator, less what is already carried
+        src._read_bytes(i + unit - len(carry))
+        if data[i:i + unit] == cr:
+            _skip_unit(src, nl)
+        if dec is None:
+            return str(line, codec, 'replace')
+        parts.append(dec.decode(line, True))
+        return ''.join(parts)
+    if carry:
+        parts.append(dec.decode(carry))
+    parts.append(dec.decode(b'', True))
+    return ''.join(parts)
+
+
+def _skip_unit(src, pat):
+    """Consume pat if it is next in src, reading past short peeks."""
+    unit = len(pat)
+    nxt = src._peek_bytes(unit)
+    if len(nxt) >= unit or not nxt:
+        if nxt and nxt[:unit] == pat:
+            src._read_bytes(unit)
+        return
+    got = b''
+    while len(got) < unit:
+        more = src._read_bytes(unit - len(got))
+        if not more:
+            break
+        got += more
+    if got != pat:
+        for b in reversed(got):
+            src.unread(b)
+
+
+def _read_line_chars(src, max_chars):
+    """Char-at-a-time read_line used when src can't look ahead."""
+    max_len = int(max_chars) if max_chars is not None else 2147483647
+    if max_len <= 0:
+        return ""
+    c = src.read_char()
+    if c is None:
+        return None
+    chars = []
+    while True:
+        if c == 10:  # \n
+            break
+        if c == 13:  # \r
+            next_c = src.read_char()
+            if next_c is not None and next_c != 10:
+                src.unread_char(next_c)
+            break
+        chars.append(chr(c))
+        if len(chars) >= max_len:
+            break
+        c = src.read_char()
+        if c is None:
+            break
+    return ''.join(chars)
+
+
+def _read_all_str(src, normalize):
+    """Decode the rest of src in chunks."""
+    dec = src.charset()._decoder()
+    parts = []
+    while True:
+        data = src._read_bytes(InStream._chunk_size)
+        if not data:
+            break
+        parts.append(dec.decode(data))
+    parts.append(dec.decode(b'', True))
+    s = ''.join(parts)
+    if normalize:
+        s = s.replace('\r\n', '\n').replace('\r', '\n')
+    return s
+
+
+def _peek_text(src, cs, size):
+    """Strictly decode up to size upcoming bytes without consuming them.
+
+    Returns the complete chars at the front of the window, or None if src
+    can't look ahead, is at end, or the bytes don't decode cleanly (the
+    callers then fall back to reading char by char).
+    """
+    window = src._peek_bytes(size)
+    if not window:
+        return None
+    try:
+        return cs._decoder('strict').decode(window)
+    except UnicodeDecodeError:
+        return None
+
+
+def _read_chars(src, n):
+    """Read exactly n chars from src or raise IOErr."""
+    if n < 0:
+        from .Err import ArgErr
+        raise ArgErr.make(f"readChars n < 0: {n}")
+    n = int(n)
+    cs = src.charset()
+    codec = cs._codec()
+    parts = []
+    if codec in _WINDOW_CODECS:
+        while n > 0:
+            text = _peek_text(src, cs, min(max(n * 4, _TEXT_WINDOW), InStream._chunk_size))
+            if not text:
+                break
+            text = text[:n]
+            src._read_bytes(len(text.encode(codec)))
+            parts.append(text)
+            n -= len(text)
+    for _ in range(n):
+        c = src.read_char()
+        if c is None:
+            from .Err import IOErr
+            raise IOErr.make("Unexpected end of stream")
+        parts.append(chr(c))
+    return ''.join(parts)
+
+
+def _read_str_token(src, max_chars, func):
+    """Read chars from src until func (default Int.is_space) matches one.
+
+    The terminating char is left unread. Returns None at end of stream.
+    """
+    from .Int import Int
+    max_len = int(max_chars) if max_chars is not None else 2147483647
+    if max_len <= 0:
+        return ""
+    if func is None:
+        terminates = Int.is_space
+    elif hasattr(func, 'call'):
+        terminates = func.call
+    else:
+        terminates = func
+    cs = src.charset()
+    codec = cs._codec()
+    parts = []
+    count = 0
+    if codec in _WINDOW_CODECS:
+        size = _TOKEN_WINDOW
+        while count < max_len:
+            text = _peek_text(src, cs, size)
+            if not text:
+                break
+            lim = min(len(text), max_len - count)
+            i = 0
+            while i < lim and not terminates(ord(text[i])):
+                i += 1
+            if i:
+                src._read_bytes(len(text[:i].encode(codec)))
+                parts.append(text[:i])
+                count += i
+            if i < lim:
+                return ''.join(parts)
+            size = min(size * 2, InStream._chunk_size)
+    while count < max_len:
+        c = src.read_char()
+        if c is None:
+            if not parts:
+                return None
+            break
+        if terminates(c):
+            src.unread_char(c)
+            break
+        parts.append(chr(c))
+        count += 1
+    return ''.join(parts)
+
+
+#################################################################
+# Checksums
+#################################################################
+
+def _crc16_table():
+    """CRC-16 (reflected 0xA001, as used by Modbus) for each byte value."""
+    table = []
+    for b in range(256):
+        crc = b
+        for _ in range(8):
+            crc = (crc >> 1) ^ 0xA001 if crc & 1 else crc >> 1
+        table.append(crc)
+    return tuple(table)
+
+
+_CRC16_TABLE = _crc16_table()
+
+
+def _crc16(data, crc=0xFFFF):
+    """Update a CRC-16 checksum with data, one table lookup per byte."""
+    table = _CRC16_TABLE
+    for b in data:
+        crc = (crc >> 8) ^ table[(crc ^ b) & 0xFF]
+    return crc
+
+
+def _crc32(data, crc=0):
+    import zlib
+    return zlib.crc32(data, crc) & 0xFFFFFFFF
+
+
+def _adler32(data, crc=1):
+    import zlib
+    return zlib.adler32(data, crc) & 0xFFFFFFFF
+
+
+# Algorithm name -> (update function, initial value)
+_CRC_ALGORITHMS = {
+    "CRC-16": (_crc16, 0xFFFF),
+    "CRC-32": (_crc32, 0),
+    "CRC-32-Adler": (_adler32, 1),
+}
+
+
+def _crc_algorithm(algorithm):
+    """Return (update, initial value) for a CRC algorithm name."""
+    entry = _CRC_ALGORITHMS.get(algorithm)
+    if entry is None:
+        from .Err import ArgErr
+        raise ArgErr.make(f"Unknown CRC algorithm: {algorithm}")
+    return entry
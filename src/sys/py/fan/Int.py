@@ -4,6 +4,7 @@
 #
 
 from .Num import Num
+from .Func import Func
 from .Type import _camel_to_snake
 
 
@@ -218,28 +219,11 @@ class Int(Num):
         """Iterate f(i) from 0 to self-1
         If closure accepts arg, pass i. If not, call without args.
         """
-        # Check if f is a Func instance - use its params() method
-        from .Func import Func
-        if isinstance(f, Func):
-            accepts_arg = len(f.params()) > 0
-        else:
-            import inspect
-            try:
-                # Check how many positional parameters the function accepts
-                sig = inspect.signature(f)
-                # Count positional params (exclude keyword-only params with defaults like _self=self)
-                pos_params = [p for p in sig.parameters.values()
-                              if p.kind in (inspect.Parameter.POSITIONAL_ONLY,
-                                           inspect.Parameter.POSITIONAL_OR_KEYWORD)
-                              and p.default is inspect.Parameter.empty]
-                accepts_arg = len(pos_params) > 0
-            except (ValueError, TypeError):
-                accepts_arg = True  # Default to passing arg
-
-        for i in range(self):
-            if accepts_arg:
+        if Func._arity(f) > 0:
+            for i in range(self):
                 f(i)
-            else:
+        else:
+            for i in range(self):
                 f()
 
     # Parsing
@@ -7,6 +7,7 @@
 
 from collections.abc import MutableSequence
 from .Obj import Obj
+from .Func import Func
 
 
 class List(Obj, MutableSequence):
@@ -588,14 +589,9 @@ class List(Obj, MutableSequence):
     def remove_all(self, items):
         """Remove all occurrences of items"""
         self._check_readonly()
-        from .ObjUtil import ObjUtil
-        for item in items:
-            i = 0
-            while i < len(self._values):
-                if ObjUtil.equals(self._values[i], item):
-                    self._values.pop(i)
-                else:
-                    i += 1
+        toRemove = _HashSet(items)
+        if len(toRemove) > 0:
+            self._values[:] = [x for x in self._values if x not in toRemove]
         self._roView = None
         return self
 
@@ -663,16 +659,7 @@ class List(Obj, MutableSequence):
     @staticmethod
     def _get_param_count(f):
         """Get number of required parameters for a function"""
-        from .Func import Func
-        if isinstance(f, Func):
-            return len(f.params())
-        import inspect
-        try:
-            sig = inspect.signature(f)
-            return len([p for p in sig.parameters.values()
-                       if p.default is inspect.Parameter.empty])
-        except:
-            return 1
+        return Func._arity(f)
 
     def each(self, f):
         """Iterate over each element, optionally with index"""
@@ -1051,34 +1038,24 @@ class List(Obj, MutableSequence):
 
     def unique(self):
         """Return list with duplicates removed"""
-        from .ObjUtil import ObjUtil
-        seen = []
-        result = []
-        for item in self._values:
-            found = False
-            for s in seen:
-                if ObjUtil.equals(s, item):
-                    found = True
-                    break
-            if not found:
-                seen.append(item)
-                result.append(item)
+        seen = _HashSet()
+        result = [item for item in self._values if seen.add(item)]
         return List.from_literal(result, self._elementType if self._elementType else "sys::Obj")
 
     def union(self, that):
         """Return union of two lists"""
-        result_list = self.unique()
+        seen = _HashSet()
+        result = [item for item in self._values if seen.add(item)]
         for item in that:
-            if not result_list.contains(item):
-                result_list._values.append(item)
-        return result_list
+            if seen.add(item):
+                result.append(item)
+        return List.from_literal(result, self._elementType if self._elementType else "sys::Obj")
 
     def intersection(self, that):
         """Return intersection of two lists"""
-        result = []
-        for item in self._values:
-            if item in that and item not in result:
-                result.append(item)
+        other = _HashSet(that)
+        seen = _HashSet()
+        result = [item for item in self._values if item in other and seen.add(item)]
         return List.from_literal(result, self._elementType if self._elementType else "sys::Obj")
 
     def group_by(self, f):
@@ -1278,6 +1255,85 @@ class List(Obj, MutableSequence):
 
 
 
+#################################################################
+# _HashSet - Hash-bucketed set using Fantom equality
+#################################################################
+
+class _HashSet:
+    """Set of Fantom values used by unique, union, intersection and removeAll.
+
+    Items are bucketed by ObjUtil.hash and matches are confirmed with
+    ObjUtil.equals, so membership follows Fantom equality rather than
+    Python's: NaN never matches (not even itself), null matches null, and
+    Lists/Maps compare by content via their hash_/equals. Items that cannot
+    be hashed fall back to a linear scan. Bools are bucketed as 0/1 since
+    ObjUtil.equals matches them with the equal Int (as contains does)
+    while ObjUtil.hash does not.
+    """
+
+    __slots__ = ('_buckets', '_unhashable', '_size', '_hash', '_equals')
+
+    def __init__(self, items=None):
+        from .ObjUtil import ObjUtil
+        self._buckets = {}    # hash -> [items]
+        self._unhashable = []  # items that failed to hash
+        self._size = 0
+        self._hash = ObjUtil.hash
+        self._equals = ObjUtil.equals
+        if items is not None:
+            for item in items:
+                self.add(item)
+
+    def __len__(self):
+        return self._size
+
+    def _hash_of(self, item):
+        if type(item) is bool:
+            return int(item)
+        try:
+            h = self._hash(item)
+            hash(h)
+            return h
+        except TypeError:
+            return None
+
+    def __contains__(self, item):
+        equals = self._equals
+        h = self._hash_of(item)
+        if h is None:
+            for x in self._unhashable:
+                if equals(x, item):
+                    return True
+            return False
+        bucket = self._buckets.get(h)
+        if bucket is not None:
+            for x in bucket:
+                if equals(x, item):
+                    return True
+        return False
+
+    def add(self, item):
+        """Add item if not already present, return True if it was added"""
+        equals = self._equals
+        h = self._hash_of(item)
+        if h is None:
+            for x in self._unhashable:
+                if equals(x, item):
+                    return False
+            self._unhashable.append(item)
+        else:
+            bucket = self._buckets.get(h)
+            if bucket is None:
+                self._buckets[h] = [item]
+            else:
+                for x in bucket:
+                    if equals(x, item):
+                        return False
+                bucket.append(item)
+        self._size += 1
+        return True
+
+
 #################################################################
 # ImmutableList - Immutable version of List
 #################################################################
@@ -7,6 +7,7 @@
 
 from collections.abc import MutableMapping
 from .Obj import Obj
+from .Func import Func
 
 # Known Issues:
 # - ro() does not behave the same as the Java impl. Java creates
@@ -34,6 +35,7 @@ class Map(Obj, MutableMapping):
         self._immutable = False  # Immutable flag (distinct from ro)
         self._ordered = False  # Ordered flag
         self._caseInsensitive = False  # Case-insensitive keys
+        self._ciKeys = None  # Folded key -> actual key index (lazy)
         self._keyType = None  # Fantom key type
         self._valueType = None  # Fantom value type
         self._mapType = None  # Cached MapType
@@ -48,12 +50,26 @@ class Map(Obj, MutableMapping):
         if key in self._map:
             return key
         if self._caseInsensitive and isinstance(key, str):
-            key_lower = key.lower()
-            for k in self._map:
-                if isinstance(k, str) and k.lower() == key_lower:
-                    return k
+            return self._ci_index().get(key.lower())
         return None
 
+    def _ci_index(self):
+        """Get the folded key index for a case-insensitive map.
+
+        Maps lowercased keys to the key as originally stored so lookups are
+        a single dict probe. The index is built lazily from _map the first
+        time it is needed (result maps are often filled via _map directly),
+        and from then on kept in sync by __setitem__, __delitem__ and clear.
+        """
+        index = self._ciKeys
+        if index is None:
+            index = {}
+            for k in self._map:
+                if isinstance(k, str):
+                    index[k.lower()] = k
+            self._ciKeys = index
+        return index
+
     def __getitem__(self, key):
         """Get value by key, return default/null if not found"""
         actual_key = self._find_key(key)
@@ -75,10 +91,13 @@ class Map(Obj, MutableMapping):
         self._roView = None
         # Handle case-insensitive keys
         if self._caseInsensitive and isinstance(key, str):
-            actual_key = self._find_key(key)
+            index = self._ci_index()
+            folded = key.lower()
+            actual_key = index.get(folded)
             if actual_key is not None:
                 self._map[actual_key] = value
                 return
+            index[folded] = key
         self._map[key] = value
 
     def __delitem__(self, key):
@@ -88,6 +107,8 @@ class Map(Obj, MutableMapping):
         actual_key = self._find_key(key)
         if actual_key is not None:
             del self._map[actual_key]
+            if self._ciKeys is not None and isinstance(actual_key, str):
+                self._ciKeys.pop(actual_key.lower(), None)
         else:
             del self._map[key]  # Will raise KeyError if not found
 
@@ -315,6 +336,7 @@ class Map(Obj, MutableMapping):
             from .Err import UnsupportedErr
             raise UnsupportedErr.make("Map cannot be caseInsensitive and ordered")
         self._caseInsensitive = val
+        self._ciKeys = None
 
     #################################################################
     # Accessor Methods
@@ -437,6 +459,7 @@ class Map(Obj, MutableMapping):
         """Clear all entries"""
         self._check_readonly()
         self._map.clear()
+        self._ciKeys = None
         self._roView = None
         return self
 
@@ -501,16 +524,7 @@ class Map(Obj, MutableMapping):
     @staticmethod
     def _get_param_count(f):
         """Get number of required parameters for a function"""
-        from .Func import Func
-        if isinstance(f, Func):
-            return len(f.params())
-        import inspect
-        try:
-            sig = inspect.signature(f)
-            return len([p for p in sig.parameters.values()
-                       if p.default is inspect.Parameter.empty])
-        except:
-            return 1
+        return Func._arity(f)
 
     def each(self, f):
         """Iterate over entries - supports |V| or |V,K| closures"""
@@ -727,6 +741,8 @@ class Map(Obj, MutableMapping):
         result._mapType = self._mapType
         result._ordered = self._ordered
         result._caseInsensitive = self._caseInsensitive
+        if self._ciKeys is not None:
+            result._ciKeys = dict(self._ciKeys)
         result._def = self._def
         return result
 
@@ -760,6 +776,8 @@ class Map(Obj, MutableMapping):
         result._mapType = self._mapType
         result._ordered = self._ordered
         result._caseInsensitive = self._caseInsensitive
+        if self._ciKeys is not None:
+            result._ciKeys = dict(self._ciKeys)
         result._def = self._def
         result._ro = False
         return result
@@ -784,6 +802,8 @@ class Map(Obj, MutableMapping):
         result._caseInsensitive = self._caseInsensitive
         for k, v in self._map.items():
             result._map[k] = ObjUtil.to_immutable(v)
+        if self._ciKeys is not None:
+            result._ciKeys = dict(self._ciKeys)
         return result
 
     #################################################################
@@ -904,6 +924,8 @@ class ReadOnlyMap(Map):
         self._mapType = source._mapType
         self._ordered = source._ordered
         self._caseInsensitive = source._caseInsensitive
+        if source._ciKeys is not None:
+            self._ciKeys = dict(source._ciKeys)
         self._def = source._def
 
     def _check_readonly(self):
@@ -928,6 +950,8 @@ class ReadOnlyMap(Map):
         result._mapType = self._mapType
         result._ordered = self._ordered
         result._caseInsensitive = self._caseInsensitive
+        if self._ciKeys is not None:
+            result._ciKeys = dict(self._ciKeys)
         result._def = self._def
         result._ro = False
         return result
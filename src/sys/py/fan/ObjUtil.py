@@ -9,6 +9,28 @@
 # shared across all modules so cross-pod field inheritance works safely.
 _UNSET = object()
 
+# Per-Python-class dispatch tables for ObjUtil.equals/hash/compare/to_str.
+# The first time a class is seen the matching _resolve_* function works out
+# which implementation applies (the same isinstance/hasattr chain these
+# methods used to run on every call) and caches it keyed by type(obj).
+# Each later call is a single dict lookup followed by a direct call.
+_equals_by_type = {}
+_hash_by_type = {}
+_compare_by_type = {}
+_to_str_by_type = {}
+
+# Number of dispatch cache misses (one per class per operation)
+_dispatch_misses = 0
+
+# Per-Python-class immutability verdicts for ObjUtil.is_immutable and
+# to_immutable. A class maps to True/False when every instance has the same
+# answer, _TRACKED when instances track their own state (List, Map, Func,
+# Buf, ...) and must be asked directly, or _DYNAMIC when the full per-call
+# checks are still required.
+_immutable_by_type = {}
+_TRACKED = object()
+_DYNAMIC = object()
+
 class ObjUtil:
     """Utility methods for object operations"""
 
@@ -16,20 +38,10 @@ class ObjUtil:
     def hash(obj):
         if obj is None:
             return 0
-        if isinstance(obj, bool):
-            from .Bool import Bool
-            return Bool.hash(obj)
-        # NaN needs consistent hash (Python gives different hashes for different NaN objects)
-        if isinstance(obj, float):
-            import math
-            if math.isnan(obj):
-                return 0  # Consistent hash for all NaN values
-        # Check for hash_ first (Fantom transpiled name to avoid Python builtin conflict)
-        if hasattr(obj, "hash_") and callable(obj.hash_):
-            return obj.hash_()
-        if hasattr(obj, "hash") and callable(obj.hash):
-            return obj.hash()
-        return hash(obj)
+        fn = _hash_by_type.get(type(obj))
+        if fn is None:
+            fn = _resolve_hash(type(obj))
+        return fn(obj)
 
     @staticmethod
     def hash_(obj):
@@ -42,14 +54,20 @@ class ObjUtil:
             return b is None
         if b is None:
             return False
-        # IEEE 754: NaN is not equal to anything, including itself
-        if isinstance(a, float) and isinstance(b, float):
-            import math
-            if math.isnan(a) or math.isnan(b):
-                return False
-        if hasattr(a, "equals") and callable(getattr(a, "equals", None)):
-            return a.equals(b)
-        return a == b
+        fn = _equals_by_type.get(type(a))
+        if fn is None:
+            fn = _resolve_equals(type(a))
+        return fn(a, b)
+
+    @staticmethod
+    def dispatch_misses():
+        """Return how many times the equals/hash/compare/to_str and
+        is_immutable dispatch caches have had to resolve a new Python class.
+
+        This grows by at most one per class per operation, so a value that
+        keeps climbing indicates classes are being created dynamically.
+        """
+        return _dispatch_misses
 
     @staticmethod
     def same(a, b):
@@ -96,13 +114,14 @@ class ObjUtil:
             return -1 if b is not None else 0
         if b is None:
             return 1
-        # Dispatch to Float.compare for floats (handles NaN)
-        if isinstance(a, float):
-            from .Float import Float
-            return Float.compare(a, b)
-        if hasattr(a, "compare") and callable(a.compare):
-            return a.compare(b)
-        # Try Python comparison operators
+        fn = _compare_by_type.get(type(a))
+        if fn is None:
+            fn = _resolve_compare(type(a))
+        return fn(a, b)
+
+    @staticmethod
+    def _compare_py(a, b):
+        """Compare using Python operators for objects without compare()"""
         try:
             if a < b:
                 return -1
@@ -172,18 +191,10 @@ class ObjUtil:
         if obj is None:
             from .Err import NullErr
             raise NullErr.make("Cannot call toStr on null")
-        if isinstance(obj, bool):
-            return "true" if obj else "false"
-        if isinstance(obj, str):
-            return obj
-        if isinstance(obj, float):
-            from .Float import Float
-            return Float.to_str(obj)
-        if isinstance(obj, int):
-            return str(obj)
-        if hasattr(obj, "to_str") and callable(getattr(obj, "to_str", None)):
-            return obj.to_str()
-        return str(obj)
+        fn = _to_str_by_type.get(type(obj))
+        if fn is None:
+            fn = _resolve_to_str(type(obj))
+        return fn(obj)
 
     @staticmethod
     def to_code(obj):
@@ -522,9 +533,21 @@ class ObjUtil:
     @staticmethod
     def is_immutable(obj):
         """Check if object is immutable"""
-        import types
         if obj is None:
             return True
+        verdict = _immutable_by_type.get(type(obj))
+        if verdict is None:
+            verdict = _resolve_immutable(obj)
+        if verdict is _TRACKED:
+            return obj.is_immutable()
+        if verdict is _DYNAMIC:
+            return ObjUtil._is_immutable_checks(obj)
+        return verdict
+
+    @staticmethod
+    def _is_immutable_checks(obj):
+        """Uncached is_immutable checks for objects without a class verdict"""
+        import types
         if isinstance(obj, (bool, int, float, str)):
             return True
         # Facets are always immutable (const classes in Fantom)
@@ -554,11 +577,26 @@ class ObjUtil:
     @staticmethod
     def to_immutable(obj):
         """Return immutable version of object"""
-        from .Err import NotImmutableErr
-        import types
         # Primitives and None are already immutable
         if obj is None:
             return obj
+        verdict = _immutable_by_type.get(type(obj))
+        if verdict is None:
+            verdict = _resolve_immutable(obj)
+        if verdict is True:
+            return obj
+        if verdict is _TRACKED:
+            if obj.is_immutable():
+                return obj
+            to_imm = getattr(obj, "to_immutable", None)
+            if to_imm is not None:
+                return to_imm()
+        return ObjUtil._to_immutable_checks(obj)
+
+    @staticmethod
+    def _to_immutable_checks(obj):
+        """Uncached to_immutable checks for objects without a class verdict"""
+        from .Err import NotImmutableErr
         if isinstance(obj, (bool, int, float, str)):
             return obj
         # Check if already immutable FIRST
@@ -997,3 +1035,180 @@ class ObjUtil:
             # Accessor method call: obj.field(value)
             getattr(obj, field_name)(value)
         return value
+
+
+#################################################################
+# Dispatch Resolution
+#################################################################
+
+def _resolve_immutable(obj):
+    """Work out and cache the immutability verdict for type(obj)"""
+    global _dispatch_misses
+    _dispatch_misses += 1
+    cls = type(obj)
+    verdict = _DYNAMIC
+    if issubclass(cls, (bool, int, float, str)):
+        verdict = True
+    elif not _is_dynamic(cls):
+        # Facets are always immutable (const classes in Fantom)
+        from .Facet import Facet
+        from .Obj import Obj
+        if issubclass(cls, Facet):
+            verdict = True
+        elif getattr(cls, "is_immutable", None) is Obj.is_immutable:
+            # Default Obj.is_immutable is typeof().is_const(), which is the
+            # same answer for every instance of the class
+            try:
+                t = obj.typeof()
+                if t is not None:
+                    verdict = bool(t.is_const())
+            except Exception:
+                pass
+        elif _has_method(cls, "is_immutable"):
+            # Object tracks its own immutability (List, Map, Func, Buf...)
+            verdict = _TRACKED
+    _immutable_by_type[cls] = verdict
+    return verdict
+
+def _is_dynamic(cls):
+    """Return True if attribute lookup on instances of cls cannot be
+    predicted from cls itself (class objects and modules), in which case
+    the per-call checks are kept"""
+    import types
+    return issubclass(cls, (type, types.ModuleType))
+
+def _has_method(cls, name):
+    return callable(getattr(cls, name, None))
+
+def _resolve_equals(cls):
+    global _dispatch_misses
+    _dispatch_misses += 1
+    if _is_dynamic(cls):
+        fn = _equals_dynamic
+    elif issubclass(cls, float):
+        # IEEE 754: NaN is not equal to anything, including itself
+        fn = _equals_float_method if _has_method(cls, "equals") else _equals_float
+    elif _has_method(cls, "equals"):
+        fn = _equals_method
+    else:
+        fn = _equals_py
+    _equals_by_type[cls] = fn
+    return fn
+
+def _equals_py(a, b):
+    return a == b
+
+def _equals_method(a, b):
+    return a.equals(b)
+
+def _equals_float(a, b):
+    if isinstance(b, float) and (a != a or b != b):
+        return False
+    return a == b
+
+def _equals_float_method(a, b):
+    if isinstance(b, float) and (a != a or b != b):
+        return False
+    return a.equals(b)
+
+def _equals_dynamic(a, b):
+    if hasattr(a, "equals") and callable(getattr(a, "equals", None)):
+        return a.equals(b)
+    return a == b
+
+def _resolve_hash(cls):
+    global _dispatch_misses
+    _dispatch_misses += 1
+    if _is_dynamic(cls):
+        fn = _hash_dynamic
+    elif issubclass(cls, bool):
+        from .Bool import Bool
+        fn = Bool.hash
+    elif issubclass(cls, float):
+        # NaN needs consistent hash (Python gives different hashes for different NaN objects)
+        inner = _hash_of_class(cls)
+        fn = lambda obj: 0 if obj != obj else inner(obj)
+    else:
+        fn = _hash_of_class(cls)
+    _hash_by_type[cls] = fn
+    return fn
+
+def _hash_of_class(cls):
+    # Check for hash_ first (Fantom transpiled name to avoid Python builtin conflict)
+    if _has_method(cls, "hash_"):
+        return _hash_method_
+    if _has_method(cls, "hash"):
+        return _hash_method
+    return hash
+
+def _hash_method_(obj):
+    return obj.hash_()
+
+def _hash_method(obj):
+    return obj.hash()
+
+def _hash_dynamic(obj):
+    if hasattr(obj, "hash_") and callable(obj.hash_):
+        return obj.hash_()
+    if hasattr(obj, "hash") and callable(obj.hash):
+        return obj.hash()
+    return hash(obj)
+
+def _resolve_compare(cls):
+    global _dispatch_misses
+    _dispatch_misses += 1
+    if issubclass(cls, float):
+        # Dispatch to Float.compare for floats (handles NaN)
+        from .Float import Float
+        fn = Float.compare
+    elif _is_dynamic(cls):
+        fn = _compare_dynamic
+    elif _has_method(cls, "compare"):
+        fn = _compare_method
+    else:
+        fn = ObjUtil._compare_py
+    _compare_by_type[cls] = fn
+    return fn
+
+def _compare_method(a, b):
+    return a.compare(b)
+
+def _compare_dynamic(a, b):
+    if hasattr(a, "compare") and callable(a.compare):
+        return a.compare(b)
+    return ObjUtil._compare_py(a, b)
+
+def _resolve_to_str(cls):
+    global _dispatch_misses
+    _dispatch_misses += 1
+    if issubclass(cls, bool):
+        fn = _to_str_bool
+    elif issubclass(cls, str):
+        fn = _to_str_self
+    elif issubclass(cls, float):
+        from .Float import Float
+        fn = Float.to_str
+    elif issubclass(cls, int):
+        fn = str
+    elif _is_dynamic(cls):
+        fn = _to_str_dynamic
+    elif _has_method(cls, "to_str"):
+        fn = _to_str_method
+    else:
+        fn = str
+    _to_str_by_type[cls] = fn
+    return fn
+
+def _to_str_bool(obj):
+    return "true" if obj else "false"
+
+def _to_str_self(obj):
+    return obj
+
+def _to_str_method(obj):
+    return obj.to_str()
+
+def _to_str_dynamic(obj):
+    if hasattr(obj, "to_str") and callable(getattr(obj, "to_str", None)):
+        return obj.to_str()
+    return str(obj)
@@ -36,6 +36,22 @@ class OutStream(Obj):
             return self
         raise NotImplementedError("OutStream.write not implemented")
 
+    def _write_bytes(self, data):
+        """Write a block of bytes; the bulk counterpart of write().
+
+        The default pushes each byte through self.write() so subclasses
+        that only override write() keep working; streams with a native
+        block sink override it.
+        """
+        if type(self).write is OutStream.write and self._out is not None \
+                and hasattr(self._out, '_write_bytes'):
+            self._out._write_bytes(data)
+            return self
+        write = self.write
+        for b in data:
+            write(b)
+        return self
+
     def write_buf(self, buf, n=None):
         """Write bytes from buffer. Returns this (for method chaining)."""
         if self._out is not None:
@@ -47,54 +63,39 @@ class OutStream(Obj):
         """Write a single character using current charset. Returns this (for method chaining).
 
         Default implementation encodes the character using the current charset
-        and writes each byte using write(). This ensures subclass overrides of
-        write() are called (critical for FixedOutStream, ChunkOutStream, etc).
+        and writes the bytes with _write_bytes(), which falls back to write()
+        so subclass overrides are still called (FixedOutStream, ChunkOutStream, etc).
         """
         if self._out is not None:
             self._out.write_char(c)
             return self
-        # Encode character using current charset and write bytes via write()
-        ch = chr(int(c))
-        charset = self.charset()
-        charset_name = charset.name()
-        encoding_map = {
-            'UTF-8': 'utf-8',
-            'UTF-16BE': 'utf-16-be',
-            'UTF-16LE': 'utf-16-le',
-            'UTF-16': 'utf-16',
-            'US-ASCII': 'ascii',
-            'ISO-8859-1': 'iso-8859-1',
-        }
-        python_encoding = encoding_map.get(charset_name, charset_name.lower().replace('-', '_'))
-        data = ch.encode(python_encoding)
-        for b in data:
-            self.write(b)
+        self._write_bytes(self.charset()._encode(chr(int(c))))
         return self
 
     def write_chars(self, s, off=0, length=None):
         """Write characters from string. Returns this (for method chaining).
 
-        Default implementation calls writeChar() for each character,
-        which ensures proper byte counting in subclasses.
+        Default implementation encodes the whole range once and hands the
+        bytes to _write_bytes(), so subclasses that only override write()
+        still see every byte.
         """
         if self._out is not None:
             self._out.write_chars(s, off, length)
             return self
-        # Write each char via writeChar() to ensure write() gets called
         s = str(s)
-        if length is None:
-            end = len(s)
-        else:
-            end = int(off) + int(length)
-        for i in range(int(off), end):
-            self.write_char(ord(s[i]))
+        off = int(off)
+        if length is not None:
+            s = s[off:off + int(length)]
+        elif off:
+            s = s[off:]
+        self._write_bytes(self.charset()._encode(s))
         return self
 
     def print_(self, obj):
         """Print object as string. Returns this (for method chaining).
 
-        Default implementation calls writeChars() which calls writeChar()
-        which calls write(). This ensures subclass overrides work properly.
+        Default implementation calls writeChars(), which encodes the string
+        in one go. This ensures subclass overrides work properly.
         """
         from .ObjUtil import ObjUtil
         s = "null" if obj is None else ObjUtil.to_str(obj)
@@ -105,10 +106,8 @@ class OutStream(Obj):
     def print_line(self, obj=None):
         """Print object followed by newline. Returns this (for method chaining)."""
         from .ObjUtil import ObjUtil
-        if obj is not None:
-            s = ObjUtil.to_str(obj)
-            self.write_chars(s, 0, len(s))
-        return self.write_char(ord('\n'))
+        s = "\n" if obj is None else ObjUtil.to_str(obj) + "\n"
+        return self.write_chars(s, 0, len(s))
 
     def write_i2(self, x):
         """Write 16-bit integer. Returns this (for method chaining)."""
@@ -4,6 +4,7 @@
 #
 
 from .Obj import Obj
+from .Func import Func
 
 
 class Str(Obj):
@@ -444,18 +445,7 @@ class Str(Obj):
     @staticmethod
     def _get_param_count(f):
         """Get number of required parameters for a function"""
-        # Check if f is a Func instance - use its params() method
-        from .Func import Func
-        if isinstance(f, Func):
-            return len(f.params())
-
-        import inspect
-        try:
-            sig = inspect.signature(f)
-            return len([p for p in sig.parameters.values()
-                       if p.default is inspect.Parameter.empty])
-        except:
-            return 1
+        return Func._arity(f)
 
     @staticmethod
     def each(self, f):
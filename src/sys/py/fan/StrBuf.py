@@ -3,15 +3,37 @@
 # Licensed under the Academic Free License version 3.0
 #
 
+from bisect import bisect_right
+from itertools import accumulate
 from .Obj import Obj
 from .OutStream import OutStream
 
 
+# Small appends are gathered into a tail list and sealed into one chunk once
+# they add up to this many chars; bigger strings become chunks as they are.
+_CHUNK = 1024
+
+# Edits split chunks longer than this (e.g. a whole compacted document) into
+# _CHUNK sized pieces, so each later edit only copies one small chunk
+_MAX_CHUNK = 8 * _CHUNK
+
+
 class StrBuf(Obj):
-    """StrBuf is a mutable sequence of characters for building strings."""
+    """StrBuf is a mutable sequence of characters for building strings.
+
+    The content is kept as a rope: a list of string chunks plus a tail of
+    recent small appends. Appends never copy existing text; indexed access
+    finds its chunk by binary search over cached chunk start offsets, and
+    edits rewrite only the chunks they touch. to_str joins the chunks and
+    keeps the result as the single chunk, so repeated calls are cheap.
+    """
 
     def __init__(self, capacity=16):
-        self._buf = []
+        self._chunks = []     # sealed chunks, in order
+        self._starts = None   # cached start offset of each chunk, or None
+        self._tail = []       # small appends not yet sealed into a chunk
+        self._tail_len = 0
+        self._size = 0
         self._capacity = capacity
 
     @staticmethod
@@ -19,22 +41,139 @@ class StrBuf(Obj):
         """Create StrBuf with initial capacity."""
         return StrBuf(int(capacity) if capacity else 16)
 
+    #################################################################
+    # Rope
+    #################################################################
+
+    def _append(self, s):
+        """Append a str to the end of the buffer."""
+        n = len(s)
+        if n == 0:
+            return
+        if n >= _CHUNK:
+            self._seal()
+            self._push(s)
+        else:
+            self._tail.append(s)
+            self._tail_len += n
+            if self._tail_len >= _CHUNK:
+                self._seal()
+        self._size += n
+
+    def _push(self, s):
+        """Add s as a new last chunk, keeping cached offsets valid."""
+        chunks = self._chunks
+        starts = self._starts
+        if starts is not None:
+            starts.append(starts[-1] + len(chunks[-1]) if chunks else 0)
+        chunks.append(s)
+
+    def _seal(self):
+        """Move the tail of small appends into a chunk."""
+        if self._tail:
+            tail = self._tail
+            self._tail = []
+            self._tail_len = 0
+            self._push(tail[0] if len(tail) == 1 else ''.join(tail))
+
+    def _locate(self, index):
+        """Return (chunk index, offset in chunk) for 0 <= index < size."""
+        self._seal()
+        chunks = self._chunks
+        last = len(chunks) - 1
+        last_start = self._size - len(chunks[last])
+        if index >= last_start:
+            return last, index - last_start
+        starts = self._starts
+        if starts is None:
+            starts = self._starts = [0]
+            starts.extend(accumulate(len(c) for c in chunks[:-1]))
+        k = bisect_right(starts, index) - 1
+        return k, index - starts[k]
+
+    def _splice(self, start, end, s):
+        """Replace chars [start, end) with s."""
+        if start == end == self._size:
+            self._append(s)
+            return
+        k, a = self._locate(start)
+        chunks = self._chunks
+        if end == start:
+            k2 = k
+            text = chunks[k][:a] + s + chunks[k][a:]
+        else:
+            k2, b = self._locate(end - 1)
+            text = chunks[k][:a] + s + chunks[k2][b + 1:]
+        if len(text) > _MAX_CHUNK:
+            pieces = [text[i:i + _CHUNK] for i in range(0, len(text), _CHUNK)]
+        else:
+            pieces = [text] if text else []
+        delta = len(s) - (end - start)
+        if k2 == k and len(pieces) == 1 and delta == 0:
+            chunks[k] = text  # same length, cached offsets stay valid
+        else:
+            chunks[k:k2 + 1] = pieces
+            self._starts = None
+        self._size += delta
+
+    def _slice(self, start, end):
+        """Return chars [start, end) as a str."""
+        if end <= start:
+            return ""
+        k, a = self._locate(start)
+        k2, b = self._locate(end - 1)
+        chunks = self._chunks
+        if k == k2:
+            return chunks[k][a:b + 1]
+        return ''.join([chunks[k][a:]] + chunks[k + 1:k2] + [chunks[k2][:b + 1]])
+
+    def _check_index(self, index, size):
+        """Normalize a negative index and check 0 <= index < size."""
+        if index < 0:
+            index = self._size + index
+        if index < 0 or index >= size:
+            from .Err import IndexErr
+            raise IndexErr.make(f"Index {index} out of bounds")
+        return index
+
+    def _resolve_range(self, r):
+        """Return [start, end) for Range r, raising IndexErr if invalid."""
+        n = self._size
+        start = r._start
+        end = r._end
+
+        # Convert negative indices
+        if start < 0:
+            start = n + start
+        if end < 0:
+            end = n + end
+
+        # Apply exclusive adjustment
+        if not r._exclusive:
+            end = end + 1
+
+        # Validate range
+        if start < 0 or end > n or end < start:
+            from .Err import IndexErr
+            raise IndexErr.make(f"Range {r}")
+        return start, end
+
     #################################################################
     # Accessors
     #################################################################
 
     def is_empty(self):
         """Return true if size is zero."""
-        return len(self._buf) == 0
+        return self._size == 0
 
     def size(self):
         """Return number of characters."""
-        return len(self._buf)
+        return self._size
 
     @property
     def capacity(self):
         """Return current capacity."""
-        return max(self._capacity, len(self._buf))
+        return max(self._capacity, self._size)
 
     @capacity.setter
     def capacity(self, size):
@@ -48,31 +187,22 @@ class StrBuf(Obj):
 
     def get(self, index):
         """Get character at index as Int codepoint. Supports negative indexing."""
-        if index < 0:
-            index = len(self._buf) + index
-        if index < 0 or index >= len(self._buf):
-            from .Err import IndexErr
-            raise IndexErr.make(f"Index {index} out of bounds")
-        return ord(self._buf[index])
+        index = self._check_index(index, self._size)
+        k, i = self._locate(index)
+        return ord(self._chunks[k][i])
 
     def __getitem__(self, index):
         """Support [] operator for getting characters."""
         if isinstance(index, slice):
-            # Range access
-            from .Range import Range
-            if hasattr(index, '_start'):
-                r = index
-            else:
-                # Convert Python slice to Range
-                start = index.start or 0
-                stop = index.stop or len(self._buf)
-                return ''.join(self._buf[start:stop])
+            # Python slice semantics for range access
+            start, stop, _ = slice(index.start, index.stop).indices(self._size)
+            return self._slice(start, stop)
         return self.get(index)
 
     def get_range(self, r):
         """Get substring for range."""
         from .Err import IndexErr
-        n = len(self._buf)
+        n = self._size
 
         # Use Range's index resolution methods which handle negative indices
         # and throw IndexErr for out of bounds
@@ -83,16 +213,12 @@ class StrBuf(Obj):
         if e + 1 < s:
             raise IndexErr.make(str(r))
 
-        return ''.join(self._buf[s:e+1])
+        return self._slice(s, e + 1)
 
     def set_(self, index, ch):
         """Set character at index. Supports negative indexing."""
-        if index < 0:
-            index = len(self._buf) + index
-        if index < 0 or index >= len(self._buf):
-            from .Err import IndexErr
-            raise IndexErr.make(f"Index {index} out of bounds")
-        self._buf[index] = chr(int(ch))
+        index = self._check_index(index, self._size)
+        self._splice(index, index + 1, chr(int(ch)))
         return self
 
     def __setitem__(self, index, ch):
@@ -105,14 +231,17 @@ class StrBuf(Obj):
 
     def add(self, obj):
         """Append string representation of object."""
+        if type(obj) is str:
+            self._append(obj)
+            return self
         from .ObjUtil import ObjUtil
         s = "null" if obj is None else ObjUtil.to_str(obj)
-        self._buf.extend(list(s))
+        self._append(s)
         return self
 
     def add_char(self, ch):
         """Append single character by codepoint."""
-        self._buf.append(chr(int(ch)))
+        self._append(chr(int(ch)))
         return self
 
     def add_range(self, s, r):
@@ -132,23 +261,23 @@ class StrBuf(Obj):
         if not exclusive:
             end = end + 1
 
-        self._buf.extend(list(s[start:end]))
+        self._append(s[start:end])
         return self
 
     def add_trim(self, x):
         """Add string with its leading and trailing whitespace trimmed."""
         from .ObjUtil import ObjUtil
         s = "null" if x is None else ObjUtil.to_str(x)
-        self._buf.extend(list(s.strip()))
+        self._append(s.strip())
         return self
 
     def join(self, obj, sep=" "):
         """Append object with separator if not empty."""
         from .ObjUtil import ObjUtil
         s = "null" if obj is None else ObjUtil.to_str(obj)
-        if len(self._buf) > 0:
-            self._buf.extend(list(sep))
-        self._buf.extend(list(s))
+        if self._size > 0:
+            self._append(sep)
+        self._append(s)
         return self
 
     def join_not_null(self, obj, sep=" "):
@@ -161,91 +290,57 @@ class StrBuf(Obj):
         """Insert string representation at index."""
         from .ObjUtil import ObjUtil
         s = "null" if obj is None else ObjUtil.to_str(obj)
-        index = int(index)
-        if index < 0:
-            index = len(self._buf) + index
-        if index < 0 or index > len(self._buf):
-            from .Err import IndexErr
-            raise IndexErr.make(f"Index {index} out of bounds")
-        for i, c in enumerate(s):
-            self._buf.insert(index + i, c)
+        index = self._check_index(int(index), self._size + 1)
+        self._splice(index, index, s)
         return self
 
     def trim_end(self):
         """Remove any trailing whitespace in the buffer."""
-        while self._buf and self._buf[-1] in ' \t\n\r\f\v':
-            self._buf.pop()
+        self._seal()
+        chunks = self._chunks
+        while chunks:
+            last = chunks[-1]
+            trimmed = last.rstrip(' \t\n\r\f\v')
+            self._size -= len(last) - len(trimmed)
+            if trimmed:
+                chunks[-1] = trimmed
+                break
+            chunks.pop()
+        self._starts = None
         return self
 
     def remove(self, index):
         """Remove character at index."""
-        index = int(index)
-        if index < 0:
-            index = len(self._buf) + index
-        if index < 0 or index >= len(self._buf):
-            from .Err import IndexErr
-            raise IndexErr.make(f"Index {index} out of bounds")
-        del self._buf[index]
+        index = self._check_index(int(index), self._size)
+        self._splice(index, index + 1, "")
         return self
 
     def remove_range(self, r):
         """Remove characters in range."""
-        n = len(self._buf)
-        start = r._start
-        end = r._end
-        exclusive = r._exclusive
-
-        # Convert negative indices
-        if start < 0:
-            start = n + start
-        if end < 0:
-            end = n + end
-
-        # Apply exclusive adjustment
-        if not exclusive:
-            end = end + 1
-
-        # Validate range
-        if start < 0 or end > n or end < start:
-            from .Err import IndexErr
-            raise IndexErr.make(f"Range {r}")
-
-        del self._buf[start:end]
+        start, end = self._resolve_range(r)
+        self._splice(start, end, "")
         return self
 
     def replace_range(self, r, s):
         """Replace characters in range with string."""
-        n = len(self._buf)
-        start = r._start
-        end = r._end
-        exclusive = r._exclusive
-
-        # Convert negative indices
-        if start < 0:
-            start = n + start
-        if end < 0:
-            end = n + end
-
-        # Apply exclusive adjustment
-        if not exclusive:
-            end = end + 1
-
-        # Validate range
-        if start < 0 or end > n or end < start:
-            from .Err import IndexErr
-            raise IndexErr.make(f"Range {r}")
-
-        self._buf[start:end] = list(s)
+        start, end = self._resolve_range(r)
+        self._splice(start, end, str(s))
         return self
 
     def reverse(self):
         """Reverse characters in place."""
-        self._buf.reverse()
+        s = self.to_str()[::-1]
+        self.clear()
+        self._append(s)
         return self
 
     def clear(self):
         """Clear all characters."""
-        self._buf = []
+        self._chunks = []
+        self._starts = None
+        self._tail = []
+        self._tail_len = 0
+        self._size = 0
         return self
 
     #################################################################
@@ -253,8 +348,21 @@ class StrBuf(Obj):
     #################################################################
 
     def to_str(self):
-        """Return current string value."""
-        return ''.join(self._buf)
+        """Return current string value.
+
+        The chunks are compacted into the joined string, so calling
+        to_str again without changes doesn't join again.
+        """
+        self._seal()
+        chunks = self._chunks
+        if len(chunks) == 1:
+            return chunks[0]
+        if not chunks:
+            return ""
+        s = ''.join(chunks)
+        self._chunks = [s]
+        self._starts = None
+        return s
 
     def __str__(self):
         return self.to_str()
@@ -292,15 +400,15 @@ class StrBufOutStream(OutStream):
 
     def write_char(self, ch):
         """Write single character."""
-        self._buf.add_char(ch)
+        self._buf._append(chr(int(ch)))
         return self
 
     def write_chars(self, s, off=0, length=None):
         """Write string of characters."""
         if length is None:
-            self._buf.add(s[off:])
+            self._buf._append(s[off:])
         else:
-            self._buf.add(s[off:off + length])
+            self._buf._append(s[off:off + length])
         return self
 
     def print_(self, obj):
@@ -313,7 +421,7 @@ class StrBufOutStream(OutStream):
 
     def print_line(self, obj=""):
         """Print object with newline."""
-        self._buf.add(obj).add_char(ord('\n'))
+        self._buf.add(obj)._append("\n")
         return self
 
     def write_xml(self, s, flags=0):
@@ -352,7 +460,7 @@ class StrBufOutStream(OutStream):
                 result.append('&#39;')
             else:
                 result.append(ch)
-        self._buf.add(''.join(result))
+        self._buf._append(''.join(result))
         return self
 
     def write_props(self, props, close=True):
@@ -360,7 +468,7 @@ class StrBufOutStream(OutStream):
         for key, val in props.items() if hasattr(props, 'items') else []:
             # Escape special characters in value
             escaped_val = val.replace('\\', '\\\\').replace('\t', '\\t').replace('\n', '\\n')
-            self._buf.add(f"{key}={escaped_val}\n")
+            self._buf._append(f"{key}={escaped_val}\n")
         if close:
             self.close()
         return self
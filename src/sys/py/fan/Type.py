@@ -123,6 +123,7 @@ class Type(Obj):
         "sys::SysInStream": "sys::InStream",    # SysInStream extends InStream
         # Buf hierarchy
         "sys::ConstBuf": "sys::Buf",  # ConstBuf extends Buf
+        "sys::FileBuf": "sys::Buf",   # FileBuf extends Buf
         # System enums
         "sys::Weekday": "sys::Enum",
         "sys::Month": "sys::Enum",
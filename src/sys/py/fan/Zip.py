@@ -4,10 +4,47 @@
 #
 
 import zipfile
-import gzip
 import zlib
-import io
+import struct
 from .Obj import Obj
+from .InStream import InStream, _write_block
+from .OutStream import OutStream
+
+# Local file header layout and the flags/markers streamed reading needs
+_LOCAL_SIG = b'PK\x03\x04'
+_DESCRIPTOR_SIG = b'PK\x07\x08'
+_LOCAL_HEADER = struct.Struct('<HHHHHIIIHH')
+_FLAG_ENCRYPTED = 0x01
+_FLAG_DESCRIPTOR = 0x08
+_FLAG_UTF8 = 0x800
+_ZIP64_LIMIT = 0xFFFFFFFF
+
+# Entries up to this size are buffered and written with known sizes;
+# larger entries are streamed straight through with zip64 sizes
+_ENTRY_SPILL = 1024 * 1024
+
+# Default staging/read size for the gzip and deflate streams
+_ZLIB_BUF_SIZE = 64 * 1024
+
+
+def _read_block(in_stream, n):
+    """Read up to n bytes from in_stream, in bulk when it supports it."""
+    read_bytes = getattr(in_stream, '_read_bytes', None)
+    if read_bytes is not None:
+        return read_bytes(n)
+    data = bytearray()
+    for _ in range(n):
+        b = in_stream.read()
+        if b is None:
+            break
+        data.append(b)
+    return bytes(data)
+
+
+def _dos_date_time(date, time):
+    """Convert MS-DOS date and time fields to a ZipInfo date_time tuple."""
+    return ((date >> 9) + 1980, (date >> 5) & 0xF, date & 0x1F,
+            time >> 11, (time >> 5) & 0x3F, (time & 0x1F) * 2)
 
 
 class Zip(Obj):
@@ -23,6 +60,7 @@ class Zip(Obj):
         self._out_stream = None
         self._in_stream = None
         self._zip_out = None
+        self._reader = None
         self._current_entry = None
 
     # =========================================================================
@@ -77,24 +115,7 @@ class Zip(Obj):
         z = Zip()
         z._mode = 'read'
         z._in_stream = in_stream
-
-        # Read the entire stream into a bytes buffer for zipfile
-        # Get all bytes from the input stream
-        buf = io.BytesIO()
-        while True:
-            b = in_stream.read()
-            if b is None:
-                break
-            buf.write(bytes([b]))
-
-        buf.seek(0)
-        try:
-            z._zip_file = zipfile.ZipFile(buf, 'r')
-            z._zip_entries = iter(z._zip_file.namelist())
-        except Exception as e:
-            from .Err import IOErr
-            raise IOErr(f"Cannot read zip stream: {e}")
-
+        z._reader = _ZipStreamReader(in_stream)
         return z
 
     @staticmethod
@@ -106,8 +127,9 @@ class Zip(Obj):
         z = Zip()
         z._mode = 'write'
         z._out_stream = out_stream
-        z._zip_buffer = io.BytesIO()
-        z._zip_out = zipfile.ZipFile(z._zip_buffer, 'w', zipfile.ZIP_DEFLATED)
+        # The sink can't seek, so zipfile writes entries with data
+        # descriptors straight through to out_stream
+        z._zip_out = zipfile.ZipFile(_OutStreamFile(out_stream), 'w', zipfile.ZIP_DEFLATED)
         return z
 
     # =========================================================================
@@ -115,20 +137,25 @@ class Zip(Obj):
     # =========================================================================
 
     @staticmethod
-    def gzip_out_stream(out):
+    def gzip_out_stream(out, opts=None):
         """
         Wrap an output stream with gzip compression.
         Returns a GzipOutStream that compresses data written to it.
+        Options:
+            - level (int): 0-9, compression level (0=none, 9=best)
+            - bufSize (int): bytes staged before each compress call
         """
-        return GzipOutStream(out)
+        level, buf_size = Zip._zlib_opts(opts)
+        return GzipOutStream(out, level, buf_size)
 
     @staticmethod
-    def gzip_in_stream(in_stream):
+    def gzip_in_stream(in_stream, opts=None):
         """
         Wrap an input stream with gzip decompression.
         Returns a GzipInStream that decompresses data read from it.
+        Options: bufSize (int) - bytes read from in_stream at a time
         """
-        return GzipInStream(in_stream)
+        return GzipInStream(in_stream, Zip._zlib_opts(opts)[1])
 
     @staticmethod
     def deflate_out_stream(out, opts=None):
@@ -137,25 +164,34 @@ class Zip(Obj):
         Options:
             - nowrap (bool): if true, don't write zlib header/trailer
             - level (int): 0-9, compression level (0=none, 9=best)
+            - bufSize (int): bytes staged before each compress call
         """
-        nowrap = False
-        level = -1  # default compression
-        if opts is not None:
-            nowrap = opts.get("nowrap", False)
-            if opts.get("level") is not None:
-                level = int(opts.get("level"))
-        return DeflateOutStream(out, nowrap, level)
+        nowrap = opts.get("nowrap", False) if opts is not None else False
+        level, buf_size = Zip._zlib_opts(opts)
+        return DeflateOutStream(out, nowrap, level, buf_size)
 
     @staticmethod
     def deflate_in_stream(in_stream, opts=None):
         """
         Wrap an input stream with deflate decompression.
-        Options: nowrap (bool) - if true, expect raw deflate without zlib header
+        Options:
+            - nowrap (bool): if true, expect raw deflate without zlib header
+            - bufSize (int): bytes read from in_stream at a time
         """
-        nowrap = False
+        nowrap = opts.get("nowrap", False) if opts is not None else False
+        return DeflateInStream(in_stream, nowrap, Zip._zlib_opts(opts)[1])
+
+    @staticmethod
+    def _zlib_opts(opts):
+        """Return (level, buf_size) from compression stream options."""
+        level = -1  # default compression
+        buf_size = _ZLIB_BUF_SIZE
         if opts is not None:
-            nowrap = opts.get("nowrap", False)
-        return DeflateInStream(in_stream, nowrap)
+            if opts.get("level") is not None:
+                level = int(opts.get("level"))
+            if opts.get("bufSize") is not None:
+                buf_size = max(int(opts.get("bufSize")), 1)
+        return level, buf_size
 
     @staticmethod
     def unzip_into(zip_file, target_dir):
@@ -219,14 +255,13 @@ class Zip(Obj):
             from .Err import UnsupportedErr
             raise UnsupportedErr("readNext requires read mode")
 
-        try:
-            name = next(self._zip_entries)
-            from .Uri import Uri
-            uri_str = '/' + name if not name.startswith('/') else name
-            uri = Uri.from_str(uri_str)
-            return ZipEntryFile(self._zip_file, name, uri)
-        except StopIteration:
+        info = self._reader.next_entry()
+        if info is None:
             return None
+        from .Uri import Uri
+        name = info.filename
+        uri_str = '/' + name if not name.startswith('/') else name
+        return ZipStreamEntryFile(self._reader, info, Uri.from_str(uri_str))
 
     def read_each(self, func):
         """
@@ -242,7 +277,7 @@ class Zip(Obj):
     # Write mode methods
     # =========================================================================
 
-    def write_next(self, uri, modified=None):
+    def write_next(self, uri, modified=None, opts=None):
         """
         Write the next entry with the given URI path.
         Returns an OutStream to write the entry contents.
@@ -263,11 +298,12 @@ class Zip(Obj):
         # Remove leading slash for zipfile
         name = uri_str.lstrip('/')
 
-        # Create a buffer to collect the entry data
-        entry_buffer = io.BytesIO()
-        self._current_entry = (name, modified, entry_buffer)
+        # Starting a new entry closes the previous one
+        if self._current_entry is not None:
+            self._current_entry.close()
 
-        return ZipEntryOutStream(self, entry_buffer)
+        self._current_entry = ZipEntryOutStream(self, self._entry_info(name, modified))
+        return self._current_entry
 
     def finish(self):
         """
@@ -278,26 +314,27 @@ class Zip(Obj):
             from .Err import UnsupportedErr
             raise UnsupportedErr("finish requires write mode")
 
-        # Close the zip file
-        self._zip_out.close()
-
-        # Write the zip data to the output stream
-        self._zip_buffer.seek(0)
-        for byte in self._zip_buffer.read():
-            self._out_stream.write(byte)
-        self._out_stream.flush()
+        if self._zip_out is None:
+            return True
+        try:
+            if self._current_entry is not None:
+                self._current_entry.close()
+            # Writes the central directory after the streamed entries
+            self._zip_out.close()
+            self._zip_out = None
+            self._out_stream.flush()
+            return True
+        except Exception:
+            return False
 
-    def _finish_entry(self, entry_buffer, name, modified):
-        """Internal: finish writing an entry to the zip."""
+    def _entry_info(self, name, modified):
+        """Internal: build the ZipInfo for a new entry."""
         import time as time_mod
-        import os
         from datetime import datetime
 
-        # Get the data
-        data = entry_buffer.getvalue()
-
         # Create ZipInfo with proper date
         info = zipfile.ZipInfo(name)
+        info.compress_type = zipfile.ZIP_DEFLATED
         if modified is not None:
             # Convert Fantom DateTime to epoch millis then to local time tuple
             # This preserves the instant in time for round-trip
@@ -311,27 +348,26 @@ class Zip(Obj):
             now = datetime.now()
             info.date_time = (now.year, now.month, now.day,
                               now.hour, now.minute, now.second)
-
-        self._zip_out.writestr(info, data)
+        return info
 
     # =========================================================================
     # Common methods
     # =========================================================================
 
     def close(self):
-        """Close the zip file."""
-        if self._zip_file is not None:
-            self._zip_file.close()
-            self._zip_file = None
-        if self._zip_out is not None:
-            # For write mode, close writes the buffered data to output stream
-            self._zip_out.close()
-            self._zip_buffer.seek(0)
-            for byte in self._zip_buffer.read():
-                self._out_stream.write(byte)
-            self._out_stream.flush()
-            self._zip_out = None
-        return True
+        """Close the zip file, and the underlying stream if reading or writing one."""
+        try:
+            if self._zip_file is not None:
+                self._zip_file.close()
+                self._zip_file = None
+            if self._mode == 'write':
+                ok = self.finish()
+                return self._out_stream.close() is not False and ok
+            if self._mode == 'read':
+                return self._in_stream.close() is not False
+            return True
+        except Exception:
+            return False
 
     def to_str(self):
         """String representation."""
@@ -387,13 +423,8 @@ class ZipEntryFile:
 
     def in_(self, bufSize=4096):
         """Get an input stream to read the entry."""
-        data = self._zip_file.read(self._name)
         from .Buf import Buf
-        buf = Buf.make(len(data))
-        for b in data:
-            buf.write(b)
-        buf.flip()
-        return buf.in_()
+        return Buf(self._zip_file.read(self._name)).in_()
 
     def read_all_str(self, normalizeNewlines=True):
         """Read entire entry as string."""
@@ -405,13 +436,8 @@ class ZipEntryFile:
 
     def read_all_buf(self):
         """Read entire entry as Buf."""
-        data = self._zip_file.read(self._name)
         from .Buf import Buf
-        buf = Buf.make(len(data))
-        for b in data:
-            buf.write(b)
-        buf.flip()
-        return buf
+        return Buf(self._zip_file.read(self._name))
 
     def copy_into(self, target_dir, options=None):
         """Copy this entry into the target directory."""
@@ -420,8 +446,7 @@ class ZipEntryFile:
         data = self._zip_file.read(self._name)
 
         out = target.out()
-        for b in data:
-            out.write(b)
+        _write_block(out, data)
         out.close()
 
         return target
@@ -451,6 +476,279 @@ class ZipEntryFile:
         return Type.find("sys::File")
 
 
+# =============================================================================
+# ZipStreamEntryFile - File for an entry pulled off a zip InStream
+# =============================================================================
+
+class ZipStreamEntryFile(ZipEntryFile):
+    """
+    A File for an entry returned by Zip.read_next. Its content streams
+    straight off the zip InStream, so it can only be read until the next
+    entry is read.
+    """
+
+    def __init__(self, reader, info, uri):
+        self._zip_file = None
+        self._name = info.filename
+        self._uri = uri
+        self._info = info
+        self._reader = reader
+        self._entry = reader._entry
+
+    def in_(self, bufSize=4096):
+        """Get an input stream to read the entry."""
+        return ZipEntryInStream(self._reader, self._entry)
+
+    def read_all_str(self, normalizeNewlines=True):
+        """Read entire entry as string."""
+        return self.in_().read_all_str(normalizeNewlines)
+
+    def read_all_buf(self):
+        """Read entire entry as Buf."""
+        return self.in_().read_all_buf()
+
+    def copy_into(self, target_dir, options=None):
+        """Copy this entry into the target directory."""
+        target = target_dir.plus(self._uri.name())
+        out = target.out()
+        try:
+            self.in_().pipe(out)
+        finally:
+            out.close()
+        return target
+
+
+class _BlockInStream(InStream):
+    """
+    InStream over blocks of bytes produced by _fetch(n), with a small
+    read-ahead buffer for read, peek and unread.
+    """
+
+    def __init__(self):
+        super().__init__(None)
+        self._buf = b''
+        self._pos = 0
+
+    def _fetch(self, n):
+        """Produce up to n more bytes, empty at end of stream."""
+        raise NotImplementedError()
+
+    def _fill(self, n):
+        """Buffer at least n bytes ahead unless the entry ends first."""
+        buf = self._buf[self._pos:]
+        while len(buf) < n:
+            data = self._fetch(max(n - len(buf), InStream._chunk_size))
+            if not data:
+                break
+            buf += data
+        self._buf = buf
+        self._pos = 0
+        return buf
+
+    def read(self):
+        pos = self._pos
+        if pos >= len(self._buf):
+            if not self._fill(1):
+                return None
+            pos = 0
+        self._pos = pos + 1
+        return self._buf[pos]
+
+    def _read_bytes(self, n):
+        pos = self._pos
+        if pos < len(self._buf):
+            data = self._buf[pos:pos + n]
+            self._pos = pos + len(data)
+            return data
+        return self._fetch(n)
+
+    def _peek_bytes(self, n):
+        return self._fill(n)[:n]
+
+    def unread(self, b):
+        self._buf = bytes([b & 0xFF]) + self._buf[self._pos:]
+        self._pos = 0
+        return self
+
+
+class ZipEntryInStream(_BlockInStream):
+    """InStream over the data of the current entry of a streamed zip."""
+
+    def __init__(self, reader, entry):
+        super().__init__()
+        self._reader = reader
+        self._entry = entry
+
+    def _fetch(self, n):
+        """Read up to n more entry bytes, nothing once the entry is done."""
+        reader = self._reader
+        if reader._entry != self._entry:
+            return b''
+        return reader.read_entry(n)
+
+
+class _ZipStreamReader:
+    """
+    Pulls entries off a zip InStream one local header at a time. Only the
+    current entry is decoded, a chunk at a time; bytes read past the end
+    of a deflated entry are kept for the next header.
+    """
+
+    def __init__(self, in_stream):
+        self._in = in_stream
+        self._pending = b''
+        self._entry = 0       # serial of the current entry, 0 before the first
+        self._done = True     # current entry fully read
+        self._end = False     # no more local headers
+
+    def _raw(self, n):
+        """Read up to n raw bytes, pending ones first."""
+        pending = self._pending
+        if pending:
+            self._pending = pending[n:]
+            return pending[:n]
+        return _read_block(self._in, n)
+
+    def _raw_exact(self, n):
+        """Read exactly n raw bytes or raise IOErr."""
+        data = bytes(self._raw(n))
+        while len(data) < n:
+            more = self._raw(n - len(data))
+            if not more:
+                from .Err import IOErr
+                raise IOErr("Unexpected end of zip stream")
+            data += bytes(more)
+        return data
+
+    def next_entry(self):
+        """
+        Skip the rest of the current entry and parse the next local header.
+        Return its ZipInfo, or None at the central directory or end of stream.
+        """
+        from .Err import IOErr
+        while not self._done:
+            self.read_entry(InStream._chunk_size)
+        if self._end:
+            return None
+        sig = bytes(self._raw(4))
+        if len(sig) < 4 and sig:
+            sig += bytes(self._raw(4 - len(sig)))
+        if sig != _LOCAL_SIG:
+            self._end = True
+            return None
+
+        (_, flags, method, mtime, mdate, crc, csize, usize, name_len,
+         extra_len) = _LOCAL_HEADER.unpack(self._raw_exact(_LOCAL_HEADER.size))
+        name = self._raw_exact(name_len).decode('utf-8' if flags & _FLAG_UTF8 else 'cp437')
+        extra = self._raw_exact(extra_len)
+
+        # Sizes of 0xFFFFFFFF are held in the zip64 extra field
+        zip64 = False
+        i = 0
+        while i + 4 <= len(extra):
+            tag, size = struct.unpack_from('<HH', extra, i)
+            if tag == 0x0001:
+                zip64 = True
+                j = i + 4
+                if usize == _ZIP64_LIMIT and j + 8 <= i + 4 + size:
+                    usize = struct.unpack_from('<Q', extra, j)[0]
+                    j += 8
+                if csize == _ZIP64_LIMIT and j + 8 <= i + 4 + size:
+                    csize = struct.unpack_from('<Q', extra, j)[0]
+            i += 4 + size
+
+        if flags & _FLAG_ENCRYPTED:
+            raise IOErr(f"Encrypted zip entry not supported: {name}")
+        if method not in (zipfile.ZIP_STORED, zipfile.ZIP_DEFLATED):
+            raise IOErr(f"Unsupported zip compression method {method}: {name}")
+        descriptor = bool(flags & _FLAG_DESCRIPTOR)
+        if descriptor and method == zipfile.ZIP_STORED:
+            raise IOErr(f"Cannot stream stored zip entry without sizes: {name}")
+
+        info = zipfile.ZipInfo(name, _dos_date_time(mdate, mtime))
+        info.flag_bits = flags
+        info.compress_type = method
+        if descriptor:
+            # Filled in from the data descriptor once the entry is read
+            info.CRC = info.compress_size = info.file_size = None
+        else:
+            info.CRC = crc
+            info.compress_size = csize
+            info.file_size = usize
+
+        self._entry += 1
+        self._done = False
+        self._info = info
+        self._zip64 = zip64
+        self._left = None if descriptor else csize
+        self._inflater = zlib.decompressobj(-zlib.MAX_WBITS) \
+            if method == zipfile.ZIP_DEFLATED else None
+        self._crc = 0
+        self._csize = 0
+        self._usize = 0
+        return info
+
+    def read_entry(self, n):
+        """Read up to n bytes of the current entry's data, empty at its end."""
+        if self._done:
+            return b''
+        inflater = self._inflater
+        if inflater is None:
+            # Stored: copy the raw bytes through
+            if self._left == 0:
+                self._finish_entry()
+                return b''
+            data = self._raw(min(n, self._left))
+            if not data:
+                from .Err import IOErr
+                raise IOErr("Unexpected end of zip stream")
+            self._left -= len(data)
+            self._csize += len(data)
+        else:
+            while True:
+                if inflater.eof:
+                    unused = inflater.unused_data
+                    if unused:
+                        self._pending = unused + bytes(self._pending)
+                        self._csize -= len(unused)
+                    self._finish_entry()
+                    return b''
+                src = inflater.unconsumed_tail
+                if not src:
+                    left = self._left
+                    size = InStream._chunk_size if left is None else min(InStream._chunk_size, left)
+                    src = self._raw(size) if size else b''
+                    if not src:
+                        from .Err import IOErr
+                        raise IOErr("Unexpected end of zip stream")
+                    if left is not None:
+                        self._left = left - len(src)
+                    self._csize += len(src)
+                data = inflater.decompress(src, n)
+                if data:
+                    break
+        self._crc = zlib.crc32(data, self._crc)
+        self._usize += len(data)
+        return data
+
+    def _finish_entry(self):
+        """Read the data descriptor, if any, and check the entry's CRC."""
+        self._done = True
+        info = self._info
+        if info.CRC is None:
+            data = self._raw_exact(4)
+            if data == _DESCRIPTOR_SIG:
+                data = self._raw_exact(4)
+            info.CRC = struct.unpack('<I', data)[0]
+            if self._zip64 or self._csize >= _ZIP64_LIMIT or self._usize >= _ZIP64_LIMIT:
+                info.compress_size, info.file_size = struct.unpack('<QQ', self._raw_exact(16))
+            else:
+                info.compress_size, info.file_size = struct.unpack('<II', self._raw_exact(8))
+        if info.CRC != self._crc:
+            from .Err import IOErr
+            raise IOErr(f"Invalid zip entry CRC: {info.filename}")
+
+
 # =============================================================================
 # ZipEntryOutStream - OutStream for writing zip entries
 # =============================================================================
@@ -458,34 +756,41 @@ class ZipEntryFile:
 class ZipEntryOutStream:
     """OutStream wrapper for writing a zip entry."""
 
-    def __init__(self, zip_instance, buffer):
+    def __init__(self, zip_instance, info):
         self._zip = zip_instance
-        self._buffer = buffer
+        self._info = info
+        self._buffer = bytearray()
+        self._dest = None
         self._closed = False
 
-    def write(self, byte):
+    def _write_bytes(self, data):
+        """Write a block of entry data, spilling to a streamed entry once large."""
         if self._closed:
             from .Err import IOErr
             raise IOErr("Stream closed")
-        self._buffer.write(bytes([byte & 0xFF]))
+        if self._dest is not None:
+            self._dest.write(data)
+            return self
+        buffer = self._buffer
+        buffer += data
+        if len(buffer) > _ENTRY_SPILL:
+            # Size is unknown up front, so stream the rest with zip64 sizes
+            self._dest = self._zip._zip_out.open(self._info, 'w', force_zip64=True)
+            self._dest.write(buffer)
+            self._buffer = None
         return self
 
+    def write(self, byte):
+        return self._write_bytes(bytes([byte & 0xFF]))
+
     def write_buf(self, buf, n=None):
-        if self._closed:
-            from .Err import IOErr
-            raise IOErr("Stream closed")
         if n is None:
             n = buf.remaining()
-        for _ in range(n):
-            b = buf.read()
-            if b is None:
-                break
-            self._buffer.write(bytes([b & 0xFF]))
-        return self
+        return self._write_bytes(_read_block(buf, n))
 
     def write_i4(self, val):
         """Write 4-byte integer in big-endian."""
-        self._buffer.write(bytes([
+        self._write_bytes(bytes([
             (val >> 24) & 0xFF,
             (val >> 16) & 0xFF,
             (val >> 8) & 0xFF,
@@ -496,13 +801,13 @@ class ZipEntryOutStream:
     def print_(self, obj):
         """Print string."""
         s = str(obj) if obj is not None else ""
-        self._buffer.write(s.encode('utf-8'))
+        self._write_bytes(s.encode('utf-8'))
         return self
 
     def print_line(self, obj=""):
         """Print string with newline."""
         s = str(obj) if obj is not None else ""
-        self._buffer.write((s + "\n").encode('utf-8'))
+        self._write_bytes((s + "\n").encode('utf-8'))
         return self
 
     def write_props(self, props, close=True):
@@ -521,7 +826,7 @@ class ZipEntryOutStream:
             escaped_val = self._escape_props_val(str(val))
             # Write line
             line = f"{escaped_key}={escaped_val}\n"
-            self._buffer.write(line.encode('utf-8'))
+            self._write_bytes(line.encode('utf-8'))
 
         if close:
             self.close()
@@ -574,234 +879,195 @@ class ZipEntryOutStream:
         if not self._closed:
             self._closed = True
             # Finish this entry
-            name, modified, buffer = self._zip._current_entry
-            self._zip._finish_entry(buffer, name, modified)
+            if self._dest is not None:
+                self._dest.close()
+            else:
+                self._zip._zip_out.writestr(self._info, bytes(self._buffer))
+                self._buffer = None
+            if self._zip._current_entry is self:
+                self._zip._current_entry = None
         return True
 
 
-# =============================================================================
-# GzipOutStream - Gzip compression wrapper
-# =============================================================================
-
-class GzipOutStream:
-    """OutStream that compresses output with gzip."""
+class _OutStreamFile:
+    """Write-only file object that lets zipfile stream into an OutStream."""
 
     def __init__(self, out):
         self._out = out
-        self._buffer = io.BytesIO()
-        self._gzip = gzip.GzipFile(fileobj=self._buffer, mode='wb')
-
-    def write(self, byte):
-        self._gzip.write(bytes([byte & 0xFF]))
-        return self
 
-    def write_buf(self, buf, n=None):
-        if n is None:
-            n = buf.remaining()
-        data = bytearray()
-        for _ in range(n):
-            b = buf.read()
-            if b is None:
-                break
-            data.append(b & 0xFF)
-        self._gzip.write(bytes(data))
-        return self
-
-    def print_(self, obj):
-        s = str(obj) if obj is not None else ""
-        self._gzip.write(s.encode('utf-8'))
-        return self
-
-    def print_line(self, obj=""):
-        s = str(obj) if obj is not None else ""
-        self._gzip.write((s + "\n").encode('utf-8'))
-        return self
-
-    def write_char(self, c):
-        """Write single character using UTF-8 encoding."""
-        ch = chr(c) if isinstance(c, int) else c
-        self._gzip.write(ch.encode('utf-8'))
-        return self
-
-    def write_chars(self, s, off=0, length=None):
-        """Write string characters using UTF-8 encoding."""
-        if length is None:
-            length = len(s) - off
-        self._gzip.write(s[off:off+length].encode('utf-8'))
-        return self
+    def write(self, data):
+        _write_block(self._out, data)
+        return len(data)
 
     def flush(self):
-        self._gzip.flush()
-        self._flush_to_out()
-        return self
-
-    def _flush_to_out(self):
-        """Flush buffered data to underlying stream."""
-        data = self._buffer.getvalue()
-        self._buffer.seek(0)
-        self._buffer.truncate()
-        for b in data:
-            self._out.write(b)
-
-    def close(self):
-        self._gzip.close()
-        self._flush_to_out()
-        return True
+        self._out.flush()
 
 
 # =============================================================================
-# GzipInStream - Gzip decompression wrapper
+# Compression streams - zlib compressobj/decompressobj wrappers
 # =============================================================================
 
-class GzipInStream:
-    """InStream that decompresses gzip input."""
-
-    def __init__(self, in_stream):
-        self._in = in_stream
-        # Read all input data first
-        data = bytearray()
-        while True:
-            b = in_stream.read()
-            if b is None:
-                break
-            data.append(b)
-
-        # Decompress
-        self._buffer = io.BytesIO(gzip.decompress(bytes(data)))
-
-    def read(self):
-        b = self._buffer.read(1)
-        if not b:
-            return None
-        return b[0]
-
-    def read_buf(self, buf, n):
-        data = self._buffer.read(n)
-        if not data:
-            return None
-        for b in data:
-            buf.write(b)
-        return len(data)
-
-    def read_all_str(self, normalizeNewlines=True):
-        data = self._buffer.read()
-        text = data.decode('utf-8')
-        if normalizeNewlines:
-            text = text.replace('\r\n', '\n').replace('\r', '\n')
-        return text
-
-    def close(self):
-        return True
-
-
-# =============================================================================
-# DeflateOutStream - Deflate compression wrapper
-# =============================================================================
+class _CompressOutStream(OutStream):
+    """
+    OutStream that compresses through a zlib compressobj. Small writes are
+    staged up to buf_size bytes and compressed in one call; compressed
+    output goes to the underlying stream a block at a time.
+    """
 
-class DeflateOutStream:
-    """OutStream that compresses output with deflate."""
+    # zlib flush mode used by flush(), or None to only push staged bytes
+    _flush_mode = zlib.Z_SYNC_FLUSH
 
-    def __init__(self, out, nowrap=False, level=-1):
-        self._out = out
-        self._nowrap = nowrap
-        # wbits: negative for raw deflate (no header), positive for zlib format
-        wbits = -zlib.MAX_WBITS if nowrap else zlib.MAX_WBITS
+    def __init__(self, out, wbits, level=-1, buf_size=_ZLIB_BUF_SIZE):
+        # Pass None to OutStream so it doesn't delegate via _out
+        super().__init__(None)
+        self._underlying = out
         # level: -1 = default, 0 = no compression, 9 = best
         if level < 0:
             level = zlib.Z_DEFAULT_COMPRESSION
         self._compressor = zlib.compressobj(level, zlib.DEFLATED, wbits)
-        self._buffer = bytearray()
+        self._buf_size = buf_size
+        self._pending = bytearray()
+        self._closed = False
 
-    def write(self, byte):
-        self._buffer.append(byte & 0xFF)
+    def write(self, b):
+        pending = self._pending
+        pending.append(b & 0xFF)
+        if len(pending) >= self._buf_size:
+            self._compress()
+        return self
+
+    def _write_bytes(self, data):
+        if len(data) >= self._buf_size:
+            # Big blocks skip the staging buffer
+            self._compress()
+            self._emit(self._compressor.compress(data))
+        else:
+            self._pending += data
+            if len(self._pending) >= self._buf_size:
+                self._compress()
         return self
 
     def write_buf(self, buf, n=None):
         if n is None:
             n = buf.remaining()
-        for _ in range(n):
-            b = buf.read()
-            if b is None:
-                break
-            self._buffer.append(b & 0xFF)
-        return self
+        return self._write_bytes(_read_block(buf, n))
 
-    def print_(self, obj):
-        s = str(obj) if obj is not None else ""
-        self._buffer.extend(s.encode('utf-8'))
-        return self
+    def _compress(self):
+        """Compress the staged bytes."""
+        if self._pending:
+            self._emit(self._compressor.compress(self._pending))
+            self._pending.clear()
 
-    def print_line(self, obj=""):
-        s = str(obj) if obj is not None else ""
-        self._buffer.extend((s + "\n").encode('utf-8'))
-        return self
+    def _emit(self, data):
+        """Write compressed bytes to the underlying stream."""
+        if data:
+            _write_block(self._underlying, data)
 
     def flush(self):
-        if self._buffer:
-            compressed = self._compressor.compress(bytes(self._buffer))
-            self._buffer.clear()
-            for b in compressed:
-                self._out.write(b)
+        self._compress()
+        if self._flush_mode is not None:
+            self._emit(self._compressor.flush(self._flush_mode))
+        self._underlying.flush()
         return self
 
     def close(self):
-        # Compress remaining data
-        if self._buffer:
-            compressed = self._compressor.compress(bytes(self._buffer))
-            for b in compressed:
-                self._out.write(b)
-            self._buffer.clear()
-
-        # Flush compressor
-        final = self._compressor.flush()
-        for b in final:
-            self._out.write(b)
-        return True
+        """Finish the compressed stream and close the underlying stream."""
+        if self._closed:
+            return True
+        self._closed = True
+        try:
+            self._compress()
+            self._emit(self._compressor.flush())
+            return self._underlying.close() is not False
+        except Exception:
+            return False
 
 
-# =============================================================================
-# DeflateInStream - Deflate decompression wrapper
-# =============================================================================
+class GzipOutStream(_CompressOutStream):
+    """OutStream that compresses output with gzip."""
 
-class DeflateInStream:
-    """InStream that decompresses deflate input."""
+    def __init__(self, out, level=-1, buf_size=_ZLIB_BUF_SIZE):
+        super().__init__(out, 16 + zlib.MAX_WBITS, level, buf_size)
 
-    def __init__(self, in_stream, nowrap=False):
-        self._in = in_stream
-        self._nowrap = nowrap
 
-        # Read all input data first
-        data = bytearray()
-        while True:
-            b = in_stream.read()
-            if b is None:
-                break
-            data.append(b)
+class DeflateOutStream(_CompressOutStream):
+    """OutStream that compresses output with deflate."""
 
-        # Decompress
+    # flush() only pushes staged bytes, keeping the compression ratio
+    _flush_mode = None
+
+    def __init__(self, out, nowrap=False, level=-1, buf_size=_ZLIB_BUF_SIZE):
+        self._nowrap = nowrap
+        # wbits: negative for raw deflate (no header), positive for zlib format
         wbits = -zlib.MAX_WBITS if nowrap else zlib.MAX_WBITS
-        self._buffer = io.BytesIO(zlib.decompress(bytes(data), wbits))
+        super().__init__(out, wbits, level, buf_size)
 
-    def read(self):
-        b = self._buffer.read(1)
-        if not b:
-            return None
-        return b[0]
 
-    def read_buf(self, buf, n):
-        data = self._buffer.read(n)
-        if not data:
-            return None
-        for b in data:
-            buf.write(b)
-        return len(data)
+class _InflateInStream(_BlockInStream):
+    """
+    InStream that decompresses through a zlib decompressobj, reading the
+    underlying stream buf_size bytes at a time.
+    """
 
-    def read_all_str(self, normalizeNewlines=True):
-        data = self._buffer.read()
-        text = data.decode('utf-8')
-        if normalizeNewlines:
-            text = text.replace('\r\n', '\n').replace('\r', '\n')
-        return text
+    # Whether data after the end of the compressed stream starts another
+    # member (gzip) rather than being left alone
+    _multi_member = False
+
+    def __init__(self, in_stream, wbits, buf_size=_ZLIB_BUF_SIZE):
+        super().__init__()
+        self._underlying = in_stream
+        self._wbits = wbits
+        self._buf_size = buf_size
+        self._inflater = zlib.decompressobj(wbits)
+        self._started = False
+
+    def _fetch(self, n):
+        inflater = self._inflater
+        while True:
+            if inflater.eof:
+                src = inflater.unused_data
+                if not (src and self._multi_member):
+                    return b''
+                inflater = self._inflater = zlib.decompressobj(self._wbits)
+            else:
+                src = inflater.unconsumed_tail
+                if not src:
+                    src = _read_block(self._underlying, self._buf_size)
+                    if not src:
+                        if not self._started:
+                            return b''
+                        from .Err import IOErr
+                        raise IOErr("Unexpected end of compressed stream")
+            self._started = True
+            try:
+                data = inflater.decompress(src, n)
+            except zlib.error as e:
+                from .Err import IOErr
+                raise IOErr(f"Invalid compressed stream: {e}")
+            if data:
+                return data
 
     def close(self):
-        return True
+        """Close the underlying stream."""
+        try:
+            return self._underlying.close() is not False
+        except Exception:
+            return False
+
+
+class GzipInStream(_InflateInStream):
+    """InStream that decompresses gzip input."""
+
+    _multi_member = True
+
+    def __init__(self, in_stream, buf_size=_ZLIB_BUF_SIZE):
+        super().__init__(in_stream, 16 + zlib.MAX_WBITS, buf_size)
+
+
+class DeflateInStream(_InflateInStream):
+    """InStream that decompresses deflate input."""
+
+    def __init__(self, in_stream, nowrap=False, buf_size=_ZLIB_BUF_SIZE):
+        self._nowrap = nowrap
+        wbits = -zlib.MAX_WBITS if nowrap else zlib.MAX_WBITS
+        super().__init__(in_stream, wbits, buf_size)
@@ -173,5 +173,13 @@ class FloatArray(Obj):
 
         return self
 
+    def memoryview(self):
+        """Zero-copy memoryview over the array storage in native byte order."""
+        return memoryview(self._arr)
+
+    def __buffer__(self, flags):
+        """Python buffer protocol (PEP 688) so native code can read the array directly."""
+        return memoryview(self._arr)
+
     def typeof(self):
         return Type.find("util::FloatArray")
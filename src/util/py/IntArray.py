@@ -218,5 +218,13 @@ class IntArray(Obj):
 
         return self
 
+    def memoryview(self):
+        """Zero-copy memoryview over the array storage in native byte order."""
+        return memoryview(self._arr)
+
+    def __buffer__(self, flags):
+        """Python buffer protocol (PEP 688) so native code can read the array directly."""
+        return memoryview(self._arr)
+
     def typeof(self):
         return Type.find("util::IntArray")
@@ -45,6 +45,12 @@ class ChunkOutStream(OutStream):
         self._check_chunk()
         return self
 
+    def _write_bytes(self, data):
+        """Write a block of bytes to buffer."""
+        self._buffer._write_bytes(data)
+        self._check_chunk()
+        return self
+
     def write_buf(self, buf, n=None):
         """Write bytes from buffer."""
         if n is None:
@@ -90,4 +96,4 @@ class ChunkOutStream(OutStream):
             self.flush()
 
     # Inherit print_, printLine, writeChars, writeChar from OutStream
-    # which will call our write() method via the encoder
+    # which encode once and call our _write_bytes() method
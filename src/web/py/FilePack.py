@@ -123,7 +123,7 @@ class FilePack(Weblet):
     self._uri_ref = __import__('fan.concurrent.AtomicRef', fromlist=['AtomicRef']).AtomicRef.make()
     buf = ObjUtil.coerce(ObjUtil.to_immutable(buf.trim()), "sys::Buf")
     self._buf = ObjUtil.coerce(ObjUtil.to_immutable(buf), "sys::Buf")
-    self._etag = buf.to_digest("SHA-1").to_base64_uri()
+    self._etag = __import__('fan.crypto.Crypto', fromlist=['Crypto']).Crypto.cur().digest_all("SHA-1", sys.List.from_literal([buf], "sys::Buf")).first().to_base64_uri()
     self._modified = sys.DateTime.now()
     self._mime_type = mime_type
 
@@ -37,6 +37,12 @@ class FixedOutStream(OutStream):
         self._underlying.write(b)
         return self
 
+    def _write_bytes(self, data):
+        """Write a block of bytes, tracking count."""
+        self._check_chunk(len(data))
+        self._underlying._write_bytes(data)
+        return self
+
     def write_buf(self, buf, n=None):
         """Write bytes from buffer, tracking count."""
         if n is None:
@@ -65,4 +71,4 @@ class FixedOutStream(OutStream):
             raise IOErr.make(f"Attempt to write more than Content-Length: {self._fixed}")
 
     # Inherit print_, printLine, writeChars, writeChar from OutStream
-    # which will call our write() method via the encoder
+    # which encode once and call our _write_bytes() method